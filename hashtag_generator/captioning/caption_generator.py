@@ -2,6 +2,10 @@ from PIL import Image
 
 def generate_caption(image_path, processor, model, prompt, device):
     image = Image.open(image_path).convert("RGB")
+    return generate_caption_from_image(image, processor, model, prompt, device)
+
+def generate_caption_from_image(image, processor, model, prompt, device):
+    # image: 이미 디코딩된 RGB PIL 이미지
     modified_prompt = prompt.strip() + "\nAnswer:"
     inputs = processor(images=image, text=modified_prompt, return_tensors="pt")
     inputs = {key: value.to(device) for key, value in inputs.items()}
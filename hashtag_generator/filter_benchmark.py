@@ -0,0 +1,38 @@
+import os
+import time
+import argparse
+from pathlib import Path
+
+from filtering.rule_base_filter import image_filter_analysis
+
+IMAGE_DIR = Path("./data/images_raw")
+VALID_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+def measure(paths, **kwargs):
+    start = time.perf_counter()
+    results = [image_filter_analysis(p, **kwargs) for p in paths]
+    elapsed = time.perf_counter() - start
+    return results, len(paths) / elapsed if elapsed > 0 else float("inf")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="규칙 기반 필터 처리량: 전체 디코딩 vs 축소 디코딩")
+    parser.add_argument("--image-dir", default=str(IMAGE_DIR))
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--max-sides", type=int, nargs="+", default=[256, 512, 1024])
+    args = parser.parse_args()
+
+    paths = [str(Path(args.image_dir) / f) for f in sorted(os.listdir(args.image_dir))
+             if Path(f).suffix.lower() in VALID_EXTENSIONS][:args.limit]
+    print(f"[Images] {len(paths)}장")
+
+    baseline, full_rate = measure(paths, fast=False)
+    print(f"[Full] 전체 디코딩: {full_rate:.1f} images/sec")
+    for max_side in args.max_sides:
+        results, rate = measure(paths, fast=True, max_side=max_side)
+        changed = sum(a["status"] != b["status"] for a, b in zip(baseline, results))
+        brightness_diff = max((abs(a["brightness"] - b["brightness"]) for a, b in zip(baseline, results)
+                               if "brightness" in a and "brightness" in b), default=0.0)
+        entropy_diff = max((abs(a["entropy_score"] - b["entropy_score"]) for a, b in zip(baseline, results)
+                            if "entropy_score" in a and "entropy_score" in b), default=0.0)
+        print(f"[Fast] max_side={max_side}: {rate:.1f} images/sec ({rate / full_rate:.2f}배), "
+              f"판정이 다른 이미지 {changed}장, 최대 밝기 차 {brightness_diff:.2f}, 최대 엔트로피 차 {entropy_diff:.3f}")
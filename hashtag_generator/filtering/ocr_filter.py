@@ -10,11 +10,15 @@ def is_text_dominant(image_path: str, area_threshold: float = 0.2):
         print(f"[ERROR] 이미지 로딩 실패: {image_path}, 에러: {e}")
         return False, 0.0, None
 
-    boxes = get_text_boxes(image)
+    flag, ratio, vis_img, boxes = is_text_dominant_array(image, area_threshold)
     print(f"Detected {len(boxes)} box(es) in {image_path}")
     if not boxes:
         print(f"[!] 텍스트 박스 감지 실패: {image_path}")
+    return flag, ratio, vis_img
 
-    vis_img = draw_text_boxes(image.copy(), boxes)
+def is_text_dominant_array(image: np.ndarray, area_threshold: float = 0.2, draw: bool = True):
+    # 이미 디코딩된 RGB 이미지, draw=False 면 시각화 이미지를 만들지 않음 (None)
+    boxes = get_text_boxes(image)
+    vis_img = draw_text_boxes(image, boxes) if draw else None
     ratio = compute_text_area_ratio(image, boxes)
-    return ratio > area_threshold, ratio, vis_img
+    return ratio > area_threshold, ratio, vis_img, boxes
@@ -1,18 +1,44 @@
-from utils.image_utils import read_image_unicode_safe, is_too_dark_or_bright, is_low_resolution, is_low_entropy
+import numpy as np
+from utils.image_utils import (read_image_unicode_safe, read_image_reduced, mean_brightness, brightness_condition,
+                               brightness_and_entropy, is_low_resolution, is_low_resolution_size, is_low_entropy)
 
-def image_filter_analysis(image_path: str) -> dict:
+ENTROPY_THRESH = 3.5
+
+def image_filter_analysis(image_path: str, fast: bool = True, max_side: int = 512) -> dict:
+    # fast: 해상도는 헤더에서, 밝기/엔트로피는 긴 변 max_side 근처로 줄여 디코딩한 이미지에서 계산
     try:
-        image = read_image_unicode_safe(image_path)
+        if fast:
+            rgb, (width, height) = read_image_reduced(image_path, max_side)
+        else:
+            image = read_image_unicode_safe(image_path)
     except Exception as e:
         return {"status": "error", "reason": f"file_read_failed: {str(e)}"}
+    if not fast:
+        return analyze_image(image)
+
+    brightness, entropy_score = brightness_and_entropy(rgb)
+    return build_result(brightness, is_low_resolution_size(width, height), entropy_score)
+
+def analyze_rgb(rgb: np.ndarray, max_side: int = 512) -> dict:
+    # 이미 디코딩된 전체 해상도 RGB 배열: 해상도는 배열 크기, 밝기/엔트로피는 긴 변 max_side 근처로 솎아 낸 픽셀로 계산
+    height, width = rgb.shape[:2]
+    step = max(1, max(height, width) // max_side)
+    brightness, entropy_score = brightness_and_entropy(rgb[::step, ::step])
+    return build_result(brightness, is_low_resolution_size(width, height), entropy_score)
+
+def analyze_image(image: np.ndarray) -> dict:
+    # 이미 디코딩된 BGR 이미지에 대한 밝기/해상도/엔트로피 검사
+    _, entropy_score = is_low_entropy(image, ENTROPY_THRESH)
+    return build_result(mean_brightness(image), is_low_resolution(image), entropy_score)
 
-    light_cond = is_too_dark_or_bright(image)
-    low_res_flag = is_low_resolution(image)
-    entropy_flag, entropy_score = is_low_entropy(image)
+def build_result(brightness: float, low_res_flag: bool, entropy_score: float) -> dict:
+    light_cond = brightness_condition(brightness)
+    entropy_flag = entropy_score < ENTROPY_THRESH
 
     result = {
         "status": "pass",
         "light": str(light_cond),
+        "brightness": brightness,
         "low_resolution": bool(low_res_flag),
         "low_entropy": bool(entropy_flag),
         "entropy_score": float(entropy_score),
@@ -1,5 +1,9 @@
-from utils.yolo_utils import detect_objects_yolo, deny_food_only_classes, pass_scene_classes
+from utils.yolo_utils import (detect_objects_yolo, detect_class_ids_yolo_batch, letterbox, deny_food_only_classes,
+                              pass_scene_classes, class_masks)
 import cv2
+import queue
+import threading
+import numpy as np
 from typing import List
 
 def is_food_only(labels: List[str]) -> bool:
@@ -11,5 +15,86 @@ def is_food_only_image(image_path: str) -> bool:
     image = cv2.imread(image_path)
     if image is None:
         return False
+    return is_food_only_array(image)
+
+def is_food_only_array(image: np.ndarray) -> bool:
+    # 이미 디코딩된 BGR 이미지
     labels = detect_objects_yolo(image)
     return is_food_only(labels)
+
+
+def is_food_only_class_ids(class_ids: List[np.ndarray]) -> np.ndarray:
+    # 이미지별 클래스 id 배열 → 음식 전용 여부 (is_food_only 와 같은 규칙을 한 번에 계산)
+    owner = np.repeat(np.arange(len(class_ids)), [len(ids) for ids in class_ids])
+    ids = np.concatenate(class_ids) if class_ids else np.empty(0, dtype=int)
+    deny_class_mask, pass_class_mask = class_masks()
+    has_food = np.zeros(len(class_ids), dtype=bool)
+    has_pass = np.zeros(len(class_ids), dtype=bool)
+    has_food[owner[deny_class_mask[ids]]] = True
+    has_pass[owner[pass_class_mask[ids]]] = True
+    return has_food & ~has_pass
+
+def _put(out: queue.Queue, item, stop: threading.Event) -> bool:
+    # 소비자가 멈추면(stop) 큐가 가득 차 있어도 기다리지 않고 False
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _load_batches(paths: List[str], batch_size: int, imgsz: int, out: queue.Queue, stop: threading.Event):
+    # 백그라운드 스레드: 읽기 + letterbox 후 (위치 목록, 이미지 목록) 묶음을 넘김, 끝나면 None, 실패하면 예외 객체
+    try:
+        positions, images = [], []
+        for i, path in enumerate(paths):
+            if stop.is_set():
+                return
+            image = cv2.imread(path)
+            if image is None:
+                continue
+            positions.append(i)
+            images.append(letterbox(image, imgsz))
+            if len(images) == batch_size:
+                if not _put(out, (positions, images), stop):
+                    return
+                positions, images = [], []
+        if images and not _put(out, (positions, images), stop):
+            return
+        _put(out, None, stop)
+    except Exception as e:
+        _put(out, e, stop)
+
+def is_food_only_images(paths: List[str], batch_size: int = 16, imgsz: int = 640, prefetch: int = 2) -> List[bool]:
+    """
+    is_food_only_image 의 배치 버전입니다 (결과 순서는 paths 와 같음).
+    - 이미지 읽기와 letterbox 는 백그라운드 스레드에서 prefetch 묶음까지 미리 준비합니다.
+    - 읽을 수 없는 이미지는 is_food_only_image 와 같이 False 입니다.
+    - 읽기 스레드의 예외는 호출한 쪽에서 다시 발생하고, 추론이 실패하면 읽기 스레드를 멈춘 뒤 예외를 넘깁니다.
+    """
+    flags = [False] * len(paths)
+    batches = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    loader = threading.Thread(target=_load_batches, args=(paths, batch_size, imgsz, batches, stop), daemon=True)
+    loader.start()
+    try:
+        while True:
+            batch = batches.get()
+            if batch is None:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+            positions, images = batch
+            for i, food_only in zip(positions, is_food_only_class_ids(detect_class_ids_yolo_batch(images, imgsz))):
+                flags[i] = bool(food_only)
+    finally:
+        # 남은 묶음을 버려 메모리를 풀고, put 에서 기다리던 읽기 스레드가 끝나도록 함
+        stop.set()
+        while True:
+            try:
+                batches.get_nowait()
+            except queue.Empty:
+                break
+        loader.join()
+    return flags
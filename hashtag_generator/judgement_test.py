@@ -1,8 +1,8 @@
 import os
 import json
-import torch
 from utils.config_loader import load_config
-from utils.judgement_utils import load_filtering_model, filter_caption
+from utils.judgement_utils import filter_caption
+from utils.model_registry import get_model, get_device
 from datetime import datetime
 import shutil
 from pathlib import Path
@@ -77,11 +77,10 @@ if __name__ == "__main__":
     config = load_config()
     input_folder = config["judgement"]["input_folder"]
     output_folder = config["judgement"]["output_folder"]
-    model_id = config["judgement"]["model"]
     log_path = config["judgement"].get("log_path")
 
     config = config['judgement']
 
-    device = "cuda" if torch.cuda.is_available() else "cpu"
-    tokenizer, model = load_filtering_model(model_id)
+    device = get_device()
+    tokenizer, model = get_model("judgement")
     process_json_files(input_folder, output_folder, tokenizer, model, device, log_path, config)
\ No newline at end of file
@@ -1,11 +1,213 @@
-import subprocess
+import os
+import cv2
+from pathlib import Path
+from PIL import Image
 
-subprocess.run(['python', './filter_test.py'])
+from utils.config_loader import load_config
+from utils.image_utils import read_image_rgb
+from utils.manifest_db import ManifestDB, stage_version
+from utils.yolo_utils import detect_objects_yolo_batch, deny_food_only_classes, pass_scene_classes
+from utils.judgement_utils import filter_caption
+from utils.model_registry import get_model, get_device
+from filtering.rule_base_filter import analyze_rgb
+from filtering.yolo_filter import is_food_only
+from filtering.ocr_filter import is_text_dominant_array
+from captioning.caption_generator import generate_caption_from_image
 
-subprocess.run(['python', './yolo_test.py'])
+VALID_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+YOLO_IMGSZ = 640
 
-subprocess.run(['python', './ocr_test.py'])
+# 단계 코드가 바뀌어 이전 결과를 다시 만들어야 하면 올림
+STAGE_REVISIONS = {"rule": 3, "yolo": 2, "ocr": 1, "caption": 1, "judgement": 1}
 
-subprocess.run(['python', './caption_test.py'])
+def iter_images(image_dir, db):
+    # 내용 해시만 붙여 넘기고, 디코딩은 규칙 필터 단계에서 한 번만 함
+    for fname in sorted(os.listdir(image_dir)):
+        fpath = Path(image_dir) / fname
+        if not fpath.is_file() or fpath.suffix.lower() not in VALID_EXTENSIONS:
+            continue
 
-subprocess.run(['python', './judgement_test.py'])
\ No newline at end of file
+        record = {"filename": fname, "filepath": str(fpath), "status": "pass", "stage": None, "results": {}, "executed": []}
+        try:
+            record["hash"] = db.content_hash(str(fpath))
+        except OSError as e:
+            record.update(status="error", stage="decode", reason=f"file_read_failed: {str(e)}")
+        yield record
+
+def decode(record):
+    # 전체 해상도로 한 번만 디코딩하고 이후 단계는 같은 배열을 사용
+    if "rgb" not in record:
+        record["rgb"] = read_image_rgb(record["filepath"])
+        record["bgr"] = cv2.cvtColor(record["rgb"], cv2.COLOR_RGB2BGR)
+
+def per_image(fn):
+    """
+    record 한 장을 받는 단계 함수를 record 묶음을 받는 단계 함수로 감쌉니다.
+    - 단계 함수: record -> (통과 여부, 결과 dict, 부적합 사유)
+    - 묶음 단계 함수: [record] -> [(통과 여부, 결과 dict, 부적합 사유) 또는 예외]
+    """
+    def stage(records):
+        outcomes = []
+        for record in records:
+            try:
+                outcomes.append(fn(record))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    return stage
+
+def rule_stage(record):
+    # 디코딩한 배열의 크기로 해상도, 긴 변 512 근처로 솎아 낸 픽셀로 밝기/엔트로피를 검사
+    decode(record)
+    result = analyze_rgb(record["rgb"])
+    return result["status"] == "pass", result, result.get("reason")
+
+def make_yolo_stage(imgsz):
+    # 묶음의 이미지를 한 번의 배치 추론으로 판정
+    def yolo_stage(records):
+        # 디코딩에 실패한 이미지는 그 이미지만 에러, 나머지는 한 번에 추론
+        outcomes, ready = [None] * len(records), []
+        for i, record in enumerate(records):
+            try:
+                decode(record)
+                ready.append(i)
+            except Exception as e:
+                outcomes[i] = e
+        if ready:
+            for i, labels in zip(ready, detect_objects_yolo_batch([records[i]["bgr"] for i in ready], imgsz)):
+                food_only = is_food_only(labels)
+                outcomes[i] = (not food_only, {"food_only": food_only, "labels": labels}, "food_only")
+        return outcomes
+    return yolo_stage
+
+def make_ocr_stage(area_threshold):
+    def ocr_stage(record):
+        decode(record)
+        flag, ratio, _, boxes = is_text_dominant_array(record["rgb"], area_threshold, draw=False)
+        return not flag, {"text_dominant": bool(flag), "text_ratio": float(ratio), "boxes": len(boxes)}, "text_dominant"
+    return ocr_stage
+
+# 캡션/판단 모델은 그 단계까지 통과한 이미지가 처음 나올 때 읽음
+def make_caption_stage(prompt, device):
+    def caption_stage(record):
+        decode(record)
+        processor, model = get_model("caption")
+        caption = generate_caption_from_image(Image.fromarray(record["rgb"]), processor, model, prompt, device)
+        return bool(caption.strip()), {"caption": caption}, "no_caption"
+    return caption_stage
+
+def make_judgement_stage(device, config):
+    response_field = config.get("response_field_name", "filter_response")
+
+    def judgement_stage(record):
+        tokenizer, model = get_model("judgement")
+        caption = record["results"]["caption"]["caption"]
+        judgement, response = filter_caption(caption, tokenizer, model, device, config)
+        return judgement == "Suitable", {"judgement": judgement, response_field: response}, "unsuitable"
+    return judgement_stage
+
+def stage_configs(config):
+    # 단계별 결과에 영향을 주는 설정/모델 (바뀌면 그 단계부터 다시 실행)
+    judgement = {k: v for k, v in config["judgement"].items() if k not in ("input_folder", "output_folder", "log_path")}
+    return {
+        "rule": {},
+        "yolo": {"model": config["model"]["yolo_path"], "deny": sorted(deny_food_only_classes),
+                 "pass": sorted(pass_scene_classes), "imgsz": YOLO_IMGSZ},
+        "ocr": {"area_threshold": config["pipeline"].get("ocr_area_threshold", 0.1)},
+        "caption": {"model": config["captioning"]["blip_model"], "prompt": config["captioning"]["prompt"]},
+        "judgement": judgement,
+    }
+
+def build_stages(config, device):
+    # [(단계 이름, 버전, 묶음 단계 함수)], 버전은 앞 단계 버전 + 단계 설정 + STAGE_REVISIONS 의 해시
+    stages = [
+        ("rule", per_image(rule_stage)),
+        ("yolo", make_yolo_stage(YOLO_IMGSZ)),
+        ("ocr", per_image(make_ocr_stage(config["pipeline"].get("ocr_area_threshold", 0.1)))),
+        ("caption", per_image(make_caption_stage(config["captioning"]["prompt"], device))),
+        ("judgement", per_image(make_judgement_stage(device, config["judgement"]))),
+    ]
+    configs, version, versioned = stage_configs(config), "", []
+    for name, stage in stages:
+        version = stage_version(version, {"revision": STAGE_REVISIONS[name], **configs[name]})
+        versioned.append((name, version, stage))
+    return versioned
+
+def apply_stage(record, name, status, reason, result):
+    record["stage"] = name
+    record["results"][name] = result
+    if status != "pass":
+        record.update(status=status, reason=reason)
+
+def run_stages(records, stages, db):
+    """
+    record 묶음을 단계 순서대로 처리합니다 (이미지마다 첫 부적합(또는 에러) 단계에서 멈춤).
+    - 같은 버전의 결과가 manifest 에 있으면 재사용하고, 나머지 record 만 모아 단계 함수를 한 번 호출합니다.
+    - 단계 함수 전체가 실패하면 그 묶음의 대기 중인 record 를 모두 에러로 표시합니다.
+    """
+    for name, version, stage in stages:
+        pending = []
+        for record in records:
+            if record["status"] != "pass":
+                continue
+            cached = db.get_stage(record["hash"], name, version)
+            if cached is None:
+                pending.append(record)
+            else:
+                apply_stage(record, name, *cached)
+        if not pending:
+            continue
+        try:
+            outcomes = stage(pending)
+        except Exception as e:
+            outcomes = [e] * len(pending)
+        for record, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                record.update(status="error", stage=name, reason=str(outcome))
+                continue
+            passed, result, reason = outcome
+            status, reason = ("pass", None) if passed else ("fail", reason)
+            db.put_stage(record["hash"], name, version, status, reason, result)
+            record["executed"].append(name)
+            apply_stage(record, name, status, reason, result)
+    # 디코딩된 배열은 다음 묶음으로 넘어가기 전에 해제
+    for record in records:
+        record.pop("rgb", None)
+        record.pop("bgr", None)
+    return records
+
+def run_pipeline(records, stages, db, batch_size=16):
+    # batch_size 장씩 묶어 단계를 실행하고, 처리한 순서대로 record 를 내보냄
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield from run_stages(batch, stages, db)
+            batch = []
+    if batch:
+        yield from run_stages(batch, stages, db)
+
+if __name__ == "__main__":
+    config = load_config()
+    image_folder = config["pipeline"]["image_folder"]
+    manifest_path = config["pipeline"]["manifest_path"]
+
+    stages = build_stages(config, get_device())
+
+    # 단계별 결과는 폴더 복사 대신 manifest(SQLite)에 기록, 다시 실행하면 바뀐 이미지/단계만 처리
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    db = ManifestDB(manifest_path)
+    processed = 0
+    try:
+        for record in run_pipeline(iter_images(image_folder, db), stages, db, config["pipeline"].get("batch_size", 16)):
+            fname = record["filename"]
+            if not record["executed"] and record["status"] != "error":
+                continue
+            processed += 1
+            if record["status"] == "pass":
+                print(f"[✓] 적합 → {fname}")
+            else:
+                print(f"[✗] 부적합({record['stage']}: {record.get('reason')}) → {fname}")
+    finally:
+        db.close()
+    print(f"[Manifest] {manifest_path} (새로 처리한 이미지 {processed}장)")
@@ -0,0 +1,29 @@
+import os
+import sys
+import types
+import pytest
+
+# 스크립트와 같이 hashtag_generator 디렉터리 기준으로 import (from utils.x import ...)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+@pytest.fixture
+def light_imports(monkeypatch):
+    """
+    cv2 / PIL 이 없는 환경에서도 파이프라인 모듈을 import 할 수 있도록 최소한의 대체 모듈을 넣습니다.
+    - 설치되어 있으면 실제 모듈을 사용합니다. 모델과 이미지 디코딩은 각 테스트에서 대체합니다.
+    """
+    try:
+        import cv2  # noqa: F401
+    except ImportError:
+        cv2 = types.ModuleType("cv2")
+        cv2.COLOR_RGB2BGR = 4
+        cv2.cvtColor = lambda image, code: image
+        monkeypatch.setitem(sys.modules, "cv2", cv2)
+    try:
+        import PIL.Image  # noqa: F401
+    except ImportError:
+        pil = types.ModuleType("PIL")
+        pil.Image = types.ModuleType("PIL.Image")
+        pil.Image.fromarray = lambda array: array
+        monkeypatch.setitem(sys.modules, "PIL", pil)
+        monkeypatch.setitem(sys.modules, "PIL.Image", pil.Image)
@@ -0,0 +1,46 @@
+import os
+import sqlite3
+
+from utils.manifest_db import ManifestDB, file_hash
+
+def count(path, table):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+def test_writes_are_committed_once_per_run(tmp_path):
+    path = str(tmp_path / "manifest.db")
+    images = []
+    for i in range(20):
+        image = tmp_path / f"{i}.jpg"
+        image.write_bytes(bytes([i]) * 10)
+        images.append(str(image))
+
+    db = ManifestDB(path)
+    commits = []
+    db.conn.set_trace_callback(lambda sql: commits.append(sql) if sql.strip().upper() == "COMMIT" else None)
+    hashes = [db.content_hash(image) for image in images]
+    db.put_stage(hashes[0], "rule", "v1", "pass", None, {"brightness": 120.0})
+    # 실행 중에는 다른 연결에서 보이지 않고, close 에서 한 번에 커밋
+    assert count(path, "files") == 0
+    db.close()
+    assert commits == ["COMMIT"]
+    assert count(path, "files") == 20 and count(path, "stage_results") == 1
+
+    reopened = ManifestDB(path)
+    assert reopened.content_hash(images[3]) == hashes[3] == file_hash(images[3])
+    assert reopened.get_stage(hashes[0], "rule", "v1") == ("pass", None, {"brightness": 120.0})
+    assert reopened.get_stage(hashes[0], "rule", "v2") is None
+    reopened.close()
+
+def test_changed_file_is_rehashed(tmp_path):
+    image = tmp_path / "a.jpg"
+    image.write_bytes(b"old")
+    db = ManifestDB(str(tmp_path / "manifest.db"))
+    old = db.content_hash(str(image))
+    image.write_bytes(b"new content")
+    os.utime(image, ns=(1, 1))
+    assert db.content_hash(str(image)) == file_hash(str(image)) != old
+    db.close()
@@ -0,0 +1,74 @@
+import importlib
+import numpy as np
+import pytest
+
+from utils.config_loader import load_config
+from utils.manifest_db import ManifestDB
+
+@pytest.fixture
+def pipeline(light_imports, monkeypatch, tmp_path):
+    # 모델/디코딩을 대체한 파이프라인: 파일 이름으로 이미지와 YOLO 라벨을 정함
+    pipeline = importlib.import_module("pipeline")
+    rng = np.random.default_rng(0)
+    images = {"a_dark.jpg": np.zeros((400, 400, 3), dtype=np.uint8),
+              "b_food.jpg": rng.integers(0, 200, (400, 400, 3), dtype=np.uint8),
+              "c_beach.jpg": rng.integers(0, 200, (400, 400, 3), dtype=np.uint8)}
+    # 음식 사진 표시: BGR 로 바뀌어도 알아볼 수 있는 픽셀
+    images["b_food.jpg"][0, 0] = (1, 2, 1)
+    for name in images:
+        (tmp_path / name).write_bytes(name.encode("utf-8"))
+
+    calls = {"decode": [], "yolo": []}
+
+    def read_image_rgb(path):
+        calls["decode"].append(path)
+        return images[path.rsplit("/", 1)[-1]]
+
+    def detect_objects_yolo_batch(batch, imgsz):
+        calls["yolo"].append(len(batch))
+        return [["pizza"] if tuple(image[0, 0]) == (1, 2, 1) else ["person"] for image in batch]
+
+    monkeypatch.setattr(pipeline, "read_image_rgb", read_image_rgb)
+    monkeypatch.setattr(pipeline, "detect_objects_yolo_batch", detect_objects_yolo_batch)
+    monkeypatch.setattr(pipeline, "is_text_dominant_array", lambda rgb, threshold, draw: (False, 0.01, None, []))
+    monkeypatch.setattr(pipeline, "get_model", lambda name: (None, None))
+    monkeypatch.setattr(pipeline, "generate_caption_from_image", lambda image, processor, model, prompt, device: "a beach")
+    monkeypatch.setattr(pipeline, "filter_caption", lambda caption, tokenizer, model, device, config: ("Suitable", "Suitable"))
+    pipeline.calls = calls
+    return pipeline
+
+def run(pipeline, tmp_path, batch_size=3, stages=None):
+    db = ManifestDB(str(tmp_path / "manifest.db"))
+    try:
+        stages = stages or pipeline.build_stages(load_config(), "cpu")
+        return {r["filename"]: r for r in pipeline.run_pipeline(pipeline.iter_images(str(tmp_path), db), stages, db, batch_size)}
+    finally:
+        db.close()
+
+def test_pipeline_smoke(pipeline, tmp_path):
+    records = run(pipeline, tmp_path)
+    assert {name: (r["status"], r["stage"]) for name, r in records.items()} == {
+        "a_dark.jpg": ("fail", "rule"), "b_food.jpg": ("fail", "yolo"), "c_beach.jpg": ("pass", "judgement")}
+    assert records["a_dark.jpg"]["reason"] == "too_dark"
+    assert records["c_beach.jpg"]["results"]["caption"] == {"caption": "a beach"}
+    # 이미지마다 한 번만 디코딩, 규칙 필터를 통과한 두 장은 한 번의 YOLO 배치로 판정
+    assert len(pipeline.calls["decode"]) == 3
+    assert pipeline.calls["yolo"] == [2]
+    assert all("rgb" not in r and "bgr" not in r for r in records.values())
+
+    # 다시 실행하면 manifest 의 결과를 재사용 (디코딩/추론 없음)
+    rerun = run(pipeline, tmp_path)
+    assert all(not r["executed"] for r in rerun.values())
+    assert {name: r["status"] for name, r in rerun.items()} == {name: r["status"] for name, r in records.items()}
+    assert len(pipeline.calls["decode"]) == 3 and pipeline.calls["yolo"] == [2]
+
+def test_batch_stage_failure_marks_pending_records(pipeline, tmp_path):
+    def broken(records):
+        raise RuntimeError("gpu")
+
+    stages = [(name, version, broken if name == "yolo" else stage)
+              for name, version, stage in pipeline.build_stages(load_config(), "cpu")]
+    records = run(pipeline, tmp_path, batch_size=2, stages=stages)
+    assert records["a_dark.jpg"]["status"] == "fail"
+    assert [(records[n]["status"], records[n]["stage"], records[n]["reason"]) for n in ("b_food.jpg", "c_beach.jpg")] == \
+        [("error", "yolo", "gpu")] * 2
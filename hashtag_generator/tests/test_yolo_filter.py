@@ -0,0 +1,47 @@
+import queue
+import threading
+import importlib
+import numpy as np
+import pytest
+
+@pytest.fixture
+def yolo_filter(light_imports, monkeypatch):
+    # 읽기/추론을 대체: "bad" 경로는 읽기 예외, 클래스 0 은 음식, 1 은 장면
+    yolo_filter = importlib.import_module("filtering.yolo_filter")
+
+    def imread(path):
+        if path == "bad":
+            raise OSError("unreadable")
+        return None if path == "missing" else np.zeros((4, 4, 3), dtype=np.uint8)
+
+    monkeypatch.setattr(yolo_filter.cv2, "imread", imread, raising=False)
+    monkeypatch.setattr(yolo_filter, "letterbox", lambda image, imgsz: image)
+    monkeypatch.setattr(yolo_filter, "class_masks", lambda: (np.array([True, False]), np.array([False, True])))
+    monkeypatch.setattr(yolo_filter, "detect_class_ids_yolo_batch", lambda images, imgsz: [np.array([0])] * len(images))
+    return yolo_filter
+
+def test_batches_keep_path_order(yolo_filter):
+    assert yolo_filter.is_food_only_images(["a", "missing", "b", "c"], batch_size=2) == [True, False, True, True]
+
+def test_loader_error_is_raised_in_caller(yolo_filter):
+    with pytest.raises(OSError, match="unreadable"):
+        yolo_filter.is_food_only_images(["a", "a", "bad", "a"], batch_size=2)
+
+def test_inference_error_stops_loader(yolo_filter, monkeypatch):
+    def fail(images, imgsz):
+        raise RuntimeError("inference failed")
+
+    monkeypatch.setattr(yolo_filter, "detect_class_ids_yolo_batch", fail)
+    before = threading.active_count()
+    with pytest.raises(RuntimeError, match="inference failed"):
+        yolo_filter.is_food_only_images(["a"] * 100, batch_size=1, prefetch=1)
+    # 읽기 스레드가 가득 찬 큐에서 기다리지 않고 끝남
+    assert threading.active_count() == before
+
+def test_loader_stops_when_event_is_set(yolo_filter):
+    out, stop = queue.Queue(maxsize=1), threading.Event()
+    loader = threading.Thread(target=yolo_filter._load_batches, args=(["a"] * 10, 1, 640, out, stop))
+    loader.start()
+    stop.set()
+    loader.join(timeout=5)
+    assert not loader.is_alive()
@@ -1,13 +1,19 @@
-import torch
-from transformers import InstructBlipProcessor, InstructBlipForConditionalGeneration
 from captioning.caption_generator import generate_caption
 from utils.config_loader import load_config
+from utils.model_registry import get_model, get_device
 import os
 import json
 
-def load_blip_model(model_name):
+def load_blip_model(model_name, device="cuda"):
+    import torch
+    from transformers import InstructBlipProcessor, InstructBlipForConditionalGeneration
+
     print(f"[Loading Model] {model_name}")
     processor = InstructBlipProcessor.from_pretrained(model_name)
+    if device == "cpu":
+        # CPU 는 float16 연산을 지원하지 않는 경우가 많아 float32 로 읽음
+        model = InstructBlipForConditionalGeneration.from_pretrained(model_name, torch_dtype=torch.float32)
+        return processor, model.to(device)
     model = InstructBlipForConditionalGeneration.from_pretrained(
         model_name,
         torch_dtype=torch.float16,
@@ -35,8 +41,8 @@ def caption_images():
     output_folder = config["captioning"]["output_folder"]
     prompt = config["captioning"]["prompt"]
 
-    device = "cuda" if torch.cuda.is_available() else "cpu"
-    processor, model = load_blip_model(model_name)
+    device = get_device()
+    processor, model = get_model("caption")
 
     print(f"[Loading Model] {model_name}")
     print(f"[Image Folder] {image_folder}")
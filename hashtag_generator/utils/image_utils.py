@@ -3,13 +3,35 @@ import numpy as np
 from PIL import Image
 from typing import Tuple
 
+def read_image_rgb(path: str) -> np.ndarray:
+    with Image.open(path) as img:
+        return np.array(img.convert("RGB"))
+
 def read_image_unicode_safe(path: str) -> np.ndarray:
+    return cv2.cvtColor(read_image_rgb(path), cv2.COLOR_RGB2BGR)
+
+def read_image_reduced(path: str, max_side: int = 512) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    원본 크기 (w, h) 는 헤더에서 읽고, 긴 변이 max_side 근처가 되도록 줄여 RGB 로 디코딩합니다.
+    - JPEG 는 draft 로 DCT 단계에서 1/2, 1/4, 1/8 로 줄여 디코딩하고, 그 외 형식은 디코딩 후 reduce 합니다.
+    """
     with Image.open(path) as img:
-        return cv2.cvtColor(np.array(img.convert("RGB")), cv2.COLOR_RGB2BGR)
+        size = img.size
+        img.draft("RGB", (max_side, max_side))
+        img = img.convert("RGB")
+        factor = max(img.size) // max_side
+        if factor > 1:
+            img = img.reduce(factor)
+        return np.asarray(img), size
 
-def is_too_dark_or_bright(image: np.ndarray, dark_thresh: int = 40, bright_thresh: int = 220) -> str:
+def mean_brightness(image: np.ndarray) -> float:
     hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-    brightness = hsv[:, :, 2].mean()
+    return float(hsv[:, :, 2].mean())
+
+def is_too_dark_or_bright(image: np.ndarray, dark_thresh: int = 40, bright_thresh: int = 220) -> str:
+    return brightness_condition(mean_brightness(image), dark_thresh, bright_thresh)
+
+def brightness_condition(brightness: float, dark_thresh: int = 40, bright_thresh: int = 220) -> str:
     if brightness < dark_thresh:
         return "too_dark"
     elif brightness > bright_thresh:
@@ -18,11 +40,27 @@ def is_too_dark_or_bright(image: np.ndarray, dark_thresh: int = 40, bright_thres
 
 def is_low_resolution(image: np.ndarray, min_width: int = 300, min_height: int = 300) -> bool:
     h, w = image.shape[:2]
-    return w < min_width or h < min_height
+    return is_low_resolution_size(w, h, min_width, min_height)
+
+def is_low_resolution_size(width: int, height: int, min_width: int = 300, min_height: int = 300) -> bool:
+    return width < min_width or height < min_height
+
+def histogram_entropy(hist: np.ndarray) -> float:
+    p = hist[hist > 0] / hist.sum()
+    return float(-(p * np.log2(p)).sum())
 
 def is_low_entropy(image: np.ndarray, entropy_thresh: float = 3.5) -> Tuple[bool, float]:
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     hist = cv2.calcHist([gray], [0], None, [256], [0, 256])
-    hist_norm = hist.ravel() / hist.sum()
-    entropy = -np.sum([p * np.log2(p) for p in hist_norm if p > 0])
+    entropy = histogram_entropy(hist.ravel())
     return entropy < entropy_thresh, entropy
+
+def brightness_and_entropy(rgb: np.ndarray) -> Tuple[float, float]:
+    """
+    RGB 배열 한 장에서 HSV 의 V 평균(= max(R, G, B))과 회색조 히스토그램 엔트로피를 함께 계산합니다.
+    - 회색조는 cv2.COLOR_BGR2GRAY 와 같은 고정소수점 계수 (0.299, 0.587, 0.114) 를 사용합니다.
+    """
+    brightness = float(rgb.max(axis=2).mean())
+    rgb32 = rgb.astype(np.uint32)
+    gray = (rgb32[:, :, 0] * 4899 + rgb32[:, :, 1] * 9617 + rgb32[:, :, 2] * 1868 + 8192) >> 14
+    return brightness, histogram_entropy(np.bincount(gray.ravel(), minlength=256))
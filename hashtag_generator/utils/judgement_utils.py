@@ -1,7 +1,12 @@
-from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+def load_filtering_model(model_id: str, device: str = "cuda"):
+    from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
 
-def load_filtering_model(model_id: str):
     print(f"[모델 로딩] {model_id}")
+    if device == "cpu":
+        # bitsandbytes 8bit 양자화는 CUDA 전용이라 CPU 에서는 양자화 없이 읽음
+        tokenizer = AutoTokenizer.from_pretrained(model_id)
+        model = AutoModelForCausalLM.from_pretrained(model_id, torch_dtype="auto")
+        return tokenizer, model.to(device)
     quant_config = BitsAndBytesConfig(
         load_in_8bit=True,
         llm_int8_enable_fp32_cpu_offload=True
@@ -0,0 +1,89 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stage_results (
+    hash TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    version TEXT NOT NULL,
+    status TEXT NOT NULL,
+    reason TEXT,
+    result TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (hash, stage)
+);
+"""
+
+def file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ManifestDB:
+    """
+    이미지 내용 해시별 단계 결과를 저장하는 SQLite manifest 입니다.
+    - files: 경로 → (크기, 수정 시각, 해시). 크기와 수정 시각이 같으면 파일을 다시 읽지 않습니다.
+    - stage_results: (해시, 단계) → 상태(pass/fail), 사유, 점수(JSON), 결과를 만든 설정/모델 버전
+    - 쓰기는 파일마다 커밋하지 않고 한 트랜잭션에 모아 commit() 또는 close() 에서 한 번에 커밋합니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def content_hash(self, path: str) -> str:
+        # 경로의 크기/수정 시각이 기록과 같으면 저장된 해시, 아니면 파일을 읽어 새로 계산
+        stat = os.stat(path)
+        row = self.conn.execute("SELECT size, mtime_ns, hash FROM files WHERE path = ?", (path,)).fetchone()
+        if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+        digest = file_hash(path)
+        self.conn.execute("INSERT OR REPLACE INTO files (path, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                          (path, stat.st_size, stat.st_mtime_ns, digest))
+        return digest
+
+    def get_stage(self, content_hash: str, stage: str, version: str):
+        # 같은 버전으로 기록된 (status, reason, result) 또는 None
+        row = self.conn.execute(
+            "SELECT status, reason, result FROM stage_results WHERE hash = ? AND stage = ? AND version = ?",
+            (content_hash, stage, version)).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def put_stage(self, content_hash: str, stage: str, version: str, status: str, reason, result: dict):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO stage_results (hash, stage, version, status, reason, result, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (content_hash, stage, version, status, reason, json.dumps(result, ensure_ascii=False), time.time()))
+
+    def stage_counts(self) -> dict:
+        # {(단계, 상태): 이미지 수}
+        rows = self.conn.execute("SELECT stage, status, COUNT(*) FROM stage_results GROUP BY stage, status")
+        return {(stage, status): count for stage, status, count in rows}
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        # 아직 커밋하지 않은 쓰기를 저장하고 닫음 (파이프라인은 실행 중 예외가 나도 finally 에서 호출)
+        self.conn.commit()
+        self.conn.close()
+
+def stage_version(previous: str, stage_config: dict) -> str:
+    # 앞 단계 버전 + 이 단계 설정의 해시 (앞 단계 설정이 바뀌면 뒤 단계도 다시 실행)
+    payload = json.dumps({"previous": previous, "config": stage_config}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,75 @@
+import os
+import threading
+
+from utils.config_loader import load_config
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_instances = {}
+_device = None
+_lock = threading.Lock()
+
+def resolve_device(requested: str = "auto") -> str:
+    # "auto" 는 CUDA 가 있으면 cuda, 요청한 cuda 장치가 없으면 cpu 로 대체
+    if requested == "cpu":
+        return "cpu"
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda" if requested == "auto" else requested
+    if requested != "auto":
+        print(f"[⚠️] {requested} 장치를 사용할 수 없어 cpu 로 실행합니다.")
+    return "cpu"
+
+def get_device() -> str:
+    global _device
+    if _device is None:
+        _device = resolve_device(load_config().get("device", "auto"))
+    return _device
+
+def _load_yolo(config, device):
+    from ultralytics import YOLO
+    return YOLO(os.path.join(BASE_DIR, config["model"]["yolo_path"]))
+
+def _load_ocr(config, device):
+    import easyocr
+    return easyocr.Reader(config["model"].get("ocr_languages", ["ko", "en"]), gpu=device.startswith("cuda"))
+
+def _load_caption(config, device):
+    from utils.captioning_utils import load_blip_model
+    return load_blip_model(config["captioning"]["blip_model"], device)
+
+def _load_judgement(config, device):
+    from utils.judgement_utils import load_filtering_model
+    return load_filtering_model(config["judgement"]["model"], device)
+
+# 이름 → 로더 (config, device) -> 모델, caption / judgement 는 (processor|tokenizer, model)
+LOADERS = {
+    "yolo": _load_yolo,
+    "ocr": _load_ocr,
+    "caption": _load_caption,
+    "judgement": _load_judgement,
+}
+
+def get_model(name: str):
+    """
+    처음 사용할 때 모델을 읽고 프로세스 안에서 재사용합니다.
+    - 장치는 config 의 device ("auto" / "cuda" / "cpu") 를 따르고, CUDA 가 없으면 cpu 로 대체합니다.
+    """
+    model = _instances.get(name)
+    if model is None:
+        with _lock:
+            model = _instances.get(name)
+            if model is None:
+                model = _instances[name] = LOADERS[name](load_config(), get_device())
+    return model
+
+def prewarm(names=None):
+    # 상주 워커가 첫 요청 전에 모델을 미리 읽어 둘 때 사용
+    for name in names or LOADERS:
+        get_model(name)
+
+def loaded_models():
+    return sorted(_instances)
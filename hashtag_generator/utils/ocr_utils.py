@@ -1,12 +1,11 @@
-import easyocr
 import cv2
 import numpy as np
 from typing import List
 
-ocr = easyocr.Reader(['ko', 'en'], gpu=True)
+from utils.model_registry import get_model
 
 def get_text_boxes(image: np.ndarray) -> List:
-    result = ocr.readtext(image)
+    result = get_model("ocr").readtext(image)
     boxes = []
     for item in result:
         box = item[0]
@@ -1,15 +1,8 @@
-from ultralytics import YOLO
+import cv2
 import numpy as np
 from typing import List
-import os
 
-from utils.config_loader import load_config
-
-config = load_config()
-model_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                          config["model"]["yolo_path"])
-
-model = YOLO(model_path)
+from utils.model_registry import get_model, get_device
 
 deny_food_only_classes = {
     'pizza', 'cake', 'sandwich', 'donut', 'hot dog', 'bowl',
@@ -21,8 +14,40 @@ pass_scene_classes = {
     'potted plant', 'bed', 'bench', 'sink'
 }
 
+_class_masks = None
+
+def class_masks():
+    # 클래스 id → (음식 클래스 여부, 장면 클래스 여부) 배열 (배치 결과를 벡터 연산으로 판정)
+    global _class_masks
+    if _class_masks is None:
+        names = get_model("yolo").names
+        _class_masks = (np.array([names[i] in deny_food_only_classes for i in range(len(names))]),
+                        np.array([names[i] in pass_scene_classes for i in range(len(names))]))
+    return _class_masks
+
 def detect_objects_yolo(image: np.ndarray) -> List[str]:
-    results = model(image, verbose=False)[0]
+    model = get_model("yolo")
+    results = model(image, device=get_device(), verbose=False)[0]
     class_ids = results.boxes.cls.cpu().numpy().astype(int)
     labels = [model.names[cid] for cid in class_ids]
     return labels
+
+def detect_class_ids_yolo_batch(images: List[np.ndarray], imgsz: int = 640) -> List[np.ndarray]:
+    # 같은 크기로 letterbox 된 BGR 이미지 묶음을 한 번에 추론
+    results = get_model("yolo")(images, imgsz=imgsz, device=get_device(), verbose=False)
+    return [r.boxes.cls.cpu().numpy().astype(int) for r in results]
+
+def detect_objects_yolo_batch(images: List[np.ndarray], imgsz: int = 640) -> List[List[str]]:
+    # 디코딩된 BGR 이미지 묶음을 letterbox 후 한 번에 추론해 이미지별 라벨 목록으로 반환
+    names = get_model("yolo").names
+    class_ids = detect_class_ids_yolo_batch([letterbox(image, imgsz) for image in images], imgsz)
+    return [[names[cid] for cid in ids] for ids in class_ids]
+
+def letterbox(image: np.ndarray, size: int = 640, color=(114, 114, 114)) -> np.ndarray:
+    # 비율을 유지해 size x size 로 줄이고 남는 부분을 채움 (ultralytics 전처리와 같은 회색)
+    h, w = image.shape[:2]
+    scale = size / max(h, w)
+    nh, nw = max(1, round(h * scale)), max(1, round(w * scale))
+    resized = cv2.resize(image, (nw, nh), interpolation=cv2.INTER_LINEAR) if (nh, nw) != (h, w) else image
+    top, left = (size - nh) // 2, (size - nw) // 2
+    return cv2.copyMakeBorder(resized, top, size - nh - top, left, size - nw - left, cv2.BORDER_CONSTANT, value=color)
@@ -0,0 +1,36 @@
+import os
+import time
+import argparse
+from pathlib import Path
+
+from filtering.yolo_filter import is_food_only_image, is_food_only_images
+
+IMAGE_DIR = Path("./data/images_raw")
+VALID_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+def measure(fn, paths):
+    start = time.perf_counter()
+    flags = fn(paths)
+    elapsed = time.perf_counter() - start
+    return flags, len(paths) / elapsed if elapsed > 0 else float("inf")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="YOLO 음식 전용 필터 처리량 (이미지/초)")
+    parser.add_argument("--image-dir", default=str(IMAGE_DIR))
+    parser.add_argument("--limit", type=int, default=256)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[4, 8, 16, 32])
+    args = parser.parse_args()
+
+    paths = [str(Path(args.image_dir) / f) for f in sorted(os.listdir(args.image_dir))
+             if Path(f).suffix.lower() in VALID_EXTENSIONS][:args.limit]
+    print(f"[Images] {len(paths)}장")
+
+    # 첫 추론의 초기화 비용이 측정에 섞이지 않도록 한 번 실행
+    is_food_only_images(paths[:1], batch_size=1)
+
+    baseline, loop_rate = measure(lambda ps: [is_food_only_image(p) for p in ps], paths)
+    print(f"[Loop] 한 장씩: {loop_rate:.1f} images/sec")
+    for batch_size in args.batch_sizes:
+        flags, rate = measure(lambda ps: is_food_only_images(ps, batch_size=batch_size), paths)
+        changed = sum(a != b for a, b in zip(baseline, flags))
+        print(f"[Batch] batch_size={batch_size}: {rate:.1f} images/sec ({rate / loop_rate:.2f}배), 판정이 다른 이미지 {changed}장")
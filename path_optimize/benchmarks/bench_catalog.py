@@ -0,0 +1,57 @@
+import os
+import time
+import json
+import random
+import tempfile
+from tabulate import tabulate
+
+from solver.utils.time import minutes_to_time_str
+from solver.utils.catalog import compile_catalog, PlaceCatalog
+
+def make_places(n, seed=0):
+    rnd = random.Random(seed)
+    places = []
+    for i in range(n):
+        o = rnd.randrange(6 * 60, 11 * 60, 30)
+        places.append({"id": i, "name": f"장소{i}", "x_cord": 33.45 + rnd.uniform(-0.1, 0.1),
+                       "y_cord": 126.55 + rnd.uniform(-0.2, 0.2), "category": rnd.choice(["landmark", "restaurant", "cafe"]),
+                       "open_time": minutes_to_time_str(o), "close_time": minutes_to_time_str(o + 600),
+                       "break_time": ["15:00", "16:00"] if rnd.random() < 0.3 else [], "service_time": 60,
+                       "tags": ["관광"], "휴무일": []})
+    return places
+
+def run_benchmark(sizes=(10000, 100000), lookups=30):
+    rows = []
+    for n in sizes:
+        places = make_places(n)
+        ids = random.Random(1).sample(range(n), lookups)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, "places.json")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump({"places": places}, f, ensure_ascii=False)
+            compile_catalog(places, os.path.join(tmp, "catalog"))
+
+            # 기존: 워커 시작 시 JSON 전체 파싱 후 id 로 조회
+            t0 = time.perf_counter()
+            with open(json_path, encoding="utf-8") as f:
+                by_id = {p["id"]: p for p in json.load(f)["places"]}
+            [by_id[i] for i in ids]
+            json_time = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            catalog = PlaceCatalog(os.path.join(tmp, "catalog"))
+            open_time = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            catalog.places(ids)
+            lookup_time = time.perf_counter() - t0
+            del catalog
+
+        rows.append([n, f"{json_time * 1000:.1f}", f"{open_time * 1000:.2f}", f"{lookup_time * 1000:.2f}",
+                     f"{json_time / (open_time + lookup_time):.0f}x"])
+
+    headers = ["장소 수", "JSON 파싱+조회(ms)", "카탈로그 열기(ms)", f"{lookups}곳 조회(ms)", "속도 향상"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,57 @@
+import os
+import io
+import json
+import glob
+import time
+import contextlib
+import dataclasses
+import statistics
+from tabulate import tabulate
+
+from solver.routing_solver import run_meal_choice_model
+from solver.solver_config import SolverConfig, ADAPTIVE_CONFIG
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.places import split_restaurant_nodes
+
+SCENARIO_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'scenarios', 'base')
+
+def load_days():
+    days = []
+    for path in sorted(glob.glob(os.path.join(SCENARIO_DIR, '**', '*.json'), recursive=True)):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        eff_windows = calculate_effective_time_windows(data["places"], data["user"])
+        places, wins = split_restaurant_nodes(data["places"], eff_windows)
+        days.append((os.path.basename(path), places, wins, data["day_info"], data["user"]))
+    return days
+
+def latencies(days, config):
+    times, objectives = [], []
+    for _, places, wins, day_info, user in days:
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, obj = run_meal_choice_model(list(places), list(wins), day_info, user, config=config)
+        times.append(time.perf_counter() - t0)
+        objectives.append(obj)
+    return times, objectives
+
+def run_benchmark(threshold=8):
+    days = [d for d in load_days() if len(d[1]) - 2 <= threshold]
+    configs = [
+        ("기본 (AUTOMATIC)", SolverConfig()),
+        ("GLS + 조기 종료", dataclasses.replace(ADAPTIVE_CONFIG, exact_threshold=None)),
+        (f"동적 계획법 (n <= {threshold})", SolverConfig(exact_threshold=threshold)),
+    ]
+    rows = []
+    exact_objectives = latencies(days, configs[-1][1])[1]
+    for label, config in configs:
+        times, objectives = latencies(days, config)
+        worse = sum(1 for a, b in zip(objectives, exact_objectives) if a != b)
+        rows.append([label, len(days), f"{statistics.median(times) * 1000:.2f}", f"{max(times) * 1000:.2f}", worse])
+
+    headers = ["설정", "일정 수", "p50(ms)", "최대(ms)", "objective 가 다른 일정"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
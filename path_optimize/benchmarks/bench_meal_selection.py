@@ -0,0 +1,76 @@
+import time
+import random
+from tabulate import tabulate
+
+from solver.routing_solver import run_model, run_meal_choice_model
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.places import split_restaurant_nodes, group_meal_nodes, enumerate_meal_selections, select_nodes
+
+USER = {
+    "start_time": "08:00",
+    "end_time": "22:00",
+    "meal_time_preferences": {
+        "breakfast": ["08:30", "09:30"],
+        "lunch": ["12:00", "13:00"],
+        "dinner": ["18:00", "19:00"]
+    }
+}
+DAY_INFO = {"is_first_day": False, "is_last_day": False}
+
+def make_places(n_restaurants, seed=0):
+    # 숙소 - 관광지 2곳 - 식당 n개 - 숙소 (식당은 하루 종일 영업 → 식사 3개로 분할)
+    rnd = random.Random(seed)
+
+    def coord():
+        return 33.45 + rnd.uniform(-0.1, 0.1), 126.55 + rnd.uniform(-0.2, 0.2)
+
+    hotel_x, hotel_y = coord()
+    places = [{"id": 0, "name": "숙소", "x_cord": hotel_x, "y_cord": hotel_y, "category": "accommodation",
+               "open_time": "00:00", "close_time": "23:59", "service_time": 0, "break_time": []}]
+    for i in range(2):
+        x, y = coord()
+        places.append({"id": 100 + i, "name": f"관광지{i}", "x_cord": x, "y_cord": y, "category": "landmark",
+                       "open_time": "09:00", "close_time": "18:00", "service_time": 60, "break_time": []})
+    for i in range(n_restaurants):
+        x, y = coord()
+        places.append({"id": 200 + i, "name": f"식당{i}", "x_cord": x, "y_cord": y, "category": "restaurant",
+                       "open_time": "08:00", "close_time": "21:00", "service_time": 60, "break_time": [],
+                       "is_mandatory": False})
+    places.append({**places[0], "id": 1})
+    return places
+
+def solve_by_enumeration(places, wins):
+    best = None
+    selections = enumerate_meal_selections(group_meal_nodes(places, wins))
+    for sel in selections:
+        selected_places, selected_wins = select_nodes(places, wins, sel)
+        route, obj = run_model(selected_places, selected_wins, DAY_INFO, USER)
+        if route and (best is None or obj < best):
+            best = obj
+    return best, len(selections)
+
+def solve_by_disjunction(places, wins):
+    route, obj = run_meal_choice_model(list(places), list(wins), DAY_INFO, USER)
+    return (obj if route else None), 1
+
+def run_benchmark(restaurant_counts=(1, 2, 3, 4, 5)):
+    rows = []
+    for n in restaurant_counts:
+        places = make_places(n)
+        eff_windows = calculate_effective_time_windows(places, USER)
+        split_places, split_wins = split_restaurant_nodes(places, eff_windows)
+
+        t0 = time.perf_counter()
+        enum_obj, enum_solves = solve_by_enumeration(split_places, split_wins)
+        t1 = time.perf_counter()
+        disj_obj, disj_solves = solve_by_disjunction(split_places, split_wins)
+        t2 = time.perf_counter()
+
+        rows.append([n, enum_solves, f"{t1 - t0:.3f}", enum_obj, disj_solves, f"{t2 - t1:.3f}", disj_obj])
+
+    headers = ["식당 수", "조합 solve 수", "조합 시간(s)", "조합 objective", "disjunction solve 수", "disjunction 시간(s)", "disjunction objective"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
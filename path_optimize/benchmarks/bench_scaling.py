@@ -0,0 +1,139 @@
+import sys
+import json
+import math
+import time
+import argparse
+import tracemalloc
+from tabulate import tabulate
+
+from benchmarks.synthetic import generate_scenario
+from solver.routing_solver import run_meal_choice_model
+from solver.solver_config import SolverConfig
+from solver.utils.distance import create_distance_matrix
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.places import split_restaurant_nodes, group_meal_nodes, enumerate_meal_selections
+from solver.utils.telemetry import SolveTrace
+
+SIZES = (5, 10, 20, 50, 100, 200, 500)
+# 기본 설정(AUTOMATIC)은 선택 장소가 50곳 정도를 넘으면 첫 해를 찾지 못해 삽입 휴리스틱으로 측정
+FIRST_SOLUTION = "PARALLEL_CHEAPEST_INSERTION"
+# 식사 조합 수가 이보다 많으면 enumerate_meal_selections 는 실행하지 않고 조합 수만 기록
+MAX_SELECTIONS = 200_000
+# 이보다 짧은 시간 차이는 측정 잡음으로 보고 회귀로 세지 않음
+MIN_REGRESSION_MS = 1.0
+
+def measure(fn, repeat=1):
+    """
+    fn() 을 repeat 번 실행한 최소 시간(ms)과, 한 번 더 tracemalloc 으로 실행한 Python 최대 할당량(KiB),
+    가장 빨랐던 실행의 반환값을 돌려줍니다 (OR-Tools 내부 C++ 메모리는 포함되지 않음).
+    - 메모리 측정 실행의 반환값은 버리므로, fn 은 실행마다 새 상태(trace 등)를 만들어야 합니다.
+    """
+    best, result = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - t0
+        if best is None or elapsed < best:
+            best, result = elapsed, value
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best * 1000, peak / 1024, result
+
+def enumerate_selections(places, wins):
+    groups = group_meal_nodes(places, wins)
+    count = math.prod(len(g) for g in groups.values())
+    if count > MAX_SELECTIONS:
+        return count
+    return len(enumerate_meal_selections(groups))
+
+def bench_size(n, seed, time_limit, repeat, first_solution=FIRST_SOLUTION):
+    # 단계별 {"ms", "kib"} 와 방문 후보/분할 노드 수, objective
+    scenario = generate_scenario(n, seed)
+    places, user, day_info = scenario["places"], scenario["user"], scenario["day_info"]
+    config = SolverConfig(time_limit=time_limit, first_solution_strategy=first_solution,
+                          local_search_metaheuristic="GUIDED_LOCAL_SEARCH", no_improvement_window=0.5)
+    result = {"n": n, "seed": seed}
+
+    ms, kib, eff_windows = measure(lambda: calculate_effective_time_windows(places, user), repeat)
+    result["time_windows"] = {"ms": ms, "kib": kib}
+    ms, kib, _ = measure(lambda: create_distance_matrix(places), repeat)
+    result["distance_matrix"] = {"ms": ms, "kib": kib}
+    ms, kib, (new_places, new_wins) = measure(lambda: split_restaurant_nodes(places, eff_windows), repeat)
+    result["split"] = {"ms": ms, "kib": kib}
+    ms, kib, selections = measure(lambda: enumerate_selections(new_places, new_wins), repeat)
+    result["enumeration"] = {"ms": ms if selections <= MAX_SELECTIONS else None, "kib": kib}
+    result["nodes"], result["selections"] = len(new_places), selections
+
+    # run_model 은 탐색 시간이 길어 한 번만 측정 (0.5초 동안 개선이 없으면 종료)
+    # 실행마다 새 trace 를 만들고, 첫 해 시간은 시간을 잰 실행의 trace 에서 가져옴 (해 캐시는 사용하지 않음)
+    def solve():
+        trace = SolveTrace(search_events=True)
+        route, obj = run_meal_choice_model(list(new_places), list(new_wins), day_info, user, config=config, trace=trace)
+        return route, obj, trace
+
+    ms, kib, (route, obj, trace) = measure(solve)
+    result["run_model"] = {"ms": ms, "kib": kib}
+    result["first_solution_ms"] = trace.first_solution_seconds * 1000 if trace.first_solution_seconds is not None else None
+    result["objective"] = obj
+    result["visited"] = len(route) - 2 if route else None
+    return result
+
+def compare(results, baseline, tolerance):
+    # baseline 대비 시간이 tolerance 배 넘게 늘었거나 objective 가 나빠진 항목
+    previous = {(r["n"], r["seed"]): r for r in baseline}
+    regressions = []
+    for r in results:
+        base = previous.get((r["n"], r["seed"]))
+        if base is None:
+            continue
+        for stage in ("time_windows", "distance_matrix", "split", "enumeration", "run_model"):
+            old, new = base[stage]["ms"], r[stage]["ms"]
+            if old and new and new > old * tolerance and new - old > MIN_REGRESSION_MS:
+                regressions.append(f"n={r['n']} {stage}: {old:.2f}ms -> {new:.2f}ms")
+        if base["objective"] is not None and (r["objective"] is None or r["objective"] > base["objective"]):
+            regressions.append(f"n={r['n']} objective: {base['objective']} -> {r['objective']}")
+    return regressions
+
+def run_benchmark(sizes=SIZES, seed=0, time_limit=2, repeat=3, first_solution=FIRST_SOLUTION):
+    results = [bench_size(n, seed, time_limit, repeat, first_solution) for n in sizes]
+
+    def cell(stage):
+        return lambda r: "-" if r[stage]["ms"] is None else f"{r[stage]['ms']:.2f} / {r[stage]['kib']:.0f}"
+
+    columns = [cell("time_windows"), cell("distance_matrix"), cell("split"), cell("enumeration"), cell("run_model")]
+    rows = [[r["n"], r["nodes"], r["selections"]] + [c(r) for c in columns]
+            + ["-" if r["first_solution_ms"] is None else f"{r['first_solution_ms']:.2f}", r["objective"], r["visited"]]
+            for r in results]
+    headers = ["장소 수", "노드 수", "식사 조합 수", "시간 윈도우", "거리 행렬", "식당 분할", "조합 열거", "run_model",
+               "첫 해(ms)", "objective", "방문 수"]
+    print("단계별 값: 시간(ms) / Python 최대 할당(KiB)")
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="합성 시나리오 규모별 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--time-limit', type=float, default=2)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--first-solution', default=FIRST_SOLUTION)
+    parser.add_argument('--save', default=None, help='결과를 저장할 JSON 파일')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON 파일')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='시간 회귀로 볼 배수')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.seed, args.time_limit, args.repeat, args.first_solution)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"[회귀] {line}")
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,49 @@
+import time
+import random
+from tabulate import tabulate
+
+from solver.routing_solver import run_model
+from solver.solver_config import SolverConfig
+
+USER = {"start_time": "08:00", "end_time": "21:00", "meal_time_preferences": {}}
+DAY_INFO = {"is_first_day": False, "is_last_day": False}
+
+def make_day(n, seed=0):
+    # 숙소 -> 선택 장소 n 곳 (영업 시간이 제각각) -> 숙소
+    rnd = random.Random(seed)
+    hotel = {"id": 0, "name": "숙소", "x_cord": 33.40, "y_cord": 126.55, "category": "accommodation",
+             "service_time": 0, "is_mandatory": True}
+    places, wins = [hotel], [(8 * 60, 21 * 60, None)]
+    for i in range(1, n + 1):
+        places.append({"id": i, "name": f"장소{i}", "x_cord": 33.40 + rnd.uniform(-0.1, 0.1),
+                       "y_cord": 126.55 + rnd.uniform(-0.2, 0.2), "category": "landmark",
+                       "service_time": rnd.choice([20, 30, 45]), "is_mandatory": False})
+        o = rnd.randrange(8 * 60, 15 * 60, 30)
+        wins.append((o, o + rnd.choice([180, 300, 480]), None))
+    places.append({**hotel, "id": n + 1})
+    wins.append((8 * 60, 21 * 60, None))
+    return places, wins
+
+def solve(places, wins, config):
+    t0 = time.perf_counter()
+    route, obj = run_model(list(places), list(wins), DAY_INFO, USER, config=config)
+    return time.perf_counter() - t0, obj, len(route) - 2
+
+def run_benchmark(sizes=(50, 100, 200), k=10, seconds=10, window=1.0):
+    base = dict(first_solution_strategy="PATH_CHEAPEST_ARC", local_search_metaheuristic="GUIDED_LOCAL_SEARCH",
+                time_limit=seconds, no_improvement_window=window)
+    rows = []
+    for n in sizes:
+        places, wins = make_day(n)
+        dense_time, dense_obj, dense_visits = solve(places, wins, SolverConfig(**base))
+        sparse_time, sparse_obj, sparse_visits = solve(places, wins, SolverConfig(**base, sparse_neighbors=k))
+        gap = (sparse_obj - dense_obj) / dense_obj * 100
+        rows.append([n, f"{dense_time:.2f}", dense_obj, dense_visits, f"{sparse_time:.2f}", sparse_obj, sparse_visits,
+                     f"{gap:+.1f}%"])
+
+    headers = ["선택 장소 수", "전체(s)", "전체 objective", "전체 방문", f"k={k}(s)", f"k={k} objective", f"k={k} 방문", "objective 차이"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
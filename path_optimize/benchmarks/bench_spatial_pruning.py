@@ -0,0 +1,50 @@
+import time
+import random
+from tabulate import tabulate
+
+from solver.routing_solver import run_model
+from solver.solver_config import SolverConfig
+from solver.utils.spatial import SpatialPruner
+
+USER = {"start_time": "08:00", "end_time": "21:00", "meal_time_preferences": {}}
+
+def make_shortlist(n, seed=0):
+    # 숙소에서 출발해 숙소로 돌아오는 하루, 넓게 흩어진 선택 장소 n 곳
+    rnd = random.Random(seed)
+    hotel = {"id": 0, "name": "숙소", "x_cord": 126.55, "y_cord": 33.45, "category": "accommodation",
+             "open_time": "00:00", "close_time": "23:59", "service_time": 0, "is_mandatory": True}
+    places = [hotel]
+    for i in range(1, n + 1):
+        places.append({"id": i, "name": f"장소{i}", "x_cord": 126.55 + rnd.uniform(-0.45, 0.45),
+                       "y_cord": 33.35 + rnd.uniform(-0.15, 0.15), "category": "landmark",
+                       "open_time": "09:00", "close_time": "18:00", "service_time": rnd.choice([30, 60]),
+                       "is_mandatory": False})
+    return places + [{**hotel, "id": n + 1}]
+
+def solve(places, pruner, config):
+    wins = [(8 * 60, 21 * 60, None)] * len(places)
+    day_info = {"is_first_day": False, "is_last_day": False}
+    t0 = time.perf_counter()
+    route, obj = run_model(list(places), list(wins), day_info, USER, config=config, pruner=pruner)
+    elapsed = time.perf_counter() - t0
+
+    # 방문하지 않은 선택 장소의 패널티(1000)를 빼서 모델 크기가 달라도 비교할 수 있는 이동+체류 비용
+    n_optional = len(pruner.keep(places, 0, len(places) - 1) if pruner else places) - 2
+    visited = len(route) - 2
+    return elapsed, obj - 1000 * (n_optional - visited), visited
+
+def run_benchmark(sizes=(100, 300, 600), k=25, seconds=3):
+    config = SolverConfig(first_solution_strategy="PATH_CHEAPEST_ARC", time_limit=seconds)
+    rows = []
+    for n in sizes:
+        places = make_shortlist(n)
+        full_time, full_obj, full_visits = solve(places, None, config)
+        pruned_time, pruned_obj, pruned_visits = solve(places, SpatialPruner(k=k), config)
+        rows.append([n, f"{full_time:.2f}", full_obj, full_visits, f"{pruned_time:.2f}", pruned_obj, pruned_visits])
+
+    headers = ["선택 장소 수", "전체(s)", "전체 비용", "전체 방문", f"k={k}(s)", f"k={k} 비용", f"k={k} 방문"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
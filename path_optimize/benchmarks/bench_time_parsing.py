@@ -0,0 +1,48 @@
+import time
+import random
+from unittest import mock
+from tabulate import tabulate
+
+from solver.utils import time_windows
+from solver.utils.time import time_to_minutes, parse_time_to_minutes
+from solver.utils.time_windows import calculate_effective_time_windows
+
+def make_places(n, seed=0):
+    rnd = random.Random(seed)
+    return [{"id": i, "name": f"장소{i}", "category": "landmark",
+             "open_time": f"{rnd.randrange(6, 11)}:{rnd.choice(['00', '30'])}", "close_time": f"{rnd.randrange(17, 23)}:00",
+             "break_time": ["14:00", "15:00"] if i % 3 == 0 else []} for i in range(n)]
+
+def best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+def run_benchmark(places=5000, repeat=3):
+    rows = []
+
+    # time_to_minutes: 미리 만든 표 조회 vs 매번 파싱
+    strings = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)] * 10
+    cached = best_of(lambda: [time_to_minutes(s) for s in strings], repeat)
+    uncached = best_of(lambda: [parse_time_to_minutes(s) for s in strings], repeat)
+    rows.append([f"time_to_minutes {len(strings)}회", f"{uncached * 1000:.1f}", f"{cached * 1000:.1f}",
+                 f"{uncached / cached:.1f}x"])
+
+    # calculate_effective_time_windows: 내부의 time_to_minutes 만 파싱 버전으로 교체
+    catalog = make_places(places)
+    user = {"start_time": "08:00", "end_time": "22:00", "meal_time_preferences": {"lunch": ["12:00", "13:00"]}}
+    cached = best_of(lambda: calculate_effective_time_windows(catalog, user), repeat)
+    with mock.patch.object(time_windows, "time_to_minutes", parse_time_to_minutes):
+        uncached = best_of(lambda: calculate_effective_time_windows(catalog, user), repeat)
+    rows.append([f"calculate_effective_time_windows {places}곳", f"{uncached * 1000:.1f}", f"{cached * 1000:.1f}",
+                 f"{uncached / cached:.1f}x"])
+
+    headers = ["측정 대상", "파싱(ms)", "표 조회(ms)", "속도 향상"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
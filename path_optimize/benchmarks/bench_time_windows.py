@@ -0,0 +1,56 @@
+import time
+import random
+from tabulate import tabulate
+
+from solver.utils.time import minutes_to_time_str
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.window_table import PlaceTimeTable
+
+def make_catalog(n, seed=0):
+    # 영업/휴식 시간이 다른 장소 n 곳, 30% 는 점심/저녁 시간에 영업하는 식당
+    rnd = random.Random(seed)
+    places = []
+    for i in range(n):
+        restaurant = rnd.random() < 0.3
+        o = rnd.randrange(6 * 60, 11 * 60, 30)
+        c = rnd.randrange(20 * 60, 24 * 60, 30)
+        breaks = [minutes_to_time_str(o + 180), minutes_to_time_str(o + 240)] if rnd.random() < 0.3 else []
+        places.append({"id": i, "name": f"장소{i}", "category": "restaurant" if restaurant else "tourist_spot",
+                       "open_time": minutes_to_time_str(o), "close_time": minutes_to_time_str(c), "break_time": breaks})
+    return places
+
+def make_users(count, seed=0):
+    rnd = random.Random(seed)
+    return [{"start_time": minutes_to_time_str(rnd.randrange(7 * 60, 11 * 60, 30)),
+             "end_time": minutes_to_time_str(rnd.randrange(18 * 60, 23 * 60, 30)),
+             "meal_time_preferences": {"lunch": ["12:00", "13:00"], "dinner": ["18:00", "19:00"]}}
+            for _ in range(count)]
+
+def run_benchmark(sizes=(1000, 10000, 50000), users=10):
+    rows = []
+    for n in sizes:
+        places = make_catalog(n)
+        schedules = make_users(users)
+
+        t0 = time.perf_counter()
+        for user in schedules:
+            calculate_effective_time_windows(places, user)
+        loop = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        table = PlaceTimeTable(places)
+        compile_time = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for user in schedules:
+            table.effective_windows(user)
+        vectorized = time.perf_counter() - t0
+
+        rows.append([n, users, f"{loop:.3f}", f"{compile_time:.3f}", f"{vectorized:.3f}",
+                     f"{loop / (compile_time + vectorized):.1f}x"])
+
+    headers = ["장소 수", "일정 수", "반복문(s)", "테이블 생성(s)", "벡터 연산(s)", "속도 향상"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,59 @@
+import time
+import random
+from tabulate import tabulate
+from ortools.constraint_solver import pywrapcp, routing_enums_pb2
+
+from solver.routing_solver import create_routing_model, register_transit, register_transit_callback, add_time_constraints
+from solver.utils.distance import create_distance_array
+
+def make_places(n, seed=0):
+    # 숙소에서 출발/도착하는 관광지 n-2 곳 (모두 선택 장소)
+    rnd = random.Random(seed)
+    places = []
+    for i in range(n):
+        places.append({"id": i, "name": f"장소{i}", "x_cord": 126.55 + rnd.uniform(-0.2, 0.2),
+                       "y_cord": 33.45 + rnd.uniform(-0.1, 0.1), "service_time": rnd.choice([30, 60, 90]),
+                       "is_mandatory": False})
+    return places
+
+def count_solutions(places, registrar, seconds):
+    gs, ge = 8 * 60, 22 * 60
+    n = len(places)
+    wins = [(gs, ge, None)] * n
+    dist = create_distance_array(places)
+    svc = [p["service_time"] for p in places]
+
+    mgr, routing = create_routing_model(n, 0, n - 1)
+    cb_idx = registrar(routing, mgr, dist if registrar is register_transit else dist.tolist(), svc, places)
+    routing.SetArcCostEvaluatorOfAllVehicles(cb_idx)
+    for i in range(1, n - 1):
+        routing.AddDisjunction([mgr.NodeToIndex(i)], 1000)
+    add_time_constraints(routing, cb_idx, gs, ge, wins, mgr, 0, n - 1)
+
+    solutions = [0]
+    routing.AddAtSolutionCallback(lambda: solutions.__setitem__(0, solutions[0] + 1))
+
+    params = pywrapcp.DefaultRoutingSearchParameters()
+    params.first_solution_strategy = routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC
+    params.local_search_metaheuristic = routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
+    params.time_limit.seconds = seconds
+
+    t0 = time.perf_counter()
+    sol = routing.SolveWithParameters(params)
+    elapsed = time.perf_counter() - t0
+    return solutions[0] / elapsed, sol.ObjectiveValue() if sol else None
+
+def run_benchmark(sizes=(10, 30, 60), seconds=2):
+    rows = []
+    for n in sizes:
+        places = make_places(n)
+        before, before_obj = count_solutions(places, register_transit_callback, seconds)
+        after, after_obj = count_solutions(places, register_transit, seconds)
+        rows.append([n, f"{before:.0f}", before_obj, f"{after:.0f}", after_obj, f"{after / before:.2f}x"])
+
+    headers = ["노드 수", "콜백 solutions/s", "콜백 objective", "행렬 solutions/s", "행렬 objective", "속도 향상"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
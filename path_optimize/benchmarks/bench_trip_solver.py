@@ -0,0 +1,60 @@
+import time
+import random
+from tabulate import tabulate
+
+from solver.trip_solver import solve_trip
+
+USER = {
+    "start_time": "08:00",
+    "end_time": "21:00",
+    "meal_time_preferences": {
+        "breakfast": ["08:30", "09:30"],
+        "lunch": ["12:00", "13:00"],
+        "dinner": ["18:00", "19:00"]
+    }
+}
+
+def make_trip(n_days, places_per_day=4, restaurants_per_day=2, seed=0):
+    # 공항 → 숙소 → ... → 숙소 → 공항, 후보 장소는 하루 places_per_day 곳 + 식당 restaurants_per_day 곳 비율로 생성
+    rnd = random.Random(seed)
+
+    def coord():
+        return 126.55 + rnd.uniform(-0.3, 0.3), 33.40 + rnd.uniform(-0.15, 0.15)
+
+    def place(pid, name, category, open_time, close_time, service_time, mandatory=False):
+        x, y = coord()
+        return {"id": pid, "name": name, "x_cord": x, "y_cord": y, "category": category, "open_time": open_time,
+                "close_time": close_time, "service_time": service_time, "break_time": [], "is_mandatory": mandatory}
+
+    airport = place(0, "공항", "transport", "06:00", "23:00", 0, True)
+    hotel = place(1, "숙소", "accommodation", "00:00", "23:59", 0, True)
+    places = []
+    for i in range(n_days * places_per_day):
+        places.append(place(100 + i, f"관광지{i}", "landmark", "09:00", rnd.choice(["17:00", "18:00", "20:00"]),
+                            rnd.choice([45, 60, 90])))
+    for i in range(n_days * restaurants_per_day):
+        places.append(place(200 + i, f"식당{i}", "restaurant", "08:00", "21:00", 60))
+
+    days = []
+    for d in range(n_days):
+        anchors = [airport, hotel] if d == 0 else [hotel, airport] if d == n_days - 1 else [hotel, hotel]
+        days.append({"places": anchors, "user": USER,
+                     "day_info": {"is_first_day": d == 0, "is_last_day": d == n_days - 1}})
+    return places, days
+
+def run_benchmark(day_counts=(2, 3, 4, 5, 6, 7)):
+    rows = []
+    for n_days in day_counts:
+        places, days = make_trip(n_days)
+        t0 = time.perf_counter()
+        routes, obj = solve_trip(places, days)
+        elapsed = time.perf_counter() - t0
+        visited = sum(len(route) - 2 for route in routes) if routes else None
+        rows.append([n_days, len(places), f"{elapsed:.3f}", obj, visited])
+
+    headers = ["여행 일수", "후보 장소 수", "시간(s)", "objective", "방문 수"]
+    print(tabulate(rows, headers=headers, tablefmt="fancy_grid", stralign="center"))
+    return rows
+
+if __name__ == '__main__':
+    run_benchmark()
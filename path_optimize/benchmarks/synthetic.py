@@ -0,0 +1,109 @@
+import json
+import math
+import random
+import argparse
+
+from solver.utils.time import minutes_to_time_str
+
+# 도심 좌표 (x_cord, y_cord) 와 명소가 모이는 권역 수
+CITY_CENTRE = (33.50, 126.53)
+
+# 분류별 (비율, 영업 시간 후보 [(open, close, break_time)], 체류 시간 후보)
+CATEGORY_PROFILES = {
+    "landmark": (0.30, [("09:00", "18:00", []), ("08:00", "20:00", []), ("00:00", "23:59", [])], [60, 90, 120]),
+    "museum": (0.10, [("09:00", "18:00", []), ("10:00", "19:00", ["12:00", "13:00"])], [60, 90]),
+    "cafe": (0.20, [("09:00", "20:00", ["13:30", "14:30"]), ("10:00", "22:00", []), ("08:00", "18:00", [])], [30, 60]),
+    "shopping": (0.15, [("10:00", "21:00", []), ("11:00", "22:00", ["15:00", "15:30"])], [30, 60]),
+    # 식당: 식사 시간대가 둘 이상 걸치도록 (브런치 = 아침+점심, 브레이크 타임 = 점심+저녁, 종일 = 세 끼)
+    "restaurant": (0.25, [("08:00", "14:30", ["10:30", "11:00"]), ("11:00", "21:30", ["15:00", "17:00"]),
+                          ("07:00", "22:00", []), ("17:00", "23:00", [])], [60]),
+}
+
+USER = {
+    "start_time": "08:00",
+    "end_time": "22:00",
+    "travel_style": "relaxed",
+    "meal_time_preferences": {
+        "breakfast": ["08:30", "09:30"],
+        "lunch": ["12:00", "13:00"],
+        "dinner": ["18:00", "19:00"]
+    }
+}
+DAY_INFO = {"is_first_day": False, "is_last_day": False}
+
+def cluster_centres(rnd, n_clusters, spread=0.12):
+    # 도심 주변 권역 중심 (첫 권역은 도심)
+    centres = [CITY_CENTRE]
+    for _ in range(n_clusters - 1):
+        angle, dist = rnd.uniform(0, 2 * math.pi), rnd.uniform(0.3, 1.0) * spread
+        centres.append((CITY_CENTRE[0] + dist * math.sin(angle), CITY_CENTRE[1] + dist * math.cos(angle)))
+    return centres
+
+def jittered_time(rnd, time_str, step=30):
+    # "HH:MM" 을 -step ~ +step 분 범위에서 step 단위로 흔듦 (0:00 ~ 23:59 안으로 제한)
+    hour, minute = map(int, time_str.split(":"))
+    minutes = min(1439, max(0, hour * 60 + minute + rnd.choice((-step, 0, step))))
+    return minutes_to_time_str(minutes)
+
+def generate_places(n, seed=0, n_clusters=4, mandatory=3, cluster_radius=0.03):
+    """
+    숙소(시작/종료) 2곳 + 방문 후보 n 곳의 장소 목록을 만듭니다 (같은 seed 면 같은 결과).
+    - 후보는 도심 주변 n_clusters 개 권역에 정규분포로 모이고, 분류 비율은 CATEGORY_PROFILES 를 따릅니다.
+    - 영업/휴식 시간은 분류별 후보에서 고른 뒤 30분 단위로 흔듭니다.
+    - 식당이 아닌 앞쪽 mandatory 곳만 필수 장소이고 나머지는 선택 장소입니다.
+    """
+    rnd = random.Random(seed)
+    centres = cluster_centres(rnd, n_clusters)
+    categories = list(CATEGORY_PROFILES)
+    weights = [CATEGORY_PROFILES[c][0] for c in categories]
+
+    hotel_x, hotel_y = CITY_CENTRE[0] + rnd.gauss(0, 0.01), CITY_CENTRE[1] + rnd.gauss(0, 0.01)
+    hotel = {"id": 0, "name": "숙소", "x_cord": round(hotel_x, 6), "y_cord": round(hotel_y, 6),
+             "category": "accommodation", "open_time": "15:00", "close_time": "23:00", "service_time": 0,
+             "tags": ["숙소"], "휴무일": [], "break_time": []}
+
+    places, n_mandatory = [hotel], 0
+    for i in range(n):
+        category = rnd.choices(categories, weights)[0]
+        _, hours, service_times = CATEGORY_PROFILES[category]
+        open_time, close_time, break_time = rnd.choice(hours)
+        if close_time != "23:59":
+            open_time, close_time = jittered_time(rnd, open_time), jittered_time(rnd, close_time)
+        cx, cy = rnd.choice(centres)
+        place = {
+            "id": i + 1,
+            "name": f"{category} {i + 1}",
+            "x_cord": round(cx + rnd.gauss(0, cluster_radius), 6),
+            "y_cord": round(cy + rnd.gauss(0, cluster_radius), 6),
+            "category": category,
+            "open_time": open_time,
+            "close_time": close_time,
+            "service_time": rnd.choice(service_times),
+            "tags": [category],
+            "휴무일": [],
+            "break_time": list(break_time),
+        }
+        if category != "restaurant":
+            place["is_mandatory"] = n_mandatory < mandatory
+            n_mandatory += place["is_mandatory"]
+        places.append(place)
+    places.append({**hotel, "id": n + 1})
+    return places
+
+def generate_scenario(n, seed=0, **kwargs):
+    # tests/scenarios 의 JSON 과 같은 {"places", "user", "day_info"} 형태 (중간 여행일)
+    return {"places": generate_places(n, seed, **kwargs), "user": dict(USER), "day_info": dict(DAY_INFO)}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="합성 시나리오 JSON 생성")
+    parser.add_argument('n', type=int, help='방문 후보 장소 수')
+    parser.add_argument('output', help='저장할 JSON 파일')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--clusters', type=int, default=4)
+    parser.add_argument('--mandatory', type=int, default=3)
+    args = parser.parse_args()
+
+    scenario = generate_scenario(args.n, args.seed, n_clusters=args.clusters, mandatory=args.mandatory)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(scenario, f, ensure_ascii=False, indent=2)
+    print(f"[INFO] 장소 {len(scenario['places'])}곳을 {args.output} 에 저장했습니다.")
@@ -0,0 +1,23 @@
+import argparse
+from solver.service import SolverService, create_server
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="경로 최적화 서비스")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-pending', type=int, default=64)
+    parser.add_argument('--deadline', type=float, default=10)
+    parser.add_argument('--catalog', default=None, help='compile_catalog 로 만든 장소 카탈로그 디렉터리')
+    parser.add_argument('--telemetry', default=None, help='요청별 계측 기록(JSON lines) 파일')
+    args = parser.parse_args()
+
+    service = SolverService(max_workers=args.workers, max_pending=args.max_pending, default_deadline=args.deadline,
+                            catalog_path=args.catalog, telemetry_path=args.telemetry)
+    server = create_server(service, args.host, args.port)
+    print(f"[INFO] 서비스 시작: http://{args.host}:{args.port}/solve")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.shutdown()
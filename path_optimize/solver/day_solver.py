@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from solver.routing_solver import run_model
+from solver.utils.matrix_cache import get_matrix_cache
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.feasibility import check_day
+from solver.utils.places import split_restaurant_nodes, group_meal_nodes, enumerate_meal_selections, select_nodes
+
+def solve_selection(sel, places, wins, day_info, user, matrix_cache_path=None, config=None):
+    # 워커 프로세스에서 실행 (OR-Tools 모델은 pickle 불가 → 순수 데이터로부터 모델을 다시 생성)
+    matrix_cache = get_matrix_cache(matrix_cache_path) if matrix_cache_path else None
+    route, obj = run_model(places, wins, day_info, user, provider=matrix_cache, config=config)
+    if matrix_cache is not None:
+        matrix_cache.flush()
+    return sel, route, obj
+
+def build_selection_jobs(places, day_info, user):
+    # 식사 조합별로 run_model 에 넘길 (장소, 윈도우) 를 준비
+    eff_windows = calculate_effective_time_windows(places, user)
+    new_places, new_wins = split_restaurant_nodes(places, eff_windows)
+    selections = enumerate_meal_selections(group_meal_nodes(new_places, new_wins))
+
+    jobs = []
+    for sel in selections:
+        selected_places, selected_wins = select_nodes(new_places, new_wins, sel)
+        jobs.append((sel, selected_places, selected_wins))
+    return jobs, new_wins
+
+def run_jobs(jobs, day_info, user, max_workers=None, matrix_cache_path=None, config=None):
+    # 조합이 하나뿐이거나 max_workers == 1 이면 프로세스 풀 없이 바로 실행
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(jobs))
+
+    results = {}
+    if max_workers <= 1:
+        for sel, selected_places, selected_wins in jobs:
+            _, route, obj = solve_selection(sel, selected_places, selected_wins, day_info, user, matrix_cache_path, config)
+            results[sel] = (route, obj)
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(solve_selection, sel, selected_places, selected_wins, day_info, user, matrix_cache_path, config)
+                   for sel, selected_places, selected_wins in jobs]
+        for future in as_completed(futures):
+            sel, route, obj = future.result()
+            results[sel] = (route, obj)
+    return results
+
+def solve_day(places, day_info, user, max_workers=None, matrix_cache_path=None, config=None, precheck=False):
+    """
+    하루 일정의 모든 식사 조합을 프로세스 풀로 병렬 계산합니다.
+    - 반환값: {"best": 최소 objective 조합 또는 None, "alternatives": 조합 순서대로 정렬된 전체 결과}
+    - 각 결과: {"selection", "meals", "objective", "route"} (해결 불가 조합은 route/objective 가 None)
+    - matrix_cache_path 가 주어지면 워커마다 해당 경로의 이동시간 캐시를 사용합니다.
+    - config(SolverConfig)는 모든 조합의 run_model 에 그대로 전달됩니다.
+    - precheck 이면 check_day 로 먼저 검사하고, 불가능한 일정은 solver 없이 {"best": None, "alternatives": [], "errors": [...]} 를 반환합니다.
+    """
+    if precheck:
+        check = check_day(places, day_info, user)
+        if not check["feasible"]:
+            return {"best": None, "alternatives": [], "errors": check["errors"]}
+
+    jobs, wins = build_selection_jobs(places, day_info, user)
+    results = run_jobs(jobs, day_info, user, max_workers, matrix_cache_path, config)
+
+    alternatives = []
+    for sel, _, _ in jobs:
+        route, obj = results[sel]
+        alternatives.append({
+            "selection": sel,
+            "meals": tuple(wins[i][2] for i in sel),
+            "objective": obj if route else None,
+            "route": route if route else None,
+        })
+
+    feasible = [alt for alt in alternatives if alt["route"]]
+    best = min(feasible, key=lambda alt: alt["objective"]) if feasible else None
+    return {"best": best, "alternatives": alternatives}
@@ -0,0 +1,100 @@
+from solver.utils.format import format_route
+from solver.utils.feasibility import visit_window
+
+# add_time_constraints 의 AddDimension(slack_max=1000) 과 같은 최대 대기 시간
+MAX_WAIT = 1000
+
+def add_label(labels, label):
+    # (비용, 시각) 기준 파레토 최적 레이블만 유지 (둘 다 작거나 같은 레이블이 있으면 버림)
+    cost, time = label[0], label[1]
+    for other in labels:
+        if other[0] <= cost and other[1] <= time:
+            return
+    labels[:] = [other for other in labels if not (cost <= other[0] and time <= other[1])]
+    labels.append(label)
+
+def arrive(depart, lo, hi):
+    # depart 에 출발해 [lo, hi] 윈도우 노드에 도착하는 시각, 불가능하면 None
+    arrival = max(lo, depart)
+    if arrival > hi or arrival - depart > MAX_WAIT:
+        return None
+    return arrival
+
+def solve_exact(places, eff_wins, start_idx, end_idx, gs, ge, transit, dist_mat, svc_times, meal_groups=None, penalty=1000,
+                meal_penalty=1000):
+    """
+    run_model 과 같은 모델(이동+체류 비용, 시간 윈도우, 필수/선택/식사 disjunction)을
+    부분집합 동적 계획법(Held-Karp)으로 정확히 풉니다. 방문 후보가 적은 날에만 사용합니다.
+    - transit: build_transit_matrix 결과 (더미 노드 행/열 0)
+    - 윈도우가 빈 선택 노드는 run_model 이 두 경로 앞에서 drop_empty_windows 로 빼므로 OR-Tools 와 같은 입력을 풉니다.
+    - 상태 (방문 집합, 마지막 노드) 마다 (비용, 도착 시각) 파레토 레이블을 유지합니다.
+    - penalty: 선택 장소를 빼는 패널티, meal_penalty: 식사 그룹을 모두 거르는 패널티 (run_model 이 routing_solver.meal_penalty 로 전달)
+    - 반환값: extract_solution 과 같은 (경로, objective), 해가 없으면 (None, None)
+    """
+    candidates = [i for i in range(len(places)) if i not in (start_idx, end_idx)]
+    bit = {node: 1 << k for k, node in enumerate(candidates)}
+    windows = {node: visit_window(eff_wins[node], gs, ge) for node in candidates}
+
+    group_masks = [sum(bit[i] for i in indices) for indices in (meal_groups or {}).values()]
+    meal_mask = 0
+    for mask in group_masks:
+        meal_mask |= mask
+    mandatory_mask, optional_bits = 0, []
+    for node in candidates:
+        if bit[node] & meal_mask:
+            continue
+        if places[node].get('is_mandatory', True):
+            mandatory_mask |= bit[node]
+        else:
+            optional_bits.append(bit[node])
+    group_of = {node: mask for mask in group_masks for node in candidates if bit[node] & mask}
+
+    def penalties(mask):
+        skipped_meals = sum(1 for g in group_masks if not mask & g)
+        return penalty * sum(1 for b in optional_bits if not mask & b) + meal_penalty * skipped_meals
+
+    # 레이블: (비용, 도착 시각, 노드, 이전 레이블)
+    states = {}
+    for node in candidates:
+        arrival = arrive(gs + transit[start_idx][node], *windows[node])
+        if arrival is not None:
+            states.setdefault((bit[node], node), []).append((transit[start_idx][node], arrival, node, None))
+
+    # 아무 곳도 방문하지 않는 경로: OR-Tools 와 같이 사용하지 않은 차량의 아크 비용은 0
+    best = None
+    if not mandatory_mask and gs + transit[start_idx][end_idx] <= ge:
+        best = (penalties(0), None, gs + transit[start_idx][end_idx])
+
+    for mask in range(1, 1 << len(candidates)):
+        for last in candidates:
+            labels = states.get((mask, last))
+            if not labels:
+                continue
+            for label in labels:
+                cost, time = label[0], label[1]
+                end_time = time + transit[last][end_idx]
+                if mask & mandatory_mask == mandatory_mask and end_time <= ge:
+                    total = cost + transit[last][end_idx] + penalties(mask)
+                    if best is None or total < best[0]:
+                        best = (total, label, end_time)
+
+                for node in candidates:
+                    if mask & bit[node] or mask & group_of.get(node, 0):
+                        continue
+                    arrival = arrive(time + transit[last][node], *windows[node])
+                    if arrival is None:
+                        continue
+                    add_label(states.setdefault((mask | bit[node], node), []),
+                              (cost + transit[last][node], arrival, node, label))
+
+    if best is None:
+        return None, None
+
+    total, label, end_time = best
+    visits = [(end_idx, end_time)]
+    while label is not None:
+        visits.append((label[2], label[1]))
+        label = label[3]
+    visits.append((start_idx, gs))
+    visits.reverse()
+    return format_route(visits, svc_times, places, dist_mat), int(total)
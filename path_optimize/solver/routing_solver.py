@@ -1,17 +1,38 @@
-import pprint
-from ortools.constraint_solver import pywrapcp, routing_enums_pb2
+import time
+import numpy as np
+from ortools.constraint_solver import pywrapcp
 
 from solver.utils.time import time_to_minutes
-from solver.utils.format import format_visit_info
-from solver.utils.distance import create_distance_matrix
-from solver.utils.places import determine_start_end_indices
-from solver.utils.routing import is_dummy_node, add_dummy_node
+from solver.utils.format import format_route
+from solver.solver_config import SolverConfig, add_early_stopping
+from solver.utils.travel_time import HaversineProvider
+from solver.utils.solution_cache import problem_fingerprint
+from solver.utils.places import determine_start_end_indices, group_meal_nodes
+from solver.utils.routing import is_dummy_node, add_dummy_node, route_place_ids, map_route_to_nodes
+from solver.utils.spatial import prune_places
+from solver.utils.feasibility import visit_window, drop_empty_windows
+from solver.exact_solver import solve_exact
+from solver.utils.telemetry import SolveTrace
 
 def create_routing_model(n, start_idx, end_idx):
     mgr = pywrapcp.RoutingIndexManager(n, 1, [start_idx], [end_idx])
     return mgr, pywrapcp.RoutingModel(mgr)
 
+def build_transit_matrix(matrix, service_times, places):
+    # 이동시간 + 출발 노드의 서비스 시간 (더미 노드의 행/열은 0)
+    transit = np.asarray(matrix, dtype=np.int64) + np.asarray(service_times, dtype=np.int64)[:, None]
+    dummy = [i for i, p in enumerate(places) if is_dummy_node(p['name'])]
+    transit[dummy, :] = 0
+    transit[:, dummy] = 0
+    return transit
+
 def register_transit(routing, mgr, matrix, service_times, places):
+    # 미리 계산한 행렬을 네이티브로 등록 → 탐색 중 파이썬 콜백 호출이 없음
+    transit = build_transit_matrix(matrix, service_times, places)
+    return routing.RegisterTransitMatrix(transit.tolist())
+
+def register_transit_callback(routing, mgr, matrix, service_times, places):
+    # 아크마다 파이썬 콜백을 호출하는 기존 방식 (벤치마크 비교용)
     def cb(i, j):
         u = mgr.IndexToNode(i)
         v = mgr.IndexToNode(j)
@@ -20,114 +41,246 @@ def register_transit(routing, mgr, matrix, service_times, places):
         return matrix[u][v] + service_times[u]
     return routing.RegisterTransitCallback(cb)
 
+def add_optional_disjunctions(routing, mgr, places, start_idx, end_idx, skip=()):
+    # 필수가 아닌 장소는 방문하지 않을 수 있도록 패널티를 설정
+    for i, p in enumerate(places):
+        if i in (start_idx, end_idx) or i in skip:
+            continue
+        if not p.get('is_mandatory', True):
+            routing.AddDisjunction([mgr.NodeToIndex(i)], 1000)
+
+def meal_penalty(places, gs, ge, optional_penalty=1000):
+    # 식사를 거르는 패널티: 선택 장소를 모두 빼고 하루 전체(ge - gs)를 이동하는 비용보다 커서 가능한 한 식사를 방문
+    return optional_penalty * len(places) + (ge - gs) + 1
+
+def add_meal_disjunctions(routing, mgr, meal_groups, penalty):
+    # 식사 타입마다 분할된 식당 노드 중 최대 하나만 방문 (아무 곳도 방문하지 않으면 meal_penalty)
+    for indices in meal_groups.values():
+        routing.AddDisjunction([mgr.NodeToIndex(i) for i in indices], penalty, 1)
+
 def add_time_constraints(routing, cb_idx, gs, ge, wins, mgr, start_idx, end_idx):
     routing.AddDimension(cb_idx, 1000, ge, False, "Time")
     td = routing.GetMutableDimension("Time")
     td.CumulVar(routing.Start(0)).SetRange(gs, gs)
     td.CumulVar(routing.End(0)).SetRange(0, ge)
-    for i, (o, c, _) in enumerate(wins):
+    for i, win in enumerate(wins):
         if i in (start_idx, end_idx):
             continue
         idx = mgr.NodeToIndex(i)
-        lo, hi = max(gs, o-10), min(ge, c+10)
+        lo, hi = visit_window(win, gs, ge)
         td.CumulVar(idx).SetRange(lo, hi)
         td.SetCumulVarSoftUpperBound(idx, hi, 10)
     return td
 
-def extract_solution(routing, mgr, sol, svc, td, places, dist_mat):
-    res = []
-    idx = routing.Start(0)
-    order = 1
-    prev_node = None
-    prev_departure = None
-
-    while not routing.IsEnd(idx):
-        node = mgr.IndexToNode(idx)
-        name = places[node]['name']
-        if not is_dummy_node(name):
-            arrival = sol.Value(td.CumulVar(idx))
-            stay = svc[node]
-            travel_minutes = None
-            wait_minutes = None
-            delay_minutes = None
-
-            if prev_node is not None:
-                travel_minutes = dist_mat[prev_node][node]
-                expected_arrival = prev_departure + travel_minutes
-                gap = arrival - expected_arrival
-
-                if gap >= 0:
-                    wait_minutes = gap
-                    delay_minutes = None
-                else:
-                    wait_minutes = None
-                    delay_minutes = -gap
-
-            res.append(format_visit_info(order, node, arrival, stay, places, travel_minutes, wait_minutes, delay_minutes))
-            order += 1
-            prev_node = node
-            prev_departure = arrival + stay
+def extract_solution(routing, mgr, sol, svc, td, places, dist_mat, vehicle=0, offset=0):
+    # offset: 여러 날을 하나의 시간축에 놓은 경우 해당 날의 시작 분 (표시용 시간에서 뺌)
+    visits = []
+    idx = routing.Start(vehicle)
+    while True:
+        visits.append((mgr.IndexToNode(idx), sol.Value(td.CumulVar(idx)) - offset))
+        if routing.IsEnd(idx):
+            break
         idx = sol.Value(routing.NextVar(idx))
+    return format_route(visits, svc, places, dist_mat), sol.ObjectiveValue()
 
-    node = mgr.IndexToNode(idx)
-    name = places[node]['name']
-    if not is_dummy_node(name):
-        arrival = sol.Value(td.CumulVar(idx))
-        travel_minutes = dist_mat[prev_node][node] if prev_node is not None else None
-        wait_minutes = max(0, arrival - (prev_departure + travel_minutes)) if travel_minutes is not None else None
-        res.append(format_visit_info(order, node, arrival, 0, places, travel_minutes, wait_minutes))
+def read_initial_assignment(routing, mgr, params, place_ids, places, start_idx, end_idx):
+    # 이전 경로를 현재 모델의 초기 해로 변환 (제약을 만족하지 못하면 None)
+    nodes = map_route_to_nodes(place_ids, places, start_idx, end_idx)
+    routing.CloseModelWithParameters(params)
+    return routing.ReadAssignmentFromRoutes([[mgr.NodeToIndex(i) for i in nodes]], True)
 
-    return res, sol.ObjectiveValue()
+def sparse_successors(matrix, k, places):
+    """
+    노드마다 이동할 수 있는 다음 노드를 (n, n) bool 배열로 반환합니다.
+    - 이동시간이 가장 짧은 k 개 노드, j 가 i 의 이웃이면 i 도 j 의 이웃 (들어오는 아크도 k 개 이상)
+    - 더미 노드와는 항상 연결됩니다.
+    """
+    n = len(places)
+    dist = np.array(matrix, dtype=np.float64)
+    np.fill_diagonal(dist, np.inf)
+    k = min(k, n - 1)
+    allowed = np.zeros((n, n), dtype=bool)
+    if k > 0:
+        nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        allowed[np.arange(n)[:, None], nearest] = True
+    allowed |= allowed.T
+    dummy = [i for i, p in enumerate(places) if is_dummy_node(p['name'])]
+    allowed[dummy, :] = True
+    allowed[:, dummy] = True
+    np.fill_diagonal(allowed, False)
+    return allowed
 
-def run_model(places, eff_wins, day_info, user):
+def restrict_successors(routing, mgr, allowed, start_idx, end_idx):
+    # NextVar 도메인을 허용된 다음 노드 + 종료 노드 + 자기 자신(방문하지 않는 경우)으로 제한
+    end = routing.End(0)
+    for i in range(len(allowed)):
+        if i == end_idx:
+            continue
+        idx = mgr.NodeToIndex(i)
+        values = [mgr.NodeToIndex(j) for j in np.flatnonzero(allowed[i]).tolist() if j not in (start_idx, end_idx)]
+        values.append(end)
+        if i != start_idx:
+            values.append(idx)
+        routing.NextVar(idx).SetValues(values)
+
+def solve_routing_model(places, eff_wins, start_idx, end_idx, gs, ge, dist_arr, svc_times, meal_groups, config,
+                        initial_route=None, neighbors=None, trace=None):
+    # run_model 의 모델 생성 ~ 실행 단계, 반환값: (routing, mgr, sol, td)
+    if trace is None:
+        trace = SolveTrace()
+
+    # 6. 라우팅 모델 생성 mgr: manager, routing: routing model
+    with trace.phase("6_model"):
+        n = len(places)
+        mgr, routing = create_routing_model(n, start_idx, end_idx)
+    
+    # 7. 라우팅 모델에 거리 행렬 설정
+    with trace.phase("7_transit"):
+        cb_idx = register_transit(routing, mgr, dist_arr, svc_times, places)
+    
+    # 8. 서비스 시간 설정
+    with trace.phase("8_arc_cost"):
+        routing.SetArcCostEvaluatorOfAllVehicles(cb_idx)
+    
+    # 9. 필수 장소 설정 (필수 장소에 대한 패널티 설정, 식사 그룹은 그룹 단위로 설정)
+    with trace.phase("9_disjunctions"):
+        meal_nodes = set()
+        if meal_groups:
+            add_meal_disjunctions(routing, mgr, meal_groups, meal_penalty(places, gs, ge))
+            meal_nodes = {i for indices in meal_groups.values() for i in indices}
+        add_optional_disjunctions(routing, mgr, places, start_idx, end_idx, skip=meal_nodes)
+
+    # 10. 시간 제약 조건 설정 (유효 시간 윈도우)
+    with trace.phase("10_time_windows"):
+        td = add_time_constraints(routing, cb_idx, gs, ge, eff_wins, mgr, start_idx, end_idx)
+
+    # 10-1. 희소 모델: 각 노드에서 가까운 neighbors 개 노드로만 이동
+    if neighbors:
+        with trace.phase("10-1_sparse_arcs"):
+            restrict_successors(routing, mgr, sparse_successors(dist_arr, neighbors, places), start_idx, end_idx)
+
+    # 11. 라우팅 모델에 대한 파라미터 설정 (config 미지정 시 AUTOMATIC, 10초)
+    with trace.phase("11_search_parameters"):
+        params = config.search_parameters(n)
+        if config.no_improvement_window:
+            add_early_stopping(routing, config.no_improvement_window)
+        trace.watch_search(routing)
+    
+    # 12. 라우팅 모델 실행 (initial_route 가 있으면 이전 경로에서 시작, 실패 시 처음부터)
+    with trace.phase("12_search"):
+        trace.start_search()
+        sol = None
+        if initial_route:
+            initial = read_initial_assignment(routing, mgr, params, initial_route, places, start_idx, end_idx)
+            if initial:
+                sol = routing.SolveFromAssignmentWithParameters(initial, params)
+        if not sol:
+            sol = routing.SolveWithParameters(params)
+        trace.end_search(routing)
+    return routing, mgr, sol, td
+
+def run_model(places, eff_wins, day_info, user, meal_groups=None, provider=None, config=None, initial_route=None,
+              solution_cache=None, pruner=None, trace=None):
+    # trace(SolveTrace): 단계별 시간과 탐색 통계, 디버그 메시지를 기록 (호출한 쪽에서 export)
+    if trace is None:
+        trace = SolveTrace()
 
     # 1. 시작 노드 종료 노드 결정
-    start_idx, end_idx = determine_start_end_indices(places, day_info)
+    with trace.phase("1_start_end"):
+        start_idx, end_idx = determine_start_end_indices(places, day_info)
+
+    # 1-1. 시작/종료 노드에서 먼 선택 장소 제외 (pruner 지정 시, 이동시간 행렬 생성 전)
+    if pruner is not None:
+        with trace.phase("1-1_prune"):
+            places, eff_wins, start_idx, end_idx, meal_groups = prune_places(places, eff_wins, start_idx, end_idx, meal_groups, pruner)
     
     # 2. 유효 시간 윈도우 결정 gs:global start, ge:global end
     gs, ge = time_to_minutes(user['start_time']), time_to_minutes(user['end_time'])
 
+    # 2-1. 윈도우가 빈 선택 장소/식당 노드 제외 (탐색과 동적 계획법이 같은 입력을 풀도록 두 경로 앞에서 처리)
+    with trace.phase("2-1_empty_windows"):
+        places, eff_wins, start_idx, end_idx, meal_groups = drop_empty_windows(places, eff_wins, start_idx, end_idx,
+                                                                                meal_groups, gs, ge)
+
     # 3. 더미 노드 추가 (종료, 시작 노드가 없을 시 경로계산이 되도록 설정)
     if end_idx is None: 
-        print("[DEBUG] 종료 노드가 없습니다. 더미 노드를 추가합니다.")
+        trace.event("종료 노드가 없습니다. 더미 노드를 추가합니다.")
         end_idx = add_dummy_node(places, eff_wins, 'end', gs, ge)
     if start_idx is None:
-        print("[DEBUG] 시작 노드가 없습니다. 더미 노드를 추가합니다.")
+        trace.event("시작 노드가 없습니다. 더미 노드를 추가합니다.")
         start_idx = add_dummy_node(places, eff_wins, 'start', gs, ge)
 
-    # 4. 거리 행렬 생성 (이후 실제 이동시간으로 대체)
-    dist_mat = create_distance_matrix(places)
+    if provider is None:
+        provider = HaversineProvider()
+    if config is None:
+        config = SolverConfig()
+
+    # 3-1. 같은 문제를 이미 풀었으면 캐시된 결과를 반환 (이전 경로로 다시 푸는 경우 제외)
+    cache_key = None
+    if solution_cache is not None and not initial_route:
+        with trace.phase("3-1_solution_cache"):
+            cache_key = problem_fingerprint(places, eff_wins, start_idx, end_idx, day_info, user, config, meal_groups, provider)
+            cached = solution_cache.get(cache_key)
+        if cached is not None:
+            trace.finish("cached", cached[1])
+            return cached
+    t0 = time.perf_counter()
+
+    # 4. 이동시간 행렬 생성 (provider 미지정 시 하버사인 거리)
+    with trace.phase("4_matrix"):
+        dist_arr = provider.matrix(places)
+        dist_mat = dist_arr.tolist()
     
     # 5. 서비스 시간 설정 
     svc_times = [p.get('service_time', 0) for p in places]
     
-    # 6. 라우팅 모델 생성 mgr: manager, routing: routing model
-    n = len(places)
-    mgr, routing = create_routing_model(n, start_idx, end_idx)
-    
-    # 7. 라우팅 모델에 거리 행렬 설정
-    cb_idx = register_transit(routing, mgr, dist_mat, svc_times, places)
-    
-    # 8. 서비스 시간 설정
-    routing.SetArcCostEvaluatorOfAllVehicles(cb_idx)
-    
-    # 9. 필수 장소 설정 (필수 장소에 대한 패널티 설정)
-    for i, p in enumerate(places):
-        if i not in (start_idx, end_idx) and not p.get('is_mandatory', True):
-            routing.AddDisjunction([mgr.NodeToIndex(i)], 1000)
+    # 5-1. 방문 후보가 config.exact_threshold 개 이하면 OR-Tools 대신 동적 계획법으로 최적해 계산
+    if config.exact_threshold is not None and len(places) - len({start_idx, end_idx}) <= config.exact_threshold:
+        with trace.phase("5-1_exact"):
+            transit = build_transit_matrix(dist_arr, svc_times, places).tolist()
+            result = solve_exact(places, eff_wins, start_idx, end_idx, gs, ge, transit, dist_mat, svc_times, meal_groups,
+                                 meal_penalty=meal_penalty(places, gs, ge))
+        status = "exact"
+    else:
+        # 6 ~ 12. 라우팅 모델 생성 및 실행 (config.sparse_neighbors 면 희소 모델을 먼저 풀고, 해가 없으면 전체 모델로 다시 풂)
+        routing, mgr, sol, td = solve_routing_model(places, eff_wins, start_idx, end_idx, gs, ge, dist_arr, svc_times,
+                                                    meal_groups, config, initial_route, config.sparse_neighbors, trace)
+        if not sol and config.sparse_neighbors:
+            trace.event("희소 모델에서 해를 찾지 못했습니다. 전체 모델로 다시 풉니다.")
+            routing, mgr, sol, td = solve_routing_model(places, eff_wins, start_idx, end_idx, gs, ge, dist_arr, svc_times,
+                                                        meal_groups, config, initial_route, trace=trace)
+        with trace.phase("extract"):
+            result = extract_solution(routing, mgr, sol, svc_times, td, places, dist_mat) if sol else (None, None)
+        status = "ok"
 
-    # 10. 시간 제약 조건 설정 (유효 시간 윈도우)
-    td = add_time_constraints(routing, cb_idx, gs, ge, eff_wins, mgr, start_idx, end_idx)
+    if result[0] is None:
+        trace.event("솔루션을 찾지 못했습니다.")
+        status = "infeasible"
+    trace.finish(status, result[1])
 
-    # 11. 라우팅 모델에 대한 파라미터 설정
-    params = pywrapcp.DefaultRoutingSearchParameters()
-    params.first_solution_strategy = routing_enums_pb2.FirstSolutionStrategy.AUTOMATIC
-    params.time_limit.seconds = 10
-    
-    # 12. 라우팅 모델 실행 
-    sol = routing.SolveWithParameters(params)
+    if cache_key is not None:
+        solution_cache.put(cache_key, result[0], result[1], time.perf_counter() - t0)
+    return result
+
+def run_meal_choice_model(places, eff_wins, day_info, user, provider=None, config=None, solution_cache=None, pruner=None,
+                          trace=None):
+    """
+    split_restaurant_nodes 로 분할된 모든 식당 노드를 하나의 모델에 넣고,
+    식사 타입마다 하나의 식당만 고르도록 disjunction 을 걸어 한 번에 풉니다.
+    - 식사 조합을 itertools.product 로 나열해 조합마다 run_model 을 호출하는 방식을 대체합니다.
+    - 반환값은 run_model 과 동일합니다.
+    """
+    meal_groups = group_meal_nodes(places, eff_wins)
+    return run_model(places, eff_wins, day_info, user, meal_groups=meal_groups, provider=provider, config=config,
+                     solution_cache=solution_cache, pruner=pruner, trace=trace)
 
-    if sol:
-        return extract_solution(routing, mgr, sol, svc_times, td, places, dist_mat)
-    pprint.pprint("[DEBUG] 솔루션을 찾지 못했습니다.")
-    return None, None
\ No newline at end of file
+def reoptimize_model(places, eff_wins, day_info, user, previous_route, meal_groups=None, provider=None, config=None,
+                     trace=None):
+    """
+    사용자가 일정을 수정했을 때 이전 경로를 초기 해로 사용해 다시 최적화합니다.
+    - previous_route: extract_solution 결과 또는 방문 순서대로의 장소 id 목록
+    - 이전 경로의 장소는 id 로 현재 노드 인덱스에 매핑되며, 빠진 장소는 건너뜁니다.
+    - 이전 경로가 새 제약을 만족하지 못하면 처음부터 풉니다. 반환값은 run_model 과 동일합니다.
+    """
+    return run_model(places, eff_wins, day_info, user, meal_groups=meal_groups, provider=provider,
+                     config=config, initial_route=route_place_ids(previous_route), trace=trace)
@@ -0,0 +1,187 @@
+import json
+import time
+import hashlib
+import threading
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from solver.solver_config import ADAPTIVE_CONFIG
+from solver.routing_solver import run_meal_choice_model
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.places import split_restaurant_nodes
+from solver.utils.catalog import open_catalog
+from solver.utils.telemetry import SolveTrace, JsonLinesExporter, PrometheusExporter
+
+class ServiceBusyError(RuntimeError):
+    # 대기열이 가득 차서 요청을 받을 수 없음
+    pass
+
+def request_key(request):
+    # places(또는 place_ids) / user / day_info 가 같은 요청은 같은 키 (dict 키 순서와 무관)
+    payload = {k: request.get(k) for k in ("places", "place_ids", "user", "day_info")}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def request_places(request, catalog_path=None):
+    # places 가 없으면 place_ids 를 카탈로그(워커마다 한 번 mmap)에서 조회
+    if "places" in request or not catalog_path:
+        return request["places"]
+    return open_catalog(catalog_path).places(request["place_ids"])
+
+def remaining_budget(expires_at, margin):
+    # 마감 시각(time.monotonic 기준)까지 남은 시간에서 margin 을 뺀 탐색 시간(초), 이미 지났으면 TimeoutError
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise FutureTimeoutError("대기열에서 마감 시간이 지났습니다.")
+    return max(0.1, remaining - margin)
+
+def solve_request(request, expires_at, margin=0.5, catalog_path=None, config=ADAPTIVE_CONFIG):
+    # 워커 프로세스에서 실행: 식사 조합을 하나의 모델로 풀어 마감 시간 안에 한 번만 탐색
+    # - 탐색 시간은 대기열에서 기다린 시간을 뺀, 워커가 시작할 때 남은 시간으로 정함
+    # telemetry: SolveTrace.record() (서비스가 수집 후 HTTP 응답에서는 제외)
+    config = dataclasses.replace(config, time_limit=remaining_budget(expires_at, margin))
+    trace = SolveTrace(places=len(request.get("places") or request.get("place_ids") or []))
+    places, user, day_info = request_places(request, catalog_path), request["user"], request.get("day_info", {})
+    with trace.phase("0_windows"):
+        eff_windows = calculate_effective_time_windows(places, user)
+        new_places, new_wins = split_restaurant_nodes(places, eff_windows)
+    route, obj = run_meal_choice_model(new_places, new_wins, day_info, user, config=config, trace=trace)
+    return {"objective": obj, "route": route, "telemetry": trace.record()}
+
+class SolverService:
+    """
+    run_model 을 감싸는 상주 서비스입니다.
+    - 프로세스 풀(max_workers)에서 풀고, 처리 중 + 대기 요청이 max_pending 개를 넘으면 ServiceBusyError 를 냅니다.
+    - 같은 요청(request_key)이 처리 중이면 새로 풀지 않고 같은 Future 를 돌려줍니다.
+    - deadline(초)은 제출 시각 기준 마감 시각으로 바꿔 워커에 넘기고, 워커가 시작할 때 남은 시간에서 margin 을 뺀 값을
+      config(기본 ADAPTIVE_CONFIG)의 time_limit 으로 사용합니다.
+    - catalog_path 가 있으면 요청에 places 대신 place_ids 를 보낼 수 있습니다.
+    - 완료된 요청의 telemetry 는 metrics(PrometheusExporter)에 누적하고, telemetry_path 가 있으면 JSON lines 로 기록합니다.
+    """
+
+    def __init__(self, max_workers=None, max_pending=64, default_deadline=10, margin=0.5, executor=None, catalog_path=None,
+                 telemetry_path=None, config=ADAPTIVE_CONFIG):
+        self.default_deadline = default_deadline
+        self.margin = margin
+        self.config = config
+        self.catalog_path = catalog_path
+        self.metrics = PrometheusExporter()
+        self._exporters = [self.metrics] + ([JsonLinesExporter(telemetry_path)] if telemetry_path else [])
+        self._executor = executor or ProcessPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.stats = {"submitted": 0, "coalesced": 0, "rejected": 0, "completed": 0}
+
+    def check_deadline(self, deadline):
+        # None 이면 기본값, 0 이하면 ValueError (HTTP 400)
+        if deadline is None:
+            return self.default_deadline
+        if deadline <= 0:
+            raise ValueError("deadline 은 0보다 커야 합니다.")
+        return deadline
+
+    def submit(self, request, deadline=None, expires_at=None):
+        # expires_at(time.monotonic 기준)이 없으면 지금부터 deadline 초 뒤
+        if expires_at is None:
+            expires_at = time.monotonic() + self.check_deadline(deadline)
+        key = request_key(request)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return future
+            if not self._slots.acquire(blocking=False):
+                self.stats["rejected"] += 1
+                raise ServiceBusyError("대기 중인 요청이 너무 많습니다.")
+            try:
+                future = self._executor.submit(solve_request, request, expires_at, self.margin, self.catalog_path, self.config)
+            except Exception:
+                self._slots.release()
+                raise
+            self._inflight[key] = future
+            self.stats["submitted"] += 1
+        future.add_done_callback(lambda f: self._done(key, f))
+        return future
+
+    def _done(self, key, future):
+        with self._lock:
+            self._inflight.pop(key, None)
+            self.stats["completed"] += 1
+        self._slots.release()
+        if not future.cancelled() and future.exception() is None:
+            telemetry = future.result().get("telemetry")
+            if telemetry:
+                for exporter in self._exporters:
+                    exporter.export(telemetry)
+
+    def solve(self, request, deadline=None):
+        # 마감 시간이 지나면 아직 시작하지 않은 작업은 취소하고 concurrent.futures.TimeoutError
+        expires_at = time.monotonic() + self.check_deadline(deadline)
+        future = self.submit(request, expires_at=expires_at)
+        try:
+            return future.result(timeout=max(0.0, expires_at - time.monotonic()))
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    # POST /solve {"places" 또는 "place_ids", "user", "day_info", "deadline"?} → {"objective", "route"}, GET /stats, GET /metrics
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._send_text(200, self.server.service.metrics.render())
+            return
+        if self.path != "/stats":
+            self._send(404, {"error": "not found"})
+            return
+        self._send(200, self.server.service.stats)
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            if not isinstance(request, dict):
+                raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+            result = self.server.service.solve(request, request.get("deadline"))
+        except ServiceBusyError as e:
+            self._send(503, {"error": str(e)}, {"Retry-After": "1"})
+        except FutureTimeoutError:
+            self._send(504, {"error": "마감 시간 안에 경로를 계산하지 못했습니다."})
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            self._send(500, {"error": f"내부 오류: {e}"})
+        else:
+            self._send(200, {k: v for k, v in result.items() if k != "telemetry"})
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send_body(status, body, "application/json; charset=utf-8", headers)
+
+    def _send_text(self, status, text):
+        self._send_body(status, text.encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+
+    def _send_body(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def create_server(service, host="127.0.0.1", port=8080):
+    server = ThreadingHTTPServer((host, port), SolverRequestHandler)
+    server.service = service
+    return server
@@ -0,0 +1,74 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+from ortools.constraint_solver import pywrapcp, routing_enums_pb2
+
+@dataclass
+class SolverConfig:
+    """
+    run_model 의 탐색 설정입니다. 기본값은 기존 동작(AUTOMATIC, 10초)과 같습니다.
+    - first_solution_strategy / local_search_metaheuristic: routing_enums_pb2 의 이름 (예: "PATH_CHEAPEST_ARC", "GUIDED_LOCAL_SEARCH")
+    - time_limit: 최대 탐색 시간(초), adaptive_budget 이면 노드 수에 비례한 예산의 상한
+    - no_improvement_window: 첫 해 이후 이 시간(초) 동안 목적함수 개선이 없으면 탐색 종료
+    - sparse_neighbors: 각 노드에서 이동시간이 가장 짧은 k 개 노드로만 이동하는 희소 모델 (해가 없으면 전체 모델)
+    - exact_threshold: 방문 후보(시작/종료 제외)가 이 개수 이하면 탐색 대신 동적 계획법으로 최적해 계산
+    """
+    first_solution_strategy: str = "AUTOMATIC"
+    local_search_metaheuristic: str = "AUTOMATIC"
+    time_limit: float = 10
+    solution_limit: Optional[int] = None
+    lns_time_limit: Optional[float] = None
+    log_search: bool = False
+    adaptive_budget: bool = False
+    base_time: float = 0.2
+    time_per_node: float = 0.05
+    no_improvement_window: Optional[float] = None
+    sparse_neighbors: Optional[int] = None
+    exact_threshold: Optional[int] = None
+
+    def time_budget(self, n):
+        # 노드 수 n 에 대한 탐색 시간(초)
+        if not self.adaptive_budget:
+            return self.time_limit
+        return min(self.time_limit, self.base_time + self.time_per_node * n)
+
+    def search_parameters(self, n):
+        params = pywrapcp.DefaultRoutingSearchParameters()
+        params.first_solution_strategy = getattr(routing_enums_pb2.FirstSolutionStrategy, self.first_solution_strategy)
+        params.local_search_metaheuristic = getattr(routing_enums_pb2.LocalSearchMetaheuristic, self.local_search_metaheuristic)
+        params.time_limit.FromMilliseconds(int(self.time_budget(n) * 1000))
+        if self.solution_limit is not None:
+            params.solution_limit = self.solution_limit
+        if self.lns_time_limit is not None:
+            params.lns_time_limit.FromMilliseconds(int(self.lns_time_limit * 1000))
+        params.log_search = self.log_search
+        return params
+
+# 요청 경로용 설정: 노드 수에 비례한 예산 + 0.5초 동안 개선이 없으면 종료, 방문 후보 8곳 이하는 동적 계획법
+ADAPTIVE_CONFIG = SolverConfig(
+    first_solution_strategy="PATH_CHEAPEST_ARC",
+    local_search_metaheuristic="GUIDED_LOCAL_SEARCH",
+    adaptive_budget=True,
+    no_improvement_window=0.5,
+    exact_threshold=8,
+)
+
+def add_early_stopping(routing, window):
+    # 첫 해를 찾은 뒤 window 초 동안 더 좋은 해가 없으면 탐색을 멈추는 limit 을 추가
+    state = {"best": None, "since": None}
+
+    def on_solution():
+        obj = routing.CostVar().Value()
+        if state["best"] is None or obj < state["best"]:
+            state["best"] = obj
+            state["since"] = time.monotonic()
+
+    def stalled():
+        return state["since"] is not None and time.monotonic() - state["since"] > window
+
+    routing.AddAtSolutionCallback(on_solution)
+    limit = routing.solver().CustomLimit(stalled)
+    routing.AddSearchMonitor(limit)
+    # 파이썬 콜백이 탐색 중에 GC 되지 않도록 모델이 참조를 유지
+    routing._early_stop = limit
+    return limit
@@ -0,0 +1,174 @@
+from ortools.constraint_solver import pywrapcp
+
+from solver.solver_config import SolverConfig, add_early_stopping
+from solver.routing_solver import register_transit, add_meal_disjunctions, meal_penalty, extract_solution
+from solver.utils.time import time_to_minutes
+from solver.utils.travel_time import HaversineProvider
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.window_table import PlaceTimeTable
+from solver.utils.places import split_restaurant_nodes, determine_start_end_indices
+from solver.utils.routing import add_dummy_node
+from solver.utils.telemetry import SolveTrace
+
+# 날짜별 시간축 간격 (자정 넘김 보정으로 윈도우가 1440분을 넘어도 다른 날과 겹치지 않도록 48시간)
+DAY_MINUTES = 2880
+
+def day_anchors(day):
+    # 하루의 시작/종료 노드 결정 (기존 날짜별 핸들러로 검증)
+    anchors = day.get("places", [])
+    if not anchors:
+        return anchors, None, None
+    start_idx, end_idx = determine_start_end_indices(anchors, day["day_info"])
+    return anchors, start_idx, end_idx
+
+def build_shared_nodes(places, days):
+    """
+    여러 날에 배정할 장소 노드와 날짜별 시간 윈도우를 만듭니다.
+    - 식당이 아닌 장소: 노드 하나, {날짜: 윈도우}
+    - 식당: 날짜 x 식사 타입마다 노드 하나 (해당 날짜에만 방문 가능)
+    - 반환값: (노드 목록, 노드별 {날짜: (o, c)}, {(날짜, 식사): [노드]})
+    """
+    nodes, node_wins, meal_groups = [], [], {}
+    index_by_id = {}
+    # 영업 시간은 한 번만 파싱하고 날짜별 일정에 대해 벡터 연산으로 윈도우 계산
+    table = PlaceTimeTable(places)
+    for d, day in enumerate(days):
+        eff_windows = table.effective_windows(day["user"])
+        split_places, split_wins = split_restaurant_nodes(places, eff_windows)
+        for p, (o, c, meal) in zip(split_places, split_wins):
+            if o is None or o >= c:
+                continue
+            if p.get("category") == "restaurant":
+                nodes.append({**p, "day": d})
+                node_wins.append({d: (o, c)})
+                meal_groups.setdefault((d, meal), []).append(len(nodes) - 1)
+                continue
+            i = index_by_id.get(p["id"])
+            if i is None:
+                i = index_by_id[p["id"]] = len(nodes)
+                nodes.append(p)
+                node_wins.append({})
+            node_wins[i][d] = (o, c)
+
+    for p in places:
+        if p.get("category") != "restaurant" and p["id"] not in index_by_id and p.get("is_mandatory", True):
+            raise ValueError(f"장소 {p['name']}은(는) 여행 기간 중 방문 가능한 시간이 없습니다.")
+    return nodes, node_wins, meal_groups
+
+def add_trip_time_constraints(routing, cb_idx, mgr, days, day_bounds, node_wins, anchor_nodes):
+    # 날짜 d 의 시간은 d * DAY_MINUTES 만큼 밀어서 하나의 시간축에 배치
+    routing.AddDimension(cb_idx, 1000, len(days) * DAY_MINUTES, False, "Time")
+    td = routing.GetMutableDimension("Time")
+    for d, (gs, ge) in enumerate(day_bounds):
+        offset = d * DAY_MINUTES
+        td.CumulVar(routing.Start(d)).SetRange(offset + gs, offset + gs)
+        td.CumulVar(routing.End(d)).SetRange(offset, offset + ge)
+
+    for i, wins in enumerate(node_wins):
+        if i in anchor_nodes:
+            continue
+        idx = mgr.NodeToIndex(i)
+        ranges = []
+        for d, (o, c) in sorted(wins.items()):
+            gs, ge = day_bounds[d]
+            offset = d * DAY_MINUTES
+            ranges.append((offset + max(gs, o - 10), offset + min(ge, c + 10)))
+        cumul = td.CumulVar(idx)
+        cumul.SetRange(ranges[0][0], ranges[-1][1])
+        for (_, prev_hi), (next_lo, _) in zip(ranges, ranges[1:]):
+            if prev_hi + 1 <= next_lo - 1:
+                cumul.RemoveInterval(prev_hi + 1, next_lo - 1)
+        td.SetCumulVarSoftUpperBound(idx, ranges[-1][1], 10)
+        # 윈도우가 있는 날짜(차량)만 방문 가능 (-1: 방문하지 않음)
+        routing.VehicleVar(idx).SetValues([-1] + sorted(wins))
+    return td
+
+def solve_trip(places, days, provider=None, config=None, trace=None):
+    """
+    여러 날의 일정을 하나의 모델(날짜 = 차량)로 풀어 장소의 날짜 배정과 순서를 함께 최적화합니다.
+    - places: 여행 기간 중 방문할 후보 장소 (식당 포함)
+    - days: [{"places": 그날의 숙소/교통 장소, "user": 그날 일정, "day_info": ...}, ...]
+    - 반환값: (날짜별 extract_solution 결과 목록, objective), 해가 없으면 (None, None)
+    - trace(SolveTrace): 단계별 시간과 탐색 통계를 기록
+    """
+    if trace is None:
+        trace = SolveTrace()
+    with trace.phase("0_windows"):
+        nodes, node_wins, meal_groups = build_shared_nodes(places, days)
+
+    # 1. 날짜별 시작/종료 노드 (없으면 더미 노드) 와 그 외 숙소/교통 장소
+    with trace.phase("1_anchors"):
+        day_bounds, starts, ends, anchor_nodes = [], [], [], set()
+        for d, day in enumerate(days):
+            user = day["user"]
+            gs, ge = time_to_minutes(user["start_time"]), time_to_minutes(user["end_time"])
+            day_bounds.append((gs, ge))
+            anchors, start_idx, end_idx = day_anchors(day)
+
+            extra = [p for i, p in enumerate(anchors) if i not in (start_idx, end_idx)]
+            if extra:
+                eff_windows = calculate_effective_time_windows(extra, user)
+                for p in extra:
+                    o, c, _ = eff_windows[p["id"]][0]
+                    nodes.append(p)
+                    node_wins.append({d: (o, c)})
+
+            for kind, idx, bucket in (("start", start_idx, starts), ("end", end_idx, ends)):
+                if idx is None:
+                    add_dummy_node(nodes, node_wins, kind, gs, ge)
+                    node_wins[-1] = {d: (gs, ge)}
+                else:
+                    nodes.append(anchors[idx])
+                    node_wins.append({d: (gs, ge)})
+                bucket.append(len(nodes) - 1)
+                anchor_nodes.add(len(nodes) - 1)
+
+    # 2. 이동시간 행렬 및 라우팅 모델 (차량 = 날짜)
+    with trace.phase("2_model"):
+        if provider is None:
+            provider = HaversineProvider()
+        dist_arr = provider.matrix(nodes)
+        dist_mat = dist_arr.tolist()
+        svc_times = [p.get("service_time", 0) for p in nodes]
+
+        n = len(nodes)
+        mgr = pywrapcp.RoutingIndexManager(n, len(days), starts, ends)
+        routing = pywrapcp.RoutingModel(mgr)
+        cb_idx = register_transit(routing, mgr, dist_arr, svc_times, nodes)
+        routing.SetArcCostEvaluatorOfAllVehicles(cb_idx)
+
+    # 3. 선택 장소 / 날짜-식사별 식당 disjunction
+    with trace.phase("3_disjunctions"):
+        add_meal_disjunctions(routing, mgr, meal_groups, meal_penalty(nodes, 0, len(days) * DAY_MINUTES))
+        meal_nodes = {i for indices in meal_groups.values() for i in indices}
+        for i, p in enumerate(nodes):
+            if i in anchor_nodes or i in meal_nodes:
+                continue
+            if not p.get("is_mandatory", True):
+                routing.AddDisjunction([mgr.NodeToIndex(i)], 1000)
+
+    # 4. 날짜별 시간 윈도우
+    with trace.phase("4_time_windows"):
+        td = add_trip_time_constraints(routing, cb_idx, mgr, days, day_bounds, node_wins, anchor_nodes)
+
+    # 5. 탐색
+    with trace.phase("5_search"):
+        if config is None:
+            config = SolverConfig()
+        params = config.search_parameters(n)
+        if config.no_improvement_window:
+            add_early_stopping(routing, config.no_improvement_window)
+        trace.watch_search(routing)
+        trace.start_search()
+        sol = routing.SolveWithParameters(params)
+        trace.end_search(routing)
+
+    if not sol:
+        trace.event("솔루션을 찾지 못했습니다.")
+        trace.finish("infeasible")
+        return None, None
+    with trace.phase("extract"):
+        routes = [extract_solution(routing, mgr, sol, svc_times, td, nodes, dist_mat, vehicle=d, offset=d * DAY_MINUTES)[0]
+                  for d in range(len(days))]
+    trace.finish("ok", sol.ObjectiveValue())
+    return routes, sol.ObjectiveValue()
@@ -0,0 +1,177 @@
+import os
+import json
+import argparse
+import numpy as np
+
+from solver.utils.time import time_to_minutes, minutes_to_time_str, adjust_for_midnight
+from solver.utils.window_table import parse_breaks
+
+PLACES_FILE = "places.npy"
+CATEGORIES_FILE = "categories.npy"
+STRINGS_FILE = "strings.bin"
+
+# run_model 이 사용하는 필드, 그 외 필드(tags 등)는 JSON 으로 strings.bin 에 저장
+CORE_FIELDS = ("id", "name", "x_cord", "y_cord", "category", "open_time", "close_time",
+               "break_time", "service_time", "is_mandatory")
+TIME_FIELDS = ("open_time", "close_time", "break_time")
+# category 가 없는(None) 장소의 분류 코드
+NO_CATEGORY = -1
+
+def time_strings(open_minutes, close_minutes, breaks):
+    # 분 단위 값을 PlaceCatalog.place 가 돌려주는 "HH:MM" 문자열로 (자정을 넘긴 시각은 1440 으로 나눈 나머지)
+    return {
+        "open_time": minutes_to_time_str(int(open_minutes) % 1440),
+        "close_time": minutes_to_time_str(int(close_minutes) % 1440),
+        "break_time": [minutes_to_time_str(int(t) % 1440) for t in np.ravel(breaks)],
+    }
+
+def catalog_dtype(break_width):
+    return np.dtype([
+        ("id", np.int64),
+        ("x_cord", np.float64),
+        ("y_cord", np.float64),
+        ("open", np.int16),
+        ("close", np.int16),
+        ("breaks", np.int16, (break_width, 2)),
+        ("n_breaks", np.int8),
+        ("category", np.int16),
+        ("service_time", np.int32),
+        ("is_mandatory", np.int8),      # 1 / 0, -1 은 필드 없음 (기본값 True)
+        ("name_offset", np.int64),
+        ("name_length", np.int32),
+        ("extra_offset", np.int64),
+        ("extra_length", np.int32),
+    ])
+
+def compile_catalog(places, path):
+    """
+    장소 목록을 한 번 파싱해 path 디렉터리에 저장합니다.
+    - places.npy: 분 단위 영업/휴식 시간, 분류 코드, 좌표 등 구조화 배열 (id 순 정렬)
+    - categories.npy: 분류 코드 -> 이름
+    - strings.bin: 이름과 추가 필드(JSON)의 UTF-8 바이트
+    - 시간 문자열이 "HH:MM" 으로 다시 만들어지지 않으면 (예: "9:00", 자정을 넘긴 "0:30") 원래 값을 추가 필드에 함께 저장해
+      읽을 때 그대로 돌려줍니다. category 가 없으면 NO_CATEGORY 코드로 저장하고 None 으로 돌려줍니다.
+    - 시간 형식이 잘못된 장소는 time_to_minutes 와 같은 ValueError 를 냅니다.
+    """
+    places = sorted(places, key=lambda p: p["id"])
+    ids = [p["id"] for p in places]
+    if any(not isinstance(i, int) for i in ids):
+        raise ValueError("카탈로그의 장소 id 는 정수여야 합니다.")
+    if len(set(ids)) != len(ids):
+        raise ValueError("카탈로그에 중복된 장소 id 가 있습니다.")
+
+    categories = sorted({p["category"] for p in places if p.get("category") is not None})
+    category_code = {c: i for i, c in enumerate(categories)}
+    breaks = [parse_breaks(p) for p in places]
+    records = np.zeros(len(places), dtype=catalog_dtype(max((len(b) for b in breaks), default=0)))
+
+    blob = bytearray()
+    for i, (p, pairs) in enumerate(zip(places, breaks)):
+        r = records[i]
+        r["id"] = p["id"]
+        r["x_cord"], r["y_cord"] = p["x_cord"], p["y_cord"]
+        r["open"], r["close"] = adjust_for_midnight(time_to_minutes(p["open_time"]), time_to_minutes(p["close_time"]))
+        r["n_breaks"] = len(pairs)
+        if pairs:
+            r["breaks"][:len(pairs)] = pairs
+        r["category"] = NO_CATEGORY if p.get("category") is None else category_code[p["category"]]
+        r["service_time"] = p.get("service_time", 0)
+        r["is_mandatory"] = int(p["is_mandatory"]) if "is_mandatory" in p else -1
+
+        name = p["name"].encode("utf-8")
+        r["name_offset"], r["name_length"] = len(blob), len(name)
+        blob += name
+        extra = {k: v for k, v in p.items() if k not in CORE_FIELDS}
+        emitted = time_strings(r["open"], r["close"], r["breaks"][:len(pairs)])
+        extra.update({k: p[k] for k in TIME_FIELDS if k in p and p[k] != emitted[k]})
+        if extra:
+            data = json.dumps(extra, ensure_ascii=False).encode("utf-8")
+            r["extra_offset"], r["extra_length"] = len(blob), len(data)
+            blob += data
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, PLACES_FILE), records)
+    np.save(os.path.join(path, CATEGORIES_FILE), np.array(categories, dtype=str))
+    with open(os.path.join(path, STRINGS_FILE), "wb") as f:
+        f.write(bytes(blob))
+    return len(records)
+
+class PlaceCatalog:
+    """
+    compile_catalog 로 만든 카탈로그를 mmap 으로 엽니다 (JSON 파싱 없음).
+    - get(id) / places(ids): run_model 에 넘길 수 있는 장소 dict (시간은 compile_catalog 에 넣은 문자열 그대로)
+    - 배열(open, close, breaks 등)은 records 로 직접 접근할 수 있습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.records = np.load(os.path.join(path, PLACES_FILE), mmap_mode="r")
+        self.categories = np.load(os.path.join(path, CATEGORIES_FILE)).tolist()
+        strings_path = os.path.join(path, STRINGS_FILE)
+        self._strings = np.memmap(strings_path, dtype=np.uint8, mode="r") if os.path.getsize(strings_path) else b""
+        self._ids = self.records["id"]
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, place_id):
+        return self._position(place_id) is not None
+
+    def ids(self):
+        return self._ids.tolist()
+
+    def _position(self, place_id):
+        i = int(np.searchsorted(self._ids, place_id))
+        return i if i < len(self._ids) and self._ids[i] == place_id else None
+
+    def _text(self, offset, length):
+        return bytes(self._strings[offset:offset + length]).decode("utf-8")
+
+    def place(self, i):
+        # i 번째 레코드를 장소 dict 로 변환
+        r = self.records[i]
+        n_breaks = int(r["n_breaks"])
+        category = int(r["category"])
+        place = {
+            "id": int(r["id"]),
+            "name": self._text(int(r["name_offset"]), int(r["name_length"])),
+            "x_cord": float(r["x_cord"]),
+            "y_cord": float(r["y_cord"]),
+            "category": None if category == NO_CATEGORY else self.categories[category],
+            **time_strings(r["open"], r["close"], r["breaks"][:n_breaks]),
+            "service_time": int(r["service_time"]),
+        }
+        if r["is_mandatory"] >= 0:
+            place["is_mandatory"] = bool(r["is_mandatory"])
+        if r["extra_length"]:
+            place.update(json.loads(self._text(int(r["extra_offset"]), int(r["extra_length"]))))
+        return place
+
+    def get(self, place_id):
+        i = self._position(place_id)
+        if i is None:
+            raise KeyError(f"카탈로그에 장소 id {place_id} 가 없습니다.")
+        return self.place(i)
+
+    def places(self, place_ids):
+        return [self.get(i) for i in place_ids]
+
+_process_catalogs = {}
+
+def open_catalog(path):
+    # 프로세스마다 경로별로 하나의 카탈로그를 재사용 (서비스 워커에서 사용)
+    catalog = _process_catalogs.get(path)
+    if catalog is None:
+        catalog = _process_catalogs[path] = PlaceCatalog(path)
+    return catalog
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="장소 JSON 을 카탈로그로 변환")
+    parser.add_argument('source', help='{"places": [...]} 또는 장소 목록 JSON 파일')
+    parser.add_argument('output', help='카탈로그 디렉터리')
+    args = parser.parse_args()
+
+    with open(args.source, encoding='utf-8') as f:
+        data = json.load(f)
+    count = compile_catalog(data["places"] if isinstance(data, dict) else data, args.output)
+    print(f"[INFO] 장소 {count}곳을 {args.output} 에 저장했습니다.")
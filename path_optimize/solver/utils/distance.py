@@ -1,8 +1,10 @@
 import math
+import numpy as np
+
+R = 6371
 
 def haversine_distance(lat1, lon1, lat2, lon2):
     # 두 지점 간의 거리(km)를 하버사인 공식을 통해 계산 후 반올림
-    R = 6371  
     phi1, phi2 = math.radians(lat1), math.radians(lat2)
     delta_phi = math.radians(lat2 - lat1)
     delta_lambda = math.radians(lon2 - lon1)
@@ -10,13 +12,45 @@ def haversine_distance(lat1, lon1, lat2, lon2):
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     return int(round(R * c)) + 10
 
-def create_distance_matrix(places):
+def haversine_block(lat1, lon1, lat2, lon2):
+    # (len(lat1), len(lat2)) 크기의 거리 블록을 브로드캐스팅으로 계산 (haversine_distance 와 동일한 반올림 + 10)
+    phi1 = np.radians(lat1)[:, None]
+    phi2 = np.radians(lat2)[None, :]
+    delta_phi = np.radians(lat2[None, :] - lat1[:, None])
+    delta_lambda = np.radians(lon2[None, :] - lon1[:, None])
+    a = np.sin(delta_phi / 2)**2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2)**2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return np.rint(R * c).astype(np.int32) + 10
+
+def place_coords(places):
+    lat = np.fromiter((p["x_cord"] for p in places), dtype=np.float64, count=len(places))
+    lon = np.fromiter((p["y_cord"] for p in places), dtype=np.float64, count=len(places))
+    return lat, lon
+
+def create_distance_array(places):
+    """
+    장소 목록의 거리 행렬을 NumPy int32 배열로 계산합니다.
+    - 대각선은 0, 나머지는 haversine_distance 와 동일한 값입니다.
+    """
+    lat, lon = place_coords(places)
+    matrix = haversine_block(lat, lon, lat, lon)
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+def create_distance_array_chunked(places, chunk_size=1024):
+    """
+    create_distance_array 와 같은 결과를 chunk_size 행 단위로 계산합니다.
+    - 중간 float64 배열이 (chunk_size, n) 크기로 제한되어 n 이 클 때 최대 메모리를 줄입니다.
+    """
+    lat, lon = place_coords(places)
     n = len(places)
-    matrix = [[0] * n for _ in range(n)]
-    for i, pi in enumerate(places):
-        for j in range(i + 1, n):
-            lat1, lon1 = pi["x_cord"], pi["y_cord"]
-            lat2, lon2 = places[j]["x_cord"], places[j]["y_cord"]
-            d = haversine_distance(lat1, lon1, lat2, lon2)
-            matrix[i][j] = matrix[j][i] = d
+    matrix = np.empty((n, n), dtype=np.int32)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        matrix[start:stop] = haversine_block(lat[start:stop], lon[start:stop], lat, lon)
+    np.fill_diagonal(matrix, 0)
     return matrix
+
+def create_distance_matrix(places):
+    # run_model / extract_solution 용 list-of-lists 어댑터
+    return create_distance_array(places).tolist()
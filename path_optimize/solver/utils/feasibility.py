@@ -0,0 +1,127 @@
+from solver.utils.time import time_to_minutes, adjust_for_midnight
+from solver.utils.time_windows import (
+    compute_meal_intervals, compute_operational_windows, intersect_interval, calculate_effective_time_windows
+)
+from solver.utils.places import determine_start_end_indices, keep_nodes
+from solver.utils.routing import is_dummy_node, add_dummy_node
+from solver.utils.travel_time import HaversineProvider
+
+def reason(code, place, message):
+    return {"code": code, "place": place, "message": message}
+
+def visit_window(win, gs, ge):
+    # add_time_constraints 와 같은 도착 가능 구간: 유효 윈도우 앞뒤 10분, 활동 시간 [gs, ge] 로 자름
+    o, c, _ = win
+    return max(gs, o - 10), min(ge, c + 10)
+
+def drop_empty_windows(places, eff_wins, start_idx, end_idx, meal_groups, gs, ge):
+    """
+    활동 시간 안에 도착할 수 없는(빈 윈도우) 선택 장소와 식사 그룹의 식당 노드를 뺍니다.
+    - OR-Tools 는 방문하지 않는 노드라도 CumulVar 범위가 비면 해를 찾지 못하므로, 탐색과 동적 계획법 모두 이 결과로 풉니다.
+    - 필수 장소는 그대로 두며 (해가 없음), check_feasibility 가 empty_window 오류로 보고합니다.
+    - 반환값: (places, eff_wins, start_idx, end_idx, meal_groups)
+    """
+    meal_nodes = {i for indices in (meal_groups or {}).values() for i in indices}
+
+    def droppable(i):
+        if i in (start_idx, end_idx) or (places[i].get('is_mandatory', True) and i not in meal_nodes):
+            return False
+        lo, hi = visit_window(eff_wins[i], gs, ge)
+        return lo > hi
+
+    kept = [i for i in range(len(places)) if not droppable(i)]
+    return keep_nodes(places, eff_wins, start_idx, end_idx, meal_groups, kept)
+
+def check_meal_windows(places, user):
+    # 식당마다 영업 시간과 식사 선호 시간의 교집합이 있는지 (calculate_effective_time_windows 가 실패하는 경우)
+    gs, ge = adjust_for_midnight(time_to_minutes(user["start_time"]), time_to_minutes(user["end_time"]))
+    meal_intervals = compute_meal_intervals(user.get("meal_time_preferences", {}), gs, ge)
+    reasons = []
+    for p in places:
+        if p.get("category") != "restaurant":
+            continue
+        segments = compute_operational_windows(p, gs, ge)
+        if not any(intersect_interval(s, e, ms, me) for s, e in segments for ms, me in meal_intervals.values()):
+            reasons.append(reason("no_meal_window", p["name"], f"식당 {p['name']}은(는) 식사 선호 시간에 부합하는 윈도우가 없습니다."))
+    return reasons
+
+def check_feasibility(places, eff_wins, start_idx, end_idx, gs, ge, dist_mat):
+    """
+    run_model 의 시간 제약(add_time_constraints)과 같은 규칙으로, 탐색 없이 확실히 불가능한 경우를 찾습니다.
+    - errors: 해가 존재할 수 없는 이유 (필수 장소 기준)
+    - warnings: 해는 있을 수 있지만 일정상 무리가 있는 경우 (예: 체류 시간이 영업 시간보다 김,
+      선택 장소의 윈도우가 비어 run_model 이 그 장소를 빼고 풂)
+    """
+    errors, warnings = [], []
+    svc = [p.get('service_time', 0) for p in places]
+    start_dummy = is_dummy_node(places[start_idx]['name'])
+    end_dummy = is_dummy_node(places[end_idx]['name'])
+
+    for i, p in enumerate(places):
+        if i in (start_idx, end_idx) or p.get('is_mandatory', True):
+            continue
+        lo, hi = visit_window(eff_wins[i], gs, ge)
+        if lo > hi:
+            warnings.append(reason("empty_window", p['name'], f"{p['name']}은(는) 활동 시간 중 방문 가능한 시간이 없어 제외됩니다."))
+
+    mandatory = [i for i, p in enumerate(places)
+                 if i not in (start_idx, end_idx) and p.get('is_mandatory', True)]
+    for i in mandatory:
+        name = places[i]['name']
+        o, c, _ = eff_wins[i]
+        lo, hi = visit_window(eff_wins[i], gs, ge)
+        if lo > hi:
+            errors.append(reason("empty_window", name, f"{name}은(는) 활동 시간 중 방문 가능한 시간이 없습니다."))
+            continue
+
+        earliest = gs if start_dummy else gs + svc[start_idx] + dist_mat[start_idx][i]
+        if earliest > hi:
+            errors.append(reason("unreachable", name, f"{name}은(는) 시작 장소에서 제시간에 도착할 수 없습니다."))
+            continue
+
+        if not end_dummy and max(lo, earliest) + svc[i] + dist_mat[i][end_idx] > ge:
+            errors.append(reason("cannot_return", name, f"{name} 방문 후 종료 장소에 제시간에 도착할 수 없습니다."))
+            continue
+
+        if svc[i] > c - o:
+            warnings.append(reason("service_exceeds_window", name, f"{name}의 체류 시간이 유효 영업 시간보다 깁니다."))
+
+    # 종료 노드가 더미면 마지막 장소의 체류 시간은 경로 시간에 포함되지 않음
+    services = [svc[i] for i in mandatory]
+    total = sum(services) + (0 if start_dummy else svc[start_idx])
+    if end_dummy and services:
+        total -= max(services)
+    if total > ge - gs:
+        errors.append(reason("total_service_exceeds_span", None, "필수 장소의 체류 시간 합이 전체 활동 시간보다 깁니다."))
+
+    return {"feasible": not errors, "errors": errors, "warnings": warnings}
+
+def check_day(places, day_info, user, provider=None):
+    """
+    하루 일정을 solver 에 넘기기 전에 빠르게 검사합니다.
+    - 반환값: {"feasible": bool, "errors": [...], "warnings": [...]}, 각 항목은 {"code", "place", "message"}
+    - 식당은 식사 조합에 따라 선택되므로 식사 윈도우만 검사하고, 그 외 필수 장소는 check_feasibility 로 검사합니다.
+    """
+    errors = check_meal_windows(places, user)
+    try:
+        start_idx, end_idx = determine_start_end_indices(places, day_info)
+    except ValueError as e:
+        errors.append(reason("invalid_day", None, str(e)))
+    if errors:
+        return {"feasible": False, "errors": errors, "warnings": []}
+
+    # 식당을 제외한 노드로 run_model 과 같이 시작/종료 (없으면 더미) 노드를 구성
+    eff_windows = calculate_effective_time_windows(places, user)
+    gs, ge = time_to_minutes(user['start_time']), time_to_minutes(user['end_time'])
+    kept = [i for i, p in enumerate(places) if p.get("category") != "restaurant" or i in (start_idx, end_idx)]
+    nodes = [places[i] for i in kept]
+    wins = [eff_windows[p["id"]][0] for p in nodes]
+    start = kept.index(start_idx) if start_idx is not None else None
+    end = kept.index(end_idx) if end_idx is not None else None
+    if end is None:
+        end = add_dummy_node(nodes, wins, 'end', gs, ge)
+    if start is None:
+        start = add_dummy_node(nodes, wins, 'start', gs, ge)
+
+    dist_mat = (provider or HaversineProvider()).matrix(nodes)
+    return check_feasibility(nodes, wins, start, end, gs, ge, dist_mat)
@@ -1,8 +1,10 @@
 from solver.utils.time import minutes_to_time_str
+from solver.utils.routing import is_dummy_node
 
 def format_visit_info(order, node, arrival, stay, places, travel_minutes=None, wait_minutes=None, delay_minutes=None):
     record = {
         'order'         : order,
+        'id'            : places[node].get('id'),
         'place'         : places[node]['name'],
         'arrival_str'   : minutes_to_time_str(arrival),
         'departure_str' : minutes_to_time_str(arrival + stay),
@@ -16,4 +18,47 @@ def format_visit_info(order, node, arrival, stay, places, travel_minutes=None, w
     if delay_minutes is not None and delay_minutes > 0:
         record['delay_time'] = minutes_to_time_str(delay_minutes)
 
-    return record
\ No newline at end of file
+    return record
+
+def format_route(visits, svc, places, dist_mat):
+    """
+    방문 순서대로의 (노드, 도착 시간) 목록을 format_visit_info 레코드 목록으로 변환합니다.
+    - 마지막 항목은 종료 노드 (체류 시간 0, 지연 없음), 더미 노드는 건너뜁니다.
+    """
+    res = []
+    order = 1
+    prev_node = None
+    prev_departure = None
+
+    for node, arrival in visits[:-1]:
+        if is_dummy_node(places[node]['name']):
+            continue
+        stay = svc[node]
+        travel_minutes = None
+        wait_minutes = None
+        delay_minutes = None
+
+        if prev_node is not None:
+            travel_minutes = dist_mat[prev_node][node]
+            expected_arrival = prev_departure + travel_minutes
+            gap = arrival - expected_arrival
+
+            if gap >= 0:
+                wait_minutes = gap
+                delay_minutes = None
+            else:
+                wait_minutes = None
+                delay_minutes = -gap
+
+        res.append(format_visit_info(order, node, arrival, stay, places, travel_minutes, wait_minutes, delay_minutes))
+        order += 1
+        prev_node = node
+        prev_departure = arrival + stay
+
+    node, arrival = visits[-1]
+    if not is_dummy_node(places[node]['name']):
+        travel_minutes = dist_mat[prev_node][node] if prev_node is not None else None
+        wait_minutes = max(0, arrival - (prev_departure + travel_minutes)) if travel_minutes is not None else None
+        res.append(format_visit_info(order, node, arrival, 0, places, travel_minutes, wait_minutes))
+
+    return res
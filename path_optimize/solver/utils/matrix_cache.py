@@ -0,0 +1,176 @@
+import os
+import json
+import fcntl
+from collections import OrderedDict
+from contextlib import contextmanager
+import numpy as np
+
+from solver.utils.distance import haversine_block, place_coords
+from solver.utils.travel_time import TravelTimeProvider, place_key, count_pairs
+
+# 행렬, 키, 좌표를 한 파일에 저장해 한 번의 os.replace 로 교체 (행렬과 인덱스가 어긋나지 않도록)
+CACHE_FILE = "cache.npz"
+LOCK_FILE = "cache.lock"
+
+class TravelMatrixCache(TravelTimeProvider):
+    """
+    장소 키 쌍으로 이동시간을 저장하는 캐시입니다.
+    - 키는 장소 id 대신 좌표(place_key)입니다. 더미 노드는 id 가 없고 분할된 식당 노드는 id 가 달라지기 때문입니다.
+    - 디스크: path 디렉터리의 cache.npz 에 전체 행렬, 키, 좌표를 함께 저장하고, 시작할 때 전체를 메모리로 읽습니다.
+    - 저장은 save_every 개의 새 장소가 쌓였을 때 또는 save() 호출 시 한 번에 하며,
+      파일 잠금 안에서 디스크의 내용(다른 프로세스가 추가한 장소)을 다시 읽어 합친 뒤 씁니다.
+    - 메모리: 최근 요청된 부분 행렬을 LRU(maxsize 개)로 보관합니다.
+    - 부분 행렬은 저장된 행렬에서 인덱스로 gather 하며, 처음 보는 장소만 compute_block 으로 계산합니다.
+    """
+
+    def __init__(self, path=None, maxsize=128, compute_block=haversine_block, save_every=64):
+        super().__init__()
+        self.path = path
+        self.maxsize = maxsize
+        self.compute_block = compute_block
+        self.save_every = save_every
+        self._lru = OrderedDict()
+        self._keys = []
+        self._coords = np.empty((0, 2), dtype=np.float64)
+        self._index = {}
+        # 용량을 두 배씩 늘리는 버퍼, 실제 행렬은 _buf[:n, :n]
+        self._buf = np.empty((0, 0), dtype=np.int32)
+        self._unsaved = 0
+        if path:
+            keys, coords, matrix = self._read()
+            if keys:
+                self._add(keys, coords, matrix)
+            self._unsaved = 0
+
+    def identity(self):
+        # 저장된 값은 모두 compute_block 으로 계산한 것이므로 캐시 경로와 무관
+        block = self.compute_block
+        return [type(self).__name__, f"{block.__module__}.{block.__qualname__}"]
+
+    @property
+    def _matrix(self):
+        n = len(self._keys)
+        return self._buf[:n, :n]
+
+    def _read(self):
+        # 디스크의 (키, 좌표, 행렬), 없으면 빈 값
+        cache_path = os.path.join(self.path, CACHE_FILE)
+        if not os.path.exists(cache_path):
+            return [], np.empty((0, 2)), None
+        with np.load(cache_path) as data:
+            return json.loads(str(data["keys"])), data["coords"].reshape(-1, 2), data["matrix"]
+
+    @contextmanager
+    def _locked(self):
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, LOCK_FILE), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def save(self):
+        if not self.path:
+            return
+        with self._locked():
+            # 다른 프로세스가 저장한 장소를 먼저 합침 (같은 키의 값은 같은 compute_block 결과)
+            keys, coords, matrix = self._read()
+            missing = [i for i, k in enumerate(keys) if k not in self._index]
+            if missing:
+                self._add([keys[i] for i in missing], coords[missing])
+
+            cache_path = os.path.join(self.path, CACHE_FILE)
+            tmp_path = cache_path + f".{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez(f, matrix=self._matrix, keys=np.array(json.dumps(self._keys)), coords=self._coords)
+            os.replace(tmp_path, cache_path)
+        self._unsaved = 0
+
+    def flush(self):
+        # 저장하지 않은 장소가 있을 때만 save
+        if self._unsaved:
+            self.save()
+
+    def _reserve(self, n):
+        # 용량이 모자라면 두 배 이상으로 늘려 기존 값을 복사 (장소를 하나씩 추가해도 복사 비용은 상각 O(n^2))
+        capacity = len(self._buf)
+        if n <= capacity:
+            return
+        buf = np.empty((max(n, 2 * capacity), max(n, 2 * capacity)), dtype=np.int32)
+        n_old = len(self._keys)
+        buf[:n_old, :n_old] = self._buf[:n_old, :n_old]
+        self._buf = buf
+
+    def _add(self, keys, coords, matrix=None):
+        # 새 키의 행/열을 추가 (matrix 가 주어지면 계산 없이 그대로 사용)
+        n_old, n = len(self._keys), len(self._keys) + len(keys)
+        self._reserve(n)
+        self._coords = np.vstack([self._coords, np.asarray(coords, dtype=np.float64).reshape(-1, 2)])
+        if matrix is not None and n_old == 0:
+            self._buf[:n, :n] = matrix
+        else:
+            lat, lon = self._coords[n_old:, 0], self._coords[n_old:, 1]
+            block = self.compute_block(lat, lon, self._coords[:, 0], self._coords[:, 1])
+            self._buf[n_old:n, :n] = block
+            self._buf[:n, n_old:n] = block.T
+        for i, key in enumerate(keys):
+            self._index[key] = n_old + i
+        self._keys.extend(keys)
+        self._unsaved += len(keys)
+
+    def _extend(self, places):
+        # 새로운 장소의 행/열만 계산해서 저장 행렬을 확장, save_every 개가 쌓이면 저장
+        new_keys, new_places, seen = [], [], set()
+        for p in places:
+            key = place_key(p)
+            if key not in self._index and key not in seen:
+                seen.add(key)
+                new_keys.append(key)
+                new_places.append(p)
+        if not new_places:
+            return
+
+        lat, lon = place_coords(new_places)
+        self._add(new_keys, np.column_stack([lat, lon]))
+        if self.path and self._unsaved >= self.save_every:
+            self.save()
+
+    def matrix(self, places):
+        """
+        places 순서대로의 이동시간 행렬(int32, 대각선 0)을 반환합니다.
+        - 같은 좌표의 서로 다른 노드(예: 분할된 식당)끼리는 create_distance_array 와 같이 자기 자신과의 값을 사용합니다.
+        - 반환값은 LRU 에 보관한 행렬의 사본이라 호출한 쪽에서 고쳐도 캐시에 영향이 없습니다.
+        """
+        keys = tuple(place_key(p) for p in places)
+        cached = self._lru.get(keys)
+        if cached is not None:
+            self._lru.move_to_end(keys)
+            self.stats["hits"] += count_pairs(len(keys))
+            return cached.copy()
+
+        n_known = sum(1 for k in keys if k in self._index)
+        if n_known < len(keys):
+            self._extend(places)
+        self.stats["hits"] += count_pairs(n_known)
+        self.stats["fetched"] += count_pairs(len(keys)) - count_pairs(n_known)
+        idx = np.fromiter((self._index[k] for k in keys), dtype=np.intp, count=len(keys))
+        sub = np.array(self._matrix[np.ix_(idx, idx)], dtype=np.int32)
+        np.fill_diagonal(sub, 0)
+
+        self._lru[keys] = sub
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+        return sub.copy()
+
+    def __len__(self):
+        return len(self._keys)
+
+_process_caches = {}
+
+def get_matrix_cache(path):
+    # 프로세스마다 경로별로 하나의 캐시를 재사용 (solve_day 워커에서 사용)
+    cache = _process_caches.get(path)
+    if cache is None:
+        cache = _process_caches[path] = TravelMatrixCache(path)
+    return cache
@@ -1,3 +1,4 @@
+import itertools
 
 def validate_first_place(places, expected_category, err_msg):
     if not places:
@@ -20,7 +21,8 @@ def split_restaurant_nodes(places, windows_map):
                 label = meal or "default"
                 node.update({
                     "name": f"{place['name']} ({label})",
-                    "id": f"{pid}_{label}"
+                    "id": f"{pid}_{label}",
+                    "place_id": pid
                 })
                 new_places.append(node)
                 new_wins.append((o, c, meal))
@@ -29,6 +31,43 @@ def split_restaurant_nodes(places, windows_map):
             new_wins.append(wins[0] if wins else (None, None, None))
     return new_places, new_wins
 
+def group_meal_nodes(places, wins):
+    # 식사 타입별로 분할된 식당 노드 인덱스를 묶음
+    meal_groups = {}
+    for i, p in enumerate(places):
+        if p.get("category") == "restaurant":
+            meal_type = wins[i][2]
+            if meal_type is not None:
+                meal_groups.setdefault(meal_type, []).append(i)
+    return meal_groups
+
+def enumerate_meal_selections(meal_groups):
+    # 식사 타입마다 식당 하나씩 고르는 모든 조합
+    group_indices = list(meal_groups.values())
+    return list(itertools.product(*group_indices)) if group_indices else [()]
+
+def select_nodes(places, wins, selection):
+    # 선택된 식당 노드 + 식당이 아닌 모든 노드 (원래 순서 유지)
+    selected_indices = set(selection)
+    for i, p in enumerate(places):
+        if p.get("category") != "restaurant":
+            selected_indices.add(i)
+    selected_indices = sorted(selected_indices)
+    return [places[i] for i in selected_indices], [wins[i] for i in selected_indices]
+
+def keep_nodes(places, eff_wins, start_idx, end_idx, meal_groups, kept):
+    """
+    kept(오름차순 인덱스)에 든 노드만 남기고 인덱스(시작/종료, 식사 그룹)를 다시 매깁니다.
+    - 반환값: (places, eff_wins, start_idx, end_idx, meal_groups), 빠진 노드가 없으면 입력을 그대로 반환
+    """
+    if len(kept) == len(places):
+        return places, eff_wins, start_idx, end_idx, meal_groups
+    new_index = {old: new for new, old in enumerate(kept)}
+    if meal_groups:
+        meal_groups = {meal: [new_index[i] for i in indices if i in new_index] for meal, indices in meal_groups.items()}
+    return ([places[i] for i in kept], [eff_wins[i] for i in kept],
+            new_index.get(start_idx), new_index.get(end_idx), meal_groups)
+
 def is_accommodation(place):
     return place.get("category") == "accommodation"
 
@@ -7,4 +7,23 @@ def add_dummy_node(places, wins, kind, gs, ge):
     return len(places) - 1
 
 def is_dummy_node(name):
-    return name in ("dummy_start", "dummy_end")
\ No newline at end of file
+    return name in ("dummy_start", "dummy_end")
+
+def route_place_ids(route):
+    # extract_solution 결과(dict 목록) 또는 장소 id 목록 → 장소 id 목록
+    return [r.get('id') if isinstance(r, dict) else r for r in route]
+
+def map_route_to_nodes(place_ids, places, start_idx, end_idx):
+    # 이전 경로의 장소 id 를 현재 places 의 노드 인덱스로 변환 (시작/종료/더미 노드와 사라진 장소는 제외)
+    node_by_id = {}
+    for i, p in enumerate(places):
+        if i in (start_idx, end_idx) or is_dummy_node(p['name']):
+            continue
+        node_by_id.setdefault(p.get('id'), i)
+
+    nodes = []
+    for pid in place_ids:
+        node = node_by_id.get(pid)
+        if node is not None and node not in nodes:
+            nodes.append(node)
+    return nodes
@@ -0,0 +1,114 @@
+import copy
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from dataclasses import asdict
+from collections import OrderedDict
+
+def problem_fingerprint(places, eff_wins, start_idx, end_idx, day_info, user, config, meal_groups=None, provider=None):
+    """
+    같은 문제면 장소 순서와 무관하게 같은 해시를 반환합니다.
+    - 장소: id 순으로 정렬한 (id, 이름, 분류, 좌표, 서비스 시간, 필수 여부, 유효 윈도우, 시작/종료 여부)
+    - 그 외: 활동 시간, day_info, 탐색 설정, 식사 그룹, 이동시간 제공자 (종류 + 행렬 파일 내용 / API 주소와 프로필)
+    """
+    def role(i):
+        return "start" if i == start_idx else "end" if i == end_idx else ""
+
+    nodes = sorted(
+        ([str(p.get("id")), p["name"], p.get("category"), p.get("x_cord"), p.get("y_cord"),
+          p.get("service_time", 0), p.get("is_mandatory", True), list(eff_wins[i]), role(i)]
+         for i, p in enumerate(places)),
+        key=lambda node: json.dumps(node, ensure_ascii=False, default=str),
+    )
+    meals = sorted([meal, sorted(str(places[i].get("id")) for i in indices)]
+                   for meal, indices in (meal_groups or {}).items())
+    payload = {
+        "nodes": nodes,
+        "span": [user.get("start_time"), user.get("end_time")],
+        "day_info": day_info,
+        "config": asdict(config),
+        "meals": meals,
+        "provider": provider.identity() if provider is not None else None,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+class SolutionCache:
+    """
+    run_model 결과 캐시입니다. 해를 찾지 못한 결과(None)도 저장합니다.
+    - 1단계: 메모리 LRU (maxsize 개, ttl 초)
+    - 2단계: path 가 주어지면 SQLite 파일 (ttl 초)
+    - stats: hits / misses / saved_seconds (캐시 덕분에 생략된 탐색 시간 합)
+    """
+
+    def __init__(self, path=None, maxsize=1024, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS solutions ("
+                "key TEXT PRIMARY KEY, route TEXT, objective INTEGER, solve_time REAL, created REAL)"
+            )
+            self._db.commit()
+        self.stats = {"hits": 0, "misses": 0, "saved_seconds": 0.0}
+
+    def _remember(self, key, entry):
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def _lookup(self, key, now):
+        entry = self._lru.get(key)
+        if entry is not None:
+            if now - entry[3] <= self.ttl:
+                self._lru.move_to_end(key)
+                return entry
+            del self._lru[key]
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT route, objective, solve_time, created FROM solutions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or now - row[3] > self.ttl:
+            return None
+        entry = (json.loads(row[0]), row[1], row[2], row[3])
+        self._remember(key, entry)
+        return entry
+
+    def get(self, key):
+        # 캐시에 있으면 (route 사본, objective), 없으면 None
+        with self._lock:
+            entry = self._lookup(key, time.time())
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.stats["saved_seconds"] += entry[2]
+            return copy.deepcopy(entry[0]), entry[1]
+
+    def put(self, key, route, objective, solve_time):
+        # 호출자가 나중에 route 를 고쳐도 캐시된 값이 바뀌지 않도록 사본을 저장
+        entry = (copy.deepcopy(route), objective, solve_time, time.time())
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO solutions (key, route, objective, solve_time, created) VALUES (?, ?, ?, ?, ?)",
+                    (key, json.dumps(route, ensure_ascii=False), objective, solve_time, entry[3]),
+                )
+                self._db.commit()
+
+    def metrics(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return {**self.stats, "hit_rate": self.stats["hits"] / total if total else 0.0}
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
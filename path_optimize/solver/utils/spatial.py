@@ -0,0 +1,162 @@
+import heapq
+import numpy as np
+
+from solver.utils.distance import R, place_coords, haversine_block
+from solver.utils.places import keep_nodes
+
+def unit_vectors(lat, lon):
+    # 위경도(도) -> 단위 구 위의 3차원 벡터 (두 점의 현 길이는 대원 거리와 순서가 같음)
+    phi, lam = np.radians(lat), np.radians(lon)
+    return np.column_stack([np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)])
+
+def chord_to_km(chord):
+    return R * 2 * np.arcsin(np.clip(chord / 2, 0, 1))
+
+def km_to_chord(km):
+    return 2 * np.sin(min(km / R, np.pi) / 2)
+
+class BallTree:
+    """
+    haversine 거리용 ball tree 입니다.
+    - 좌표를 단위 구 위의 벡터로 바꿔 현(chord) 거리로 분할/가지치기하고, 결과 거리는 km 로 반환합니다.
+    - 노드마다 중심과 반지름을 저장하고, 리프(leaf_size 개 이하)는 NumPy 로 한 번에 계산합니다.
+    """
+
+    def __init__(self, lat, lon, leaf_size=32):
+        points = unit_vectors(np.asarray(lat, dtype=np.float64), np.asarray(lon, dtype=np.float64))
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(points))
+        self.points = points
+        # 노드: (start, end, center, radius, left, right), 리프는 left = right = -1
+        self.nodes = []
+        if len(points):
+            self._build()
+
+    def _build(self):
+        stack = [(self._add_node(0, len(self.points)), 0, len(self.points))]
+        while stack:
+            node, start, end = stack.pop()
+            if end - start <= self.leaf_size:
+                continue
+            pts = self.points[start:end]
+            dim = int(np.argmax(pts.max(axis=0) - pts.min(axis=0)))
+            mid = (end - start) // 2
+            part = np.argpartition(pts[:, dim], mid)
+            self.points[start:end] = pts[part]
+            self.order[start:end] = self.order[start:end][part]
+            left = self._add_node(start, start + mid)
+            right = self._add_node(start + mid, end)
+            self.nodes[node][4], self.nodes[node][5] = left, right
+            stack.append((left, start, start + mid))
+            stack.append((right, start + mid, end))
+
+    def _add_node(self, start, end):
+        pts = self.points[start:end]
+        center = pts.mean(axis=0)
+        radius = float(np.sqrt(((pts - center) ** 2).sum(axis=1)).max())
+        self.nodes.append([start, end, center, radius, -1, -1])
+        return len(self.nodes) - 1
+
+    def _bound(self, node, q):
+        # q 에서 노드 안의 점까지 현 거리의 하한
+        _, _, center, radius, _, _ = self.nodes[node]
+        return max(0.0, float(np.sqrt(((q - center) ** 2).sum())) - radius)
+
+    def query(self, lat, lon, k):
+        """
+        (lat, lon) 에서 가까운 k 개 점의 (거리 km 배열, 인덱스 배열) 를 가까운 순으로 반환합니다.
+        """
+        if not self.nodes or k <= 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+        q = unit_vectors(np.array([lat]), np.array([lon]))[0]
+        best_d, best_i = np.empty(0), np.empty(0, dtype=np.intp)
+        heap = [(self._bound(0, q), 0)]
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if len(best_d) == k and bound > best_d.max():
+                break
+            start, end, _, _, left, right = self.nodes[node]
+            if left < 0:
+                d = np.sqrt(((self.points[start:end] - q) ** 2).sum(axis=1))
+                best_d = np.concatenate([best_d, d])
+                best_i = np.concatenate([best_i, self.order[start:end]])
+                if len(best_d) > k:
+                    keep = np.argpartition(best_d, k - 1)[:k]
+                    best_d, best_i = best_d[keep], best_i[keep]
+                continue
+            for child in (left, right):
+                heapq.heappush(heap, (self._bound(child, q), child))
+        order = np.lexsort((best_i, best_d))
+        return chord_to_km(best_d[order]), best_i[order]
+
+    def query_radius(self, lat, lon, radius_km):
+        # (lat, lon) 에서 radius_km 이내의 점 인덱스 (오름차순)
+        if not self.nodes:
+            return np.empty(0, dtype=np.intp)
+        q = unit_vectors(np.array([lat]), np.array([lon]))[0]
+        limit = km_to_chord(radius_km)
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._bound(node, q) > limit:
+                continue
+            start, end, _, _, left, right = self.nodes[node]
+            if left < 0:
+                d = np.sqrt(((self.points[start:end] - q) ** 2).sum(axis=1))
+                found.append(self.order[start:end][d <= limit])
+            else:
+                stack.extend((left, right))
+        return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+
+class SpatialPruner:
+    """
+    run_model 에 넘기기 전에 선택 장소(is_mandatory False)를 기준 노드 주변으로 줄입니다.
+    - 기준 노드: 시작/종료 장소 (둘 다 없으면 필수 장소)
+    - k: 기준 노드마다 가장 가까운 선택 장소 k 곳
+    - radius: 이동시간(분, haversine_distance 와 같은 반올림 km + 10) 반경 안의 선택 장소
+    - 좌표는 데이터 형식대로 x_cord 를 경도, y_cord 를 위도로 읽습니다.
+    - 둘 다 주어지면 두 조건 중 하나라도 만족하는 장소를 남깁니다.
+    - 필수 장소와 식당 노드(식사 선택은 식사 그룹으로 처리)는 항상 남깁니다.
+    """
+
+    def __init__(self, k=None, radius=None, leaf_size=32):
+        if k is None and radius is None:
+            raise ValueError("k 또는 radius 중 하나는 지정해야 합니다.")
+        self.k = k
+        self.radius = radius
+        self.leaf_size = leaf_size
+
+    def keep(self, places, start_idx=None, end_idx=None):
+        # 남길 장소의 인덱스 (오름차순)
+        fixed = [i for i, p in enumerate(places)
+                 if i in (start_idx, end_idx) or p.get('is_mandatory', True) or p.get('category') == 'restaurant']
+        fixed_set = set(fixed)
+        optional = [i for i in range(len(places)) if i not in fixed_set]
+        anchors = [i for i in (start_idx, end_idx) if i is not None]
+        if not anchors:
+            anchors = [i for i in fixed if places[i].get('is_mandatory', True) and places[i].get('category') != 'restaurant']
+        if not optional or not anchors:
+            return list(range(len(places)))
+
+        # place_coords 는 (x_cord, y_cord) = (경도, 위도) 순서
+        lon, lat = place_coords([places[i] for i in optional])
+        tree = BallTree(lat, lon, self.leaf_size)
+        selected = set()
+        for a in anchors:
+            a_lat, a_lon = places[a]['y_cord'], places[a]['x_cord']
+            if self.k is not None:
+                selected.update(tree.query(a_lat, a_lon, self.k)[1].tolist())
+            if self.radius is not None:
+                # 이동시간은 반올림한 km + 10 이라 radius - 9.5 km 까지 후보로 찾고, 이동시간으로 다시 거름
+                near = tree.query_radius(a_lat, a_lon, self.radius - 9.5 + 1e-6)
+                travel = haversine_block(np.array([a_lat]), np.array([a_lon]), lat[near], lon[near])[0]
+                selected.update(near[travel <= self.radius].tolist())
+        return sorted(fixed + [optional[i] for i in selected])
+
+def prune_places(places, eff_wins, start_idx, end_idx, meal_groups, pruner):
+    """
+    pruner.keep 결과로 places / eff_wins 를 줄이고 인덱스(시작/종료, 식사 그룹)를 다시 매깁니다.
+    - 반환값: (places, eff_wins, start_idx, end_idx, meal_groups)
+    """
+    return keep_nodes(places, eff_wins, start_idx, end_idx, meal_groups, pruner.keep(places, start_idx, end_idx))
@@ -0,0 +1,150 @@
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+class SolveTrace:
+    """
+    run_model 한 번의 계측 기록입니다.
+    - phase(name): 단계별 소요 시간 (같은 이름은 합산)
+    - 탐색: 해 개수(solver 통계), 탐색 시간, 최종 objective
+    - search_events=True 이면 해마다 파이썬 콜백으로 첫 해까지 걸린 시간, 목적함수 변화 [(초, objective)] 도 기록
+      (콜백이 탐색 중 매번 호출되므로 필요할 때만 사용)
+    - event(message): 디버그 출력 대신 남기는 메시지
+    """
+
+    def __init__(self, search_events=False, **labels):
+        self.labels = labels
+        self.search_events = search_events
+        self.phases = {}
+        self.events = []
+        self.status = None
+        self.objective = None
+        self.solutions = 0
+        self.first_solution_seconds = None
+        self.trajectory = []
+        self.search_seconds = None
+        self._created = time.time()
+        self._search_t0 = None
+
+    @contextmanager
+    def phase(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - t0
+
+    def event(self, message):
+        self.events.append(message)
+
+    def watch_search(self, routing):
+        # search_events 일 때만 OR-Tools 해 발견 콜백 등록 (탐색 시작 시각은 start_search 에서 기록)
+        if not self.search_events:
+            return
+
+        def on_solution():
+            elapsed = time.perf_counter() - (self._search_t0 or time.perf_counter())
+            self.solutions += 1
+            if self.first_solution_seconds is None:
+                self.first_solution_seconds = elapsed
+            self.trajectory.append((round(elapsed, 6), routing.CostVar().Value()))
+
+        routing.AddAtSolutionCallback(on_solution)
+
+    def start_search(self):
+        self._search_t0 = time.perf_counter()
+
+    def end_search(self, routing):
+        # 탐색이 끝난 뒤 시간과 solver 통계를 기록 (콜백을 쓰면 해 개수는 콜백에서 센 값)
+        self.search_seconds = time.perf_counter() - self._search_t0
+        if not self.search_events:
+            self.solutions = routing.solver().Solutions()
+
+    def finish(self, status, objective=None):
+        self.status = status
+        self.objective = objective
+
+    def record(self):
+        return {
+            "timestamp": self._created,
+            **self.labels,
+            "status": self.status,
+            "objective": self.objective,
+            "total_seconds": sum(self.phases.values()),
+            "phases": dict(self.phases),
+            "solutions": self.solutions,
+            "search_seconds": self.search_seconds,
+            "first_solution_seconds": self.first_solution_seconds,
+            "trajectory": list(self.trajectory),
+            "events": list(self.events),
+        }
+
+    def export(self, *exporters):
+        record = self.record()
+        for exporter in exporters:
+            exporter.export(record)
+        return record
+
+class JsonLinesExporter:
+    # record 를 한 줄의 JSON 으로 파일(path) 또는 stream 에 기록
+    def __init__(self, path=None, stream=None):
+        self.path = path
+        self.stream = stream if stream is not None else (None if path else sys.stderr)
+        self._lock = threading.Lock()
+
+    def export(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            else:
+                self.stream.write(line)
+                self.stream.flush()
+
+class PrometheusExporter:
+    """
+    record 를 누적해 Prometheus 텍스트 형식으로 출력합니다.
+    - solver_solves_total{status}: 상태별 실행 횟수
+    - solver_phase_seconds{phase}: 단계별 시간 합계/횟수 (summary)
+    - solver_first_solution_seconds, solver_solutions_total
+    """
+
+    def __init__(self, prefix="solver"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.solves = {}
+        self.phases = {}
+        self.first_solution = [0.0, 0]
+        self.solutions = 0
+
+    def export(self, record):
+        with self._lock:
+            status = record.get("status") or "unknown"
+            self.solves[status] = self.solves.get(status, 0) + 1
+            for name, seconds in record.get("phases", {}).items():
+                total = self.phases.setdefault(name, [0.0, 0])
+                total[0] += seconds
+                total[1] += 1
+            if record.get("first_solution_seconds") is not None:
+                self.first_solution[0] += record["first_solution_seconds"]
+                self.first_solution[1] += 1
+            self.solutions += record.get("solutions", 0)
+
+    def render(self):
+        p = self.prefix
+        with self._lock:
+            lines = [f"# TYPE {p}_solves_total counter"]
+            lines += [f'{p}_solves_total{{status="{s}"}} {n}' for s, n in sorted(self.solves.items())]
+            lines.append(f"# TYPE {p}_phase_seconds summary")
+            for name, (seconds, count) in self.phases.items():
+                lines.append(f'{p}_phase_seconds_sum{{phase="{name}"}} {seconds:.6f}')
+                lines.append(f'{p}_phase_seconds_count{{phase="{name}"}} {count}')
+            lines.append(f"# TYPE {p}_first_solution_seconds summary")
+            lines.append(f"{p}_first_solution_seconds_sum {self.first_solution[0]:.6f}")
+            lines.append(f"{p}_first_solution_seconds_count {self.first_solution[1]}")
+            lines.append(f"# TYPE {p}_solutions_total counter")
+            lines.append(f"{p}_solutions_total {self.solutions}")
+        return "\n".join(lines) + "\n"
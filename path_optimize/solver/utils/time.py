@@ -1,26 +1,48 @@
 from datetime import datetime
 import re
 
-def time_to_minutes(time_str):
+TIME_PATTERN = re.compile(r'^\d{1,2}:\d{2}$')
+
+def parse_time_to_minutes(time_str):
     """
-    주어진 "HH:MM" 형식의 문자열을 분 단위 정수로 변환합니다.
+    캐시를 거치지 않고 "HH:MM" 문자열을 분 단위 정수로 변환합니다.
     - 올바른 형식이 아니면 ValueError를 발생시킵니다.
     """
     if not isinstance(time_str, str):
         raise ValueError("시간 입력은 문자열이어야 합니다.")
-        
-    if not re.match(r'^\d{1,2}:\d{2}$', time_str):
+
+    if not TIME_PATTERN.match(time_str):
         raise ValueError("시간 형식이 올바르지 않습니다. (예: 'HH:MM')")
-        
+
     try:
         dt = datetime.strptime(time_str, "%H:%M")
     except Exception as e:
         raise ValueError(f"time_to_minutes 변환 에러: {e}")
-    
+
     return dt.hour * 60 + dt.minute
 
+# 올바른 "H:MM" / "HH:MM" 문자열 전체 -> 분 (그 외 입력은 parse_time_to_minutes 로 같은 에러를 냄)
+MINUTES_BY_STR = {f"{h:{width}}:{m:02d}": h * 60 + m for width in ("02d", "d") for h in range(24) for m in range(60)}
+
+# 0분 ~ 48시간(자정 넘김 보정 범위) -> "HH:MM"
+TIME_STRS = [f"{m // 60:02d}:{m % 60:02d}" for m in range(2 * 1440)]
+
+def time_to_minutes(time_str):
+    """
+    주어진 "HH:MM" 형식의 문자열을 분 단위 정수로 변환합니다.
+    - 올바른 형식이 아니면 ValueError를 발생시킵니다.
+    - 올바른 문자열은 미리 만든 표에서 찾고, 표에 없으면 parse_time_to_minutes 로 검증합니다.
+    """
+    if type(time_str) is str:
+        minutes = MINUTES_BY_STR.get(time_str)
+        if minutes is not None:
+            return minutes
+    return parse_time_to_minutes(time_str)
+
 def minutes_to_time_str(minutes):
     # 분(min)을 HH:MM 형식 문자열로 변환
+    if type(minutes) is int and 0 <= minutes < len(TIME_STRS):
+        return TIME_STRS[minutes]
     hour = minutes // 60
     minute = minutes % 60
     return f"{hour:02d}:{minute:02d}"
@@ -33,4 +55,3 @@ def adjust_for_midnight(start, end):
     if end <= start:
         end += 1440
     return start, end
-
@@ -129,6 +129,28 @@ def compute_restaurant_windows(effective_open: int, effective_close: int, meal_i
         raise ValueError(f"식당 {place_name}은(는) 식사 선호 시간에 부합하는 윈도우가 없습니다.")
     return valid_windows
 
+def compute_place_windows(place: dict, global_start: int, global_end: int, meal_intervals: dict) -> list:
+    """
+    장소 하나의 가용 시간 윈도우 [(start, end, meal)] 를 계산합니다.
+    - 식당은 식사 타입별 윈도우, 그 외 장소는 meal 이 None 인 운영 구간입니다.
+    """
+    operational_segments = compute_operational_windows(place, global_start, global_end)
+    
+    if place.get("category") != "restaurant":
+        return [(start, end, None) for (start, end) in operational_segments]
+    
+    restaurant_windows = []
+    for segment in operational_segments:
+        seg_start, seg_end = segment
+        try:
+            windows = compute_restaurant_windows(seg_start, seg_end, meal_intervals, place["name"])
+            restaurant_windows.extend(windows)
+        except ValueError:
+            continue
+    if not restaurant_windows:
+        raise ValueError(f"식당 {place['name']}은(는) 식사 선호 시간에 부합하는 윈도우가 없습니다.")
+    return restaurant_windows
+
 def calculate_effective_time_windows(places: list, user: dict) -> dict:
     """
     사용자와 장소 정보를 기반으로 각 장소별 가용 시간 윈도우를 계산합니다.
@@ -143,21 +165,6 @@ def calculate_effective_time_windows(places: list, user: dict) -> dict:
     meal_intervals = compute_meal_intervals(meal_preferences, global_start, global_end)
     
     for place in places:
-        operational_segments = compute_operational_windows(place, global_start, global_end)
-        
-        if place.get("category") == "restaurant":
-            restaurant_windows = []
-            for segment in operational_segments:
-                seg_start, seg_end = segment
-                try:
-                    windows = compute_restaurant_windows(seg_start, seg_end, meal_intervals, place["name"])
-                    restaurant_windows.extend(windows)
-                except ValueError:
-                    continue
-            if not restaurant_windows:
-                raise ValueError(f"식당 {place['name']}은(는) 식사 선호 시간에 부합하는 윈도우가 없습니다.")
-            effective_windows[place["id"]] = restaurant_windows
-        else:
-            effective_windows[place["id"]] = [(start, end, None) for (start, end) in operational_segments]
+        effective_windows[place["id"]] = compute_place_windows(place, global_start, global_end, meal_intervals)
     
     return effective_windows
\ No newline at end of file
@@ -0,0 +1,179 @@
+import json
+import time
+import queue
+import hashlib
+import http.client
+import urllib.parse
+import numpy as np
+
+from solver.utils.distance import create_distance_array
+from solver.utils.routing import is_dummy_node
+
+def place_key(place):
+    # 리스트 위치가 아닌 장소 내용(좌표)으로 키를 생성 → 더미 노드/식당 분할로 인덱스가 바뀌어도 같은 키
+    return f"{float(place['x_cord'])!r}:{float(place['y_cord'])!r}"
+
+def count_pairs(n):
+    # 자기 자신을 제외한 순서쌍 개수
+    return n * (n - 1)
+
+class TravelTimeProvider:
+    """
+    run_model 이 사용하는 이동시간(분) 행렬 제공자 인터페이스입니다.
+    - matrix(places): places 순서대로의 int32 (n, n) 행렬, 대각선은 0
+    - stats: 캐시에서 가져온 쌍(hits)과 새로 계산/조회한 쌍(fetched)의 개수
+    - identity(): 같은 장소에 같은 행렬을 돌려주는 제공자끼리만 같은 값 (해 캐시 키에 사용)
+    """
+
+    def __init__(self):
+        self.stats = {"hits": 0, "fetched": 0}
+
+    def matrix(self, places):
+        raise NotImplementedError
+
+    def identity(self):
+        return [type(self).__name__]
+
+class HaversineProvider(TravelTimeProvider):
+    # 하버사인 거리(km) + 10 을 이동시간으로 사용 (기존 create_distance_matrix 와 동일)
+
+    def matrix(self, places):
+        self.stats["fetched"] += count_pairs(len(places))
+        return create_distance_array(places)
+
+class MatrixFileProvider(TravelTimeProvider):
+    """
+    미리 계산된 이동시간 행렬 파일을 사용합니다.
+    - 파일 형식(JSON): {"ids": [장소 id, ...], "matrix": [[분, ...], ...]}
+    - 분할된 식당 노드는 원래 장소 id(place_id)로 조회하며, 더미 노드의 행/열은 0 입니다.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw.decode("utf-8"))
+        self.path = path
+        self._digest = hashlib.sha256(raw).hexdigest()
+        self._index = {str(pid): i for i, pid in enumerate(data["ids"])}
+        self._matrix = np.array(data["matrix"], dtype=np.int32)
+        if self._matrix.shape != (len(self._index), len(self._index)):
+            raise ValueError(f"이동시간 행렬 크기가 id 개수와 맞지 않습니다: {path}")
+
+    def identity(self):
+        # 경로가 같아도 파일 내용이 바뀌면 다른 제공자
+        return [type(self).__name__, self.path, self._digest]
+
+    def _row(self, place):
+        pid = str(place.get("place_id", place.get("id")))
+        if pid not in self._index:
+            raise ValueError(f"장소 {pid}의 이동시간 정보가 없습니다.")
+        return self._index[pid]
+
+    def matrix(self, places):
+        real = [i for i, p in enumerate(places) if not is_dummy_node(p.get("name"))]
+        rows = np.array([self._row(places[i]) for i in real], dtype=np.intp)
+
+        matrix = np.zeros((len(places), len(places)), dtype=np.int32)
+        matrix[np.ix_(real, real)] = self._matrix[np.ix_(rows, rows)]
+        np.fill_diagonal(matrix, 0)
+        self.stats["hits"] += count_pairs(len(real))
+        return matrix
+
+class HttpTableProvider(TravelTimeProvider):
+    """
+    OSRM table 서비스 형식의 HTTP API 로 이동시간을 조회합니다.
+    - 캐시에 없는 쌍이 있으면 요청된 모든 좌표를 한 번의 table 요청으로 조회합니다.
+    - keep-alive 연결을 pool_size 개까지 재사용하고, 연결 오류/5xx 응답은 retries 번 재시도합니다.
+    - 조회한 값은 좌표 쌍 단위로 캐시합니다 (초 → 분 반올림).
+    """
+
+    def __init__(self, base_url, profile="driving", timeout=10, retries=3, backoff=0.2, pool_size=4):
+        super().__init__()
+        parsed = urllib.parse.urlsplit(base_url)
+        self.scheme = parsed.scheme or "http"
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.base_path = parsed.path.rstrip("/")
+        self.base_url = base_url.rstrip("/")
+        self.profile = profile
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._cache = {}
+
+    def identity(self):
+        return [type(self).__name__, self.base_url, self.profile]
+
+    def _connect(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            conn_cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            return conn_cls(self.host, self.port, timeout=self.timeout)
+
+    def _release(self, conn):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _get(self, path):
+        last_error = None
+        for attempt in range(self.retries + 1):
+            conn = self._connect()
+            try:
+                conn.request("GET", path, headers={"Connection": "keep-alive"})
+                resp = conn.getresponse()
+                body = resp.read()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                last_error = e
+            else:
+                self._release(conn)
+                if resp.status < 500:
+                    if resp.status != 200:
+                        raise ValueError(f"이동시간 조회 실패 (HTTP {resp.status}): {body[:200]!r}")
+                    return json.loads(body)
+                last_error = ValueError(f"HTTP {resp.status}")
+            if attempt < self.retries:
+                time.sleep(self.backoff * (2 ** attempt))
+        raise ConnectionError(f"이동시간 조회 재시도 실패: {last_error}")
+
+    def _fetch(self, coords):
+        # coords: [(x_cord, y_cord)] (경도, 위도 순서)
+        locs = ";".join(f"{x},{y}" for x, y in coords)
+        path = f"{self.base_path}/table/v1/{self.profile}/{locs}?annotations=duration"
+        data = self._get(path)
+        if data.get("code") != "Ok":
+            raise ValueError(f"이동시간 조회 실패: {data.get('code')}")
+        return data["durations"]
+
+    def matrix(self, places):
+        real = [i for i, p in enumerate(places) if not is_dummy_node(p.get("name"))]
+        keys = [place_key(places[i]) for i in real]
+        uniq = list(dict.fromkeys(keys))
+
+        missing = sum(1 for a in uniq for b in uniq if a != b and (a, b) not in self._cache)
+        if missing or any((a, a) not in self._cache for a in uniq):
+            coords = [tuple(map(float, k.split(":"))) for k in uniq]
+            durations = self._fetch(coords)
+            for a, row in zip(uniq, durations):
+                for b, sec in zip(uniq, row):
+                    if sec is None:
+                        raise ValueError(f"두 장소 사이의 경로를 찾을 수 없습니다: {a} → {b}")
+                    self._cache[(a, b)] = int(round(sec / 60))
+        self.stats["fetched"] += missing
+        self.stats["hits"] += count_pairs(len(uniq)) - missing
+
+        matrix = np.zeros((len(places), len(places)), dtype=np.int32)
+        for r, a in zip(real, keys):
+            for c, b in zip(real, keys):
+                if r != c:
+                    matrix[r, c] = self._cache[(a, b)]
+        return matrix
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
@@ -0,0 +1,119 @@
+import numpy as np
+
+from solver.utils.time import time_to_minutes, adjust_for_midnight
+from solver.utils.time_windows import compute_meal_intervals, compute_place_windows
+
+def parse_times(strings):
+    # 같은 문자열은 한 번만 변환
+    parsed = {}
+    for s in strings:
+        if s not in parsed:
+            parsed[s] = time_to_minutes(s)
+    return parsed
+
+def parse_breaks(place):
+    # compute_operational_windows 와 같은 규칙: 짝수 개일 때만, 변환할 수 없는 쌍은 건너뜀
+    bt = place.get("break_time") or []
+    if len(bt) % 2 != 0:
+        return []
+    pairs = []
+    for i in range(0, len(bt), 2):
+        try:
+            pairs.append(adjust_for_midnight(time_to_minutes(bt[i]), time_to_minutes(bt[i + 1])))
+        except Exception:
+            continue
+    return pairs
+
+class PlaceTimeTable:
+    """
+    장소 목록의 영업/휴식 시간을 한 번만 파싱해 int16 배열로 저장하고,
+    사용자 일정마다 모든 장소의 유효 윈도우를 NumPy 연산으로 한꺼번에 계산합니다.
+    - effective_windows(user) 는 calculate_effective_time_windows 와 같은 {id: [(start, end, meal)]} 를 반환합니다.
+    - 유효 영업 구간이 비거나 뒤집힌 장소(자정 넘김 보정이 다시 적용되는 경우)는 기존 함수로 계산합니다.
+    """
+
+    def __init__(self, places):
+        self.places = list(places)
+        n = len(self.places)
+        times = parse_times([p["open_time"] for p in self.places] + [p["close_time"] for p in self.places])
+        opens, closes = [], []
+        for p in self.places:
+            o, c = adjust_for_midnight(times[p["open_time"]], times[p["close_time"]])
+            opens.append(o)
+            closes.append(c)
+        self.open = np.array(opens, dtype=np.int16)
+        self.close = np.array(closes, dtype=np.int16)
+
+        # 휴식 시간: (n, 최대 휴식 개수, 2), 빈 칸은 (0, 0)
+        breaks = [parse_breaks(p) for p in self.places]
+        width = max((len(b) for b in breaks), default=0)
+        self.breaks = np.zeros((n, width, 2), dtype=np.int16)
+        for i, pairs in enumerate(breaks):
+            if pairs:
+                self.breaks[i, :len(pairs)] = pairs
+
+        self.is_restaurant = np.array([p.get("category") == "restaurant" for p in self.places], dtype=bool)
+        self.ids = [p["id"] for p in self.places]
+
+    def __len__(self):
+        return len(self.places)
+
+    def operational_segments(self, global_start, global_end):
+        """
+        모든 장소의 운영 구간(영업 시간 - 휴식 시간)을 계산합니다.
+        - 반환값: (starts, ends, valid) 각 (n, 휴식 개수 + 1), 그리고 기존 함수로 계산해야 하는 행 마스크
+        """
+        eo = np.maximum(self.open.astype(np.int32), global_start)
+        ec = np.minimum(self.close.astype(np.int32), global_end)
+        irregular = eo >= ec
+
+        # 영업 구간으로 자른 휴식 시간 (겹치지 않으면 eo 위치의 빈 구간)
+        bs = np.maximum(self.breaks[:, :, 0].astype(np.int32), eo[:, None])
+        be = np.minimum(self.breaks[:, :, 1].astype(np.int32), ec[:, None])
+        empty = bs >= be
+        bs[empty] = np.broadcast_to(eo[:, None], bs.shape)[empty]
+        be[empty] = bs[empty]
+
+        # 시작 순으로 정렬 후, 앞선 휴식들이 덮는 끝(누적 최대)과 다음 휴식 시작 사이가 운영 구간
+        order = np.argsort(bs, axis=1, kind="stable")
+        bs = np.take_along_axis(bs, order, axis=1)
+        be = np.take_along_axis(be, order, axis=1)
+        covered = np.maximum(np.maximum.accumulate(be, axis=1), eo[:, None])
+        prev = np.concatenate([eo[:, None], covered], axis=1)
+        nxt = np.concatenate([bs, ec[:, None]], axis=1)
+        return prev, nxt, prev < nxt, irregular
+
+    def effective_windows(self, user):
+        global_start, global_end = adjust_for_midnight(time_to_minutes(user["start_time"]), time_to_minutes(user["end_time"]))
+        meal_intervals = compute_meal_intervals(user.get("meal_time_preferences", {}), global_start, global_end)
+        if not self.places:
+            return {}
+        seg_start, seg_end, seg_valid, irregular = self.operational_segments(global_start, global_end)
+        windows = [[] for _ in self.places]
+
+        # 식당이 아닌 장소: 유효한 운영 구간 그대로 (행 우선 순서 = 장소별 시간 순)
+        rows, cols = np.nonzero(seg_valid & ~self.is_restaurant[:, None])
+        for r, s, e in zip(rows.tolist(), seg_start[rows, cols].tolist(), seg_end[rows, cols].tolist()):
+            windows[r].append((s, e, None))
+
+        # 식당: 운영 구간 x 식사 구간 교집합 (구간 순 -> 식사 순, 기존 함수와 같은 순서)
+        meals = list(meal_intervals)
+        restaurants = np.flatnonzero(self.is_restaurant)
+        if meals and len(restaurants):
+            ms = np.array([meal_intervals[m][0] for m in meals], dtype=np.int32)
+            me = np.array([meal_intervals[m][1] for m in meals], dtype=np.int32)
+            ws = np.maximum(seg_start[restaurants][:, :, None], ms)
+            we = np.minimum(seg_end[restaurants][:, :, None], me)
+            rows, cols, ks = np.nonzero(seg_valid[restaurants][:, :, None] & (ws < we))
+            for r, s, e, k in zip(restaurants[rows].tolist(), ws[rows, cols, ks].tolist(),
+                                  we[rows, cols, ks].tolist(), ks.tolist()):
+                windows[r].append((s, e, meals[k]))
+
+        effective_windows = {}
+        for i, (place, restaurant, odd) in enumerate(zip(self.places, self.is_restaurant.tolist(), irregular.tolist())):
+            if odd:
+                windows[i] = compute_place_windows(place, global_start, global_end, meal_intervals)
+            elif restaurant and not windows[i]:
+                raise ValueError(f"식당 {place['name']}은(는) 식사 선호 시간에 부합하는 윈도우가 없습니다.")
+            effective_windows[self.ids[i]] = windows[i]
+        return effective_windows
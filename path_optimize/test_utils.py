@@ -1,12 +1,9 @@
 import os
 import json
 import pprint
-import itertools
 from tabulate import tabulate
 
-from solver.utils.time_windows import calculate_effective_time_windows
-from solver.routing_solver import run_model
-from solver.utils.places import split_restaurant_nodes
+from solver.day_solver import solve_day
 
 def run_all_test_cases_in(folder_path: str):
     print(f"\n=== [INFO] 폴더 실행 시작: {folder_path} ===\n")
@@ -28,41 +25,15 @@ def run_all_test_cases_in(folder_path: str):
             user = data.get("user", {})
             day_info = data.get("day_info", {})
 
-            eff_windows = calculate_effective_time_windows(places, user)
-            new_places, new_eff_windows = split_restaurant_nodes(places, eff_windows)
-
-            meal_groups = {}
-            for i, p in enumerate(new_places):
-                if p.get("category") == "restaurant":
-                    meal_type = new_eff_windows[i][2]
-                    if meal_type is not None:
-                        meal_groups.setdefault(meal_type, []).append(i)
-
-            group_indices = list(meal_groups.values())
-            selections = list(itertools.product(*group_indices)) if group_indices else [()]
-
-            results = {}
-            for sel in selections:
-                selected_indices = set(sel)
-                for i, p in enumerate(new_places):
-                    if p.get("category") != "restaurant":
-                        selected_indices.add(i)
-                selected_indices = sorted(selected_indices)
-
-                selected_places = [new_places[i] for i in selected_indices]
-                selected_eff_windows = [new_eff_windows[i] for i in selected_indices]
-
-                route, obj = run_model(selected_places, selected_eff_windows, day_info, user)
-                results[sel] = {"objective": obj, "route": route} if route else None
+            day = solve_day(places, day_info, user)
 
             pprint.pprint("[DEBUG] 최종 결과:")
-            for sel, result in results.items():
-                meal_labels = tuple(new_eff_windows[i][2] for i in sel)
+            for result in day["alternatives"]:
                 print("\n" + "="*80)
-                print(f"Option {meal_labels!r}")
+                print(f"Option {result['meals']!r}")
                 print("-"*80)
 
-                if not result:
+                if not result["route"]:
                     print("  (해결 불가)\n")
                     continue
 
@@ -1,4 +1,40 @@
 import sys
 import os
+import json
+import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'solver')))
+
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.places import split_restaurant_nodes, group_meal_nodes, enumerate_meal_selections, select_nodes
+
+SCENARIO_DIR = os.path.join(os.path.dirname(__file__), 'scenarios', 'base')
+
+def read_scenario(name):
+    with open(os.path.join(SCENARIO_DIR, name), encoding='utf-8') as f:
+        return json.load(f)
+
+@pytest.fixture
+def load_scenario():
+    # scenarios/base 의 시나리오 JSON 원본
+    return read_scenario
+
+@pytest.fixture
+def load_split_scenario():
+    # 식당 노드를 식사 타입별로 분할한 (places, wins, day_info, user)
+    def load(name):
+        data = read_scenario(name)
+        eff_windows = calculate_effective_time_windows(data["places"], data["user"])
+        places, wins = split_restaurant_nodes(data["places"], eff_windows)
+        return places, wins, data["day_info"], data["user"]
+    return load
+
+@pytest.fixture
+def load_first_selection(load_split_scenario):
+    # load_split_scenario 에서 첫 번째 식사 조합만 남긴 (places, wins, day_info, user)
+    def load(name):
+        places, wins, day_info, user = load_split_scenario(name)
+        sel = enumerate_meal_selections(group_meal_nodes(places, wins))[0]
+        places, wins = select_nodes(places, wins, sel)
+        return places, wins, day_info, user
+    return load
@@ -0,0 +1,47 @@
+import os
+import json
+from solver.day_solver import solve_day
+from solver.routing_solver import run_model
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.places import split_restaurant_nodes, group_meal_nodes, enumerate_meal_selections, select_nodes
+
+SCENARIO_DIR = os.path.join(os.path.dirname(__file__), '..', 'scenarios', 'base')
+
+def load_scenario(name):
+    with open(os.path.join(SCENARIO_DIR, name), encoding='utf-8') as f:
+        data = json.load(f)
+    return data["places"], data["day_info"], data["user"]
+
+def test_solve_day_matches_sequential_enumeration():
+    places, day_info, user = load_scenario('tc5_too_many_restaurants.json')
+
+    # 기존 방식: 조합을 순차적으로 run_model
+    eff_windows = calculate_effective_time_windows(places, user)
+    new_places, new_wins = split_restaurant_nodes(places, eff_windows)
+    selections = enumerate_meal_selections(group_meal_nodes(new_places, new_wins))
+    expected = {}
+    for sel in selections:
+        selected_places, selected_wins = select_nodes(new_places, new_wins, sel)
+        route, obj = run_model(selected_places, selected_wins, day_info, user)
+        expected[sel] = obj if route else None
+
+    day = solve_day(places, day_info, user, max_workers=2)
+    assert [alt["selection"] for alt in day["alternatives"]] == selections
+    assert {alt["selection"]: alt["objective"] for alt in day["alternatives"]} == expected
+
+    feasible = [obj for obj in expected.values() if obj is not None]
+    assert day["best"]["objective"] == min(feasible)
+
+def test_solve_day_without_restaurants():
+    places, day_info, user = load_scenario('tc6_no_restaurant.json')
+    day = solve_day(places, day_info, user, max_workers=1)
+    assert len(day["alternatives"]) == 1
+    assert day["alternatives"][0]["meals"] == ()
+    assert day["best"] is day["alternatives"][0]
+
+def test_solve_day_with_matrix_cache(tmp_path):
+    places, day_info, user = load_scenario('tc5_too_many_restaurants.json')
+    plain = solve_day(places, day_info, user, max_workers=1)
+    cached = solve_day(places, day_info, user, max_workers=2, matrix_cache_path=str(tmp_path))
+    assert [alt["objective"] for alt in cached["alternatives"]] == [alt["objective"] for alt in plain["alternatives"]]
+    assert (tmp_path / "cache.npz").exists()
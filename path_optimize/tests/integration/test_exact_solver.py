@@ -0,0 +1,50 @@
+import pytest
+from solver.routing_solver import run_model, run_meal_choice_model
+from solver.solver_config import SolverConfig
+
+SCENARIOS = ['tc5_too_many_restaurants.json', 'tc6_no_restaurant.json', 'tc8_no_accommodation.json',
+             'day-arrival/tc1_day-arrival-7.json', 'day-main/tc2-day-main-7.json', 'day-departure/tc3-day-departure-1.json',
+             'day-trip/tc4-day-trip-4.json']
+
+EXACT = SolverConfig(exact_threshold=10)
+SEARCH = SolverConfig(first_solution_strategy="PATH_CHEAPEST_ARC", local_search_metaheuristic="GUIDED_LOCAL_SEARCH",
+                      time_limit=2, no_improvement_window=0.3)
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_exact_matches_search_objective_and_shape(name, load_split_scenario):
+    places, wins, day_info, user = load_split_scenario(name)
+    route, obj = run_meal_choice_model(list(places), list(wins), day_info, user, config=SEARCH)
+    exact_route, exact_obj = run_meal_choice_model(list(places), list(wins), day_info, user, config=EXACT)
+
+    assert exact_obj == obj
+    assert [sorted(r) for r in exact_route] == [sorted(r) for r in route]
+    assert [r['order'] for r in exact_route] == list(range(1, len(exact_route) + 1))
+
+def place(pid, name, open_time, close_time, category="landmark", mandatory=True):
+    return {"id": pid, "name": name, "x_cord": 33.5, "y_cord": 126.5 + 0.01 * pid, "category": category,
+            "open_time": open_time, "close_time": close_time, "service_time": 60, "is_mandatory": mandatory}
+
+def test_exact_reports_infeasible_day():
+    places = [place(0, "숙소", "00:00", "23:59", "accommodation"), place(1, "박물관", "09:00", "10:00"),
+              place(2, "시장", "09:00", "10:00"), place(3, "숙소", "00:00", "23:59", "accommodation")]
+    wins = [(480, 1260, None), (540, 600, None), (540, 600, None), (480, 1260, None)]
+    day_info = {"is_first_day": False, "is_last_day": False}
+    user = {"start_time": "08:00", "end_time": "21:00"}
+    assert run_model(list(places), list(wins), day_info, user, config=EXACT) == (None, None)
+
+    places[2]["is_mandatory"] = False
+    route, obj = run_model(list(places), list(wins), day_info, user, config=EXACT)
+    assert [r['place'] for r in route] == ["숙소", "박물관", "숙소"]
+    assert obj == run_model(list(places), list(wins), day_info, user, config=SEARCH)[1]
+
+def test_exact_and_search_agree_on_empty_optional_window():
+    # 활동 시간 밖에만 여는 선택 장소: 두 경로 모두 그 장소를 빼고 같은 답을 냄
+    places = [place(0, "숙소", "00:00", "23:59", "accommodation"), place(1, "박물관", "09:00", "12:00"),
+              place(2, "야시장", "22:00", "23:30", mandatory=False), place(3, "숙소", "00:00", "23:59", "accommodation")]
+    wins = [(480, 1260, None), (540, 720, None), (1320, 1410, None), (480, 1260, None)]
+    day_info = {"is_first_day": False, "is_last_day": False}
+    user = {"start_time": "08:00", "end_time": "21:00"}
+    exact_route, exact_obj = run_model(list(places), list(wins), day_info, user, config=EXACT)
+    route, obj = run_model(list(places), list(wins), day_info, user, config=SEARCH)
+    assert [r['place'] for r in exact_route] == [r['place'] for r in route] == ["숙소", "박물관", "숙소"]
+    assert exact_obj == obj
@@ -0,0 +1,48 @@
+from solver.routing_solver import run_model, run_meal_choice_model
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.places import split_restaurant_nodes, group_meal_nodes, enumerate_meal_selections, select_nodes
+from solver.utils.spatial import SpatialPruner
+from solver.solver_config import SolverConfig
+
+def test_meal_choice_model_visits_at_most_one_restaurant_per_meal(load_split_scenario):
+    places, wins, day_info, user = load_split_scenario('tc5_too_many_restaurants.json')
+    meal_by_name = {p["name"]: wins[i][2] for i, p in enumerate(places) if p.get("category") == "restaurant"}
+
+    route, obj = run_meal_choice_model(list(places), list(wins), day_info, user)
+    assert route is not None
+    visited_meals = [meal_by_name[r["place"]] for r in route if r["place"] in meal_by_name]
+    assert len(visited_meals) == len(set(visited_meals))
+    assert visited_meals
+
+def test_meal_is_kept_over_optional_place(load_scenario):
+    # 먼 점심 식당과 점심 시간을 모두 차지하는 가까운 선택 장소 중 하나만 방문 가능하면 식사를 남김
+    data = load_scenario('tc5_too_many_restaurants.json')
+    by_name = {p["name"]: p for p in data["places"]}
+    lunch = dict(by_name["중식당"], x_cord=127.2)
+    museum = dict(by_name["제주공항"], id=9, name="박물관", category="tourist", open_time="11:00", close_time="11:10",
+                  service_time=180, is_mandatory=False)
+    places = [by_name["제주공항"], lunch, museum, by_name["호텔 난타"]]
+    places, wins = split_restaurant_nodes(places, calculate_effective_time_windows(places, data["user"]))
+
+    for config in (None, SolverConfig(exact_threshold=10)):
+        route, obj = run_meal_choice_model(list(places), list(wins), data["day_info"], data["user"], config=config)
+        assert [r["place"] for r in route] == ["제주공항", "중식당", "호텔 난타"]
+
+def test_meal_choice_model_not_worse_than_enumeration(load_split_scenario):
+    places, wins, day_info, user = load_split_scenario('tc5_too_many_restaurants.json')
+
+    objectives = []
+    for sel in enumerate_meal_selections(group_meal_nodes(places, wins)):
+        selected_places, selected_wins = select_nodes(places, wins, sel)
+        route, obj = run_model(selected_places, selected_wins, day_info, user)
+        if route:
+            objectives.append(obj)
+
+    route, obj = run_meal_choice_model(list(places), list(wins), day_info, user)
+    assert obj <= min(objectives)
+
+def test_pruner_with_large_k_gives_same_result(load_split_scenario):
+    places, wins, day_info, user = load_split_scenario('tc10_too_many_places.json')
+    route, obj = run_meal_choice_model(list(places), list(wins), day_info, user)
+    pruned_route, pruned_obj = run_meal_choice_model(list(places), list(wins), day_info, user, pruner=SpatialPruner(k=len(places)))
+    assert (pruned_route, pruned_obj) == (route, obj)
@@ -0,0 +1,31 @@
+from solver.routing_solver import run_model, reoptimize_model
+from solver.utils.routing import map_route_to_nodes, route_place_ids
+
+def test_map_route_to_nodes():
+    places = [{"id": 1, "name": "숙소"}, {"id": 5, "name": "A"}, {"id": 7, "name": "B"}, {"name": "dummy_end"}]
+    route = [{"id": 1}, {"id": 7}, {"id": 9}, {"id": 5}, {"id": 7}]
+    assert map_route_to_nodes(route_place_ids(route), places, 0, 3) == [2, 1]
+
+def test_reoptimize_after_dropping_a_place(load_first_selection):
+    places, wins, day_info, user = load_first_selection('tc10_too_many_places.json')
+    route, obj = run_model(list(places), list(wins), day_info, user)
+    assert route is not None
+
+    # 사용자가 관광지 하나를 삭제
+    dropped = next(r["id"] for r in route[1:-1] if r["id"] is not None)
+    keep = [i for i, p in enumerate(places) if p.get("id") != dropped]
+    new_places = [places[i] for i in keep]
+    new_wins = [wins[i] for i in keep]
+
+    new_route, new_obj = reoptimize_model(new_places, new_wins, day_info, user, route)
+    assert new_route is not None
+    assert dropped not in [r["id"] for r in new_route]
+
+    cold_route, cold_obj = run_model(list(new_places), list(new_wins), day_info, user)
+    assert new_obj <= cold_obj
+
+def test_reoptimize_with_place_ids(load_first_selection):
+    places, wins, day_info, user = load_first_selection('tc10_too_many_places.json')
+    route, obj = run_model(list(places), list(wins), day_info, user)
+    warm_route, warm_obj = reoptimize_model(list(places), list(wins), day_info, user, [r["id"] for r in route])
+    assert warm_obj <= obj
@@ -0,0 +1,153 @@
+import json
+import time
+import threading
+import http.client
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import pytest
+from solver.service import SolverService, ServiceBusyError, create_server, request_key, solve_request, remaining_budget
+from solver.solver_config import ADAPTIVE_CONFIG
+from solver.utils.catalog import compile_catalog
+
+class ManualExecutor:
+    # 테스트에서 작업 완료 시점을 직접 제어
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.jobs.append((future, fn, args))
+        return future
+
+    def run_all(self):
+        for future, fn, args in self.jobs:
+            future.set_result(fn(*args))
+        self.jobs = []
+
+    def shutdown(self, wait=True):
+        pass
+
+def test_request_key_ignores_key_order_and_deadline(load_scenario):
+    request = load_scenario('tc6_no_restaurant.json')
+    reordered = {"day_info": request["day_info"], "user": request["user"], "places": request["places"], "deadline": 3}
+    assert request_key(request) == request_key(reordered)
+
+def test_identical_requests_are_coalesced(load_scenario):
+    executor = ManualExecutor()
+    service = SolverService(executor=executor)
+    request = load_scenario('tc5_too_many_restaurants.json')
+
+    first = service.submit(request)
+    second = service.submit(json.loads(json.dumps(request)))
+    assert first is second
+    assert len(executor.jobs) == 1
+
+    executor.run_all()
+    assert first.result()["route"] is not None
+    assert service.stats["coalesced"] == 1 and service.stats["completed"] == 1
+
+def test_backpressure_rejects_when_full(load_scenario):
+    executor = ManualExecutor()
+    service = SolverService(max_pending=1, executor=executor)
+    service.submit(load_scenario('tc5_too_many_restaurants.json'))
+    with pytest.raises(ServiceBusyError):
+        service.submit(load_scenario('tc6_no_restaurant.json'))
+
+    executor.run_all()
+    service.submit(load_scenario('tc6_no_restaurant.json'))
+    assert service.stats["rejected"] == 1
+
+def test_deadline_maps_to_time_limit(load_scenario):
+    executor = ManualExecutor()
+    service = SolverService(executor=executor, margin=0.5)
+    before = time.monotonic()
+    service.submit(load_scenario('tc6_no_restaurant.json'), deadline=2)
+    _, expires_at, margin, _, config = executor.jobs[0][2]
+    assert before + 2 <= expires_at <= time.monotonic() + 2
+    assert margin == 0.5 and config is ADAPTIVE_CONFIG
+    with pytest.raises(ValueError):
+        service.submit(load_scenario('tc8_no_accommodation.json'), deadline=0)
+
+def test_queue_wait_is_subtracted_from_budget(load_scenario):
+    # 대기열에서 기다린 시간만큼 탐색 시간이 줄고, 마감이 지나면 풀지 않음
+    assert remaining_budget(time.monotonic() + 2, 0.5) <= 1.5
+    assert remaining_budget(time.monotonic() + 0.3, 0.5) == 0.1
+    with pytest.raises(FutureTimeoutError):
+        solve_request(load_scenario('tc6_no_restaurant.json'), time.monotonic() - 1)
+
+def test_solve_timeout_cancels_pending_future(load_scenario):
+    executor = ManualExecutor()
+    service = SolverService(executor=executor)
+    with pytest.raises(FutureTimeoutError):
+        service.solve(load_scenario('tc6_no_restaurant.json'), deadline=0.05)
+    assert executor.jobs[0][0].cancelled()
+    assert service.stats["completed"] == 1
+
+class FailingExecutor(ManualExecutor):
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(RuntimeError("worker crashed"))
+        return future
+
+def test_unexpected_worker_error_is_500(load_scenario):
+    service = SolverService(executor=FailingExecutor())
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=30)
+        conn.request("POST", "/solve", json.dumps(load_scenario('tc6_no_restaurant.json')), {"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        assert resp.status == 500
+        assert "worker crashed" in json.loads(resp.read())["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_http_solve_endpoint(load_scenario):
+    service = SolverService(executor=ThreadPoolExecutor(max_workers=2))
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=30)
+        body = json.dumps({**load_scenario('tc6_no_restaurant.json'), "deadline": 3})
+        conn.request("POST", "/solve", body, {"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        result = json.loads(resp.read())
+        assert resp.status == 200
+        assert [r["place"] for r in result["route"]][0] == "호텔 난타"
+        assert "telemetry" not in result
+
+        conn.request("POST", "/solve", json.dumps({"user": {}}), {"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        resp.read()
+        assert resp.status == 400
+
+        for body in (json.dumps([1, 2]), json.dumps({**load_scenario('tc6_no_restaurant.json'), "deadline": 0})):
+            conn.request("POST", "/solve", body, {"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == 400
+
+        conn.request("GET", "/stats")
+        resp = conn.getresponse()
+        assert json.loads(resp.read())["completed"] >= 1
+
+        conn.request("GET", "/metrics")
+        resp = conn.getresponse()
+        assert resp.status == 200
+        assert 'solver_solves_total{status=' in resp.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.shutdown()
+
+def test_place_ids_are_resolved_from_catalog(tmp_path, load_scenario):
+    request = load_scenario('tc6_no_restaurant.json')
+    compile_catalog(request["places"], str(tmp_path))
+    by_ids = {"place_ids": [p["id"] for p in request["places"]], "user": request["user"], "day_info": request["day_info"]}
+    assert request_key(by_ids) != request_key({**by_ids, "place_ids": by_ids["place_ids"][:-1]})
+    expires_at = time.monotonic() + 10
+    by_ids_result = solve_request(by_ids, expires_at, catalog_path=str(tmp_path))
+    result = solve_request(request, expires_at)
+    assert (by_ids_result["route"], by_ids_result["objective"]) == (result["route"], result["objective"])
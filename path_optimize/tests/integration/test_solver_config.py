@@ -0,0 +1,32 @@
+import time
+import pytest
+from ortools.constraint_solver import routing_enums_pb2
+from solver.routing_solver import run_model
+from solver.solver_config import SolverConfig, ADAPTIVE_CONFIG
+
+def test_search_parameters():
+    config = SolverConfig(first_solution_strategy="PATH_CHEAPEST_ARC", local_search_metaheuristic="GUIDED_LOCAL_SEARCH",
+                          time_limit=3, solution_limit=50, lns_time_limit=0.2)
+    params = config.search_parameters(12)
+    assert params.first_solution_strategy == routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC
+    assert params.local_search_metaheuristic == routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
+    assert params.time_limit.ToMilliseconds() == 3000
+    assert params.solution_limit == 50
+    assert params.lns_time_limit.ToMilliseconds() == 200
+
+def test_adaptive_budget_scales_with_nodes():
+    config = SolverConfig(adaptive_budget=True, time_limit=2, base_time=0.2, time_per_node=0.1)
+    assert config.time_budget(5) == pytest.approx(0.7)
+    assert config.time_budget(100) == 2
+
+def test_early_stopping_ends_guided_local_search(load_first_selection):
+    places, wins, day_info, user = load_first_selection('tc10_too_many_places.json')
+    config = SolverConfig(local_search_metaheuristic="GUIDED_LOCAL_SEARCH", time_limit=10, no_improvement_window=0.3)
+
+    t0 = time.perf_counter()
+    route, obj = run_model(places, wins, day_info, user, config=config)
+    assert route is not None
+    assert time.perf_counter() - t0 < 5
+
+    route, obj = run_model(places, wins, day_info, user, config=ADAPTIVE_CONFIG)
+    assert route is not None
@@ -0,0 +1,38 @@
+from solver.routing_solver import run_model, run_meal_choice_model, sparse_successors
+from solver.solver_config import SolverConfig
+from solver.utils.distance import create_distance_array
+from solver.utils.telemetry import SolveTrace
+
+def place(pid, name, x, y, category="landmark", mandatory=True):
+    return {"id": pid, "name": name, "x_cord": x, "y_cord": y, "category": category, "service_time": 30,
+            "is_mandatory": mandatory}
+
+def test_sparse_successors_are_symmetric_k_nearest():
+    places = [place(i, f"장소{i}", 33.0 + 0.01 * i, 126.5) for i in range(6)]
+    allowed = sparse_successors(create_distance_array(places), 1, places)
+    assert not allowed.diagonal().any()
+    assert (allowed == allowed.T).all()
+    assert allowed[0].tolist() == [False, True, False, False, False, False]
+    assert allowed.sum(axis=1).min() >= 1
+
+def test_large_k_matches_dense_model(load_split_scenario):
+    places, wins, day_info, user = load_split_scenario('tc10_too_many_places.json')
+    dense = run_meal_choice_model(list(places), list(wins), day_info, user, config=SolverConfig(time_limit=2))
+    sparse = run_meal_choice_model(list(places), list(wins), day_info, user,
+                                   config=SolverConfig(time_limit=2, sparse_neighbors=len(places)))
+    assert sparse == dense
+
+def test_infeasible_sparse_model_falls_back_to_dense():
+    # 필수 장소 두 곳이 서로만 이웃이라 희소 모델에서는 숙소에서 도달할 수 없음
+    places = [place(0, "숙소", 33.50, 126.50, "accommodation"), place(1, "근처", 33.501, 126.50, mandatory=False),
+              place(2, "먼 곳1", 33.30, 126.30), place(3, "먼 곳2", 33.301, 126.30),
+              place(4, "숙소", 33.50, 126.50, "accommodation")]
+    wins = [(480, 1260, None)] * len(places)
+    user = {"start_time": "08:00", "end_time": "21:00"}
+    day_info = {"is_first_day": False, "is_last_day": False}
+
+    trace = SolveTrace()
+    route, obj = run_model(list(places), list(wins), day_info, user, config=SolverConfig(time_limit=2, sparse_neighbors=1), trace=trace)
+    assert any("희소 모델에서 해를 찾지 못했습니다" in e for e in trace.events)
+    assert {"먼 곳1", "먼 곳2"} <= {r["place"] for r in route}
+    assert (route, obj) == run_model(list(places), list(wins), day_info, user, config=SolverConfig(time_limit=2))
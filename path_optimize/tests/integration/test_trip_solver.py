@@ -0,0 +1,51 @@
+import os
+import json
+import pytest
+from solver.trip_solver import solve_trip
+
+SCENARIO_DIR = os.path.join(os.path.dirname(__file__), '..', 'scenarios', 'base')
+
+def load_trip(n_days):
+    # tc10 의 관광지/식당을 여러 날에 나눠 방문 (첫날 공항 → 숙소, 중간 숙소 → 숙소, 마지막 숙소 → 공항)
+    with open(os.path.join(SCENARIO_DIR, 'tc10_too_many_places.json'), encoding='utf-8') as f:
+        data = json.load(f)
+    hotel = data["places"][0]
+    airport = {"id": 100, "name": "제주공항", "x_cord": 126.492153, "y_cord": 33.505413, "category": "transport",
+               "open_time": "06:00", "close_time": "23:00", "service_time": 0, "break_time": []}
+    places = [p for p in data["places"][1:-1]]
+
+    days = []
+    for d in range(n_days):
+        anchors = [hotel, hotel]
+        if d == 0:
+            anchors = [airport, hotel]
+        elif d == n_days - 1:
+            anchors = [hotel, airport]
+        days.append({"places": anchors, "user": data["user"],
+                     "day_info": {"is_first_day": d == 0, "is_last_day": d == n_days - 1}})
+    return places, days
+
+def test_solve_trip_assigns_places_to_days():
+    places, days = load_trip(3)
+    routes, obj = solve_trip(places, days)
+    assert routes is not None and len(routes) == 3
+    assert routes[0][0]["place"] == "제주공항" and routes[0][-1]["place"] == "호텔 난타"
+    assert routes[1][0]["place"] == "호텔 난타" and routes[1][-1]["place"] == "호텔 난타"
+    assert routes[2][0]["place"] == "호텔 난타" and routes[2][-1]["place"] == "제주공항"
+
+    # 관광지는 여행 전체에서 한 번만, 식당은 하루에 한 곳씩만 (tc10 식당은 식사 타입이 모두 다름)
+    restaurants = {p["name"] for p in places if p["category"] == "restaurant"}
+    visited = [r["place"] for route in routes for r in route[1:-1] if r["place"] not in restaurants]
+    assert len(visited) == len(set(visited))
+    for route in routes:
+        meals = [r["place"] for r in route if r["place"] in restaurants]
+        assert len(meals) == len(set(meals))
+
+    # 표시 시간은 날짜별 시간축이 아닌 하루 기준
+    assert all("08:00" <= r["arrival_str"] <= "20:10" for route in routes for r in route)
+
+def test_solve_trip_validates_day_anchors():
+    places, days = load_trip(2)
+    days[0]["places"] = days[0]["places"][::-1]
+    with pytest.raises(ValueError):
+        solve_trip(places, days)
@@ -0,0 +1,57 @@
+import os
+import json
+import numpy as np
+import pytest
+from solver.utils.catalog import compile_catalog, PlaceCatalog, open_catalog
+from solver.utils.time_windows import calculate_effective_time_windows
+
+SCENARIO_DIR = os.path.join(os.path.dirname(__file__), '..', 'scenarios', 'base')
+
+def load(name):
+    with open(os.path.join(SCENARIO_DIR, name), encoding='utf-8') as f:
+        return json.load(f)
+
+def test_round_trip_yields_same_places(tmp_path):
+    data = load('tc5_too_many_restaurants.json')
+    compile_catalog(data["places"], str(tmp_path))
+    catalog = PlaceCatalog(str(tmp_path))
+
+    places = catalog.places([p["id"] for p in data["places"]])
+    for original, loaded in zip(data["places"], places):
+        assert loaded == {**original, "break_time": original.get("break_time", [])}
+    assert calculate_effective_time_windows(places, data["user"]) == calculate_effective_time_windows(data["places"], data["user"])
+
+def test_records_are_memory_mapped(tmp_path):
+    data = load('tc6_no_restaurant.json')
+    compile_catalog(data["places"], str(tmp_path))
+    catalog = open_catalog(str(tmp_path))
+    assert isinstance(catalog.records, np.memmap)
+    assert open_catalog(str(tmp_path)) is catalog
+    assert catalog.ids() == sorted(p["id"] for p in data["places"])
+
+def test_missing_id_and_optional_fields(tmp_path):
+    compile_catalog([{"id": 7, "name": "야시장", "x_cord": 33.5, "y_cord": 126.5, "category": "landmark",
+                      "open_time": "18:00", "close_time": "02:00", "service_time": 60}], str(tmp_path))
+    catalog = PlaceCatalog(str(tmp_path))
+    assert catalog.get(7) == {"id": 7, "name": "야시장", "x_cord": 33.5, "y_cord": 126.5, "category": "landmark",
+                              "open_time": "18:00", "close_time": "02:00", "break_time": [], "service_time": 60}
+    assert 8 not in catalog
+    with pytest.raises(KeyError):
+        catalog.get(8)
+
+def test_round_trip_keeps_times_past_midnight_and_missing_category(tmp_path):
+    places = [
+        {"id": 1, "name": "심야 식당", "x_cord": 126.5, "y_cord": 33.5, "category": "restaurant",
+         "open_time": "18:00", "close_time": "1:30", "break_time": ["23:30", "0:30"], "service_time": 60},
+        {"id": 2, "name": "이른 시장", "x_cord": 126.6, "y_cord": 33.4, "category": None,
+         "open_time": "6:00", "close_time": "13:00", "break_time": [], "service_time": 30},
+        {"id": 3, "name": "분류 없음", "x_cord": 126.7, "y_cord": 33.3, "category": "None",
+         "open_time": "09:00", "close_time": "18:00", "break_time": [], "service_time": 30},
+    ]
+    compile_catalog(places, str(tmp_path))
+    assert PlaceCatalog(str(tmp_path)).places([1, 2, 3]) == places
+
+def test_invalid_time_raises_value_error(tmp_path):
+    place = {"id": 1, "name": "잘못된 장소", "x_cord": 0, "y_cord": 0, "open_time": "9시", "close_time": "18:00"}
+    with pytest.raises(ValueError):
+        compile_catalog([place], str(tmp_path))
@@ -0,0 +1,33 @@
+import random
+import numpy as np
+from solver.utils.distance import haversine_distance, create_distance_array, create_distance_array_chunked, create_distance_matrix
+
+def make_places(n, seed=0):
+    rnd = random.Random(seed)
+    return [{"x_cord": 126.5 + rnd.uniform(-0.5, 0.5), "y_cord": 33.4 + rnd.uniform(-0.3, 0.3)} for _ in range(n)]
+
+def loop_distance_matrix(places):
+    n = len(places)
+    matrix = [[0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = haversine_distance(places[i]["x_cord"], places[i]["y_cord"], places[j]["x_cord"], places[j]["y_cord"])
+            matrix[i][j] = matrix[j][i] = d
+    return matrix
+
+def test_create_distance_array_matches_loop():
+    places = make_places(60)
+    matrix = create_distance_array(places)
+    assert matrix.dtype == np.int32
+    assert matrix.tolist() == loop_distance_matrix(places)
+
+def test_create_distance_array_chunked_matches_full():
+    places = make_places(50, seed=1)
+    assert np.array_equal(create_distance_array_chunked(places, chunk_size=7), create_distance_array(places))
+
+def test_create_distance_matrix_returns_lists():
+    places = make_places(3)
+    matrix = create_distance_matrix(places)
+    assert isinstance(matrix, list) and isinstance(matrix[0], list)
+    assert all(isinstance(d, int) for row in matrix for d in row)
+    assert matrix[1][1] == 0
@@ -0,0 +1,68 @@
+import os
+import json
+from solver.routing_solver import run_model
+from solver.solver_config import SolverConfig
+from solver.utils.feasibility import check_day, check_feasibility
+from solver.utils.time import time_to_minutes
+from solver.utils.time_windows import calculate_effective_time_windows
+
+SCENARIO_DIR = os.path.join(os.path.dirname(__file__), '..', 'scenarios')
+
+def load(name):
+    with open(os.path.join(SCENARIO_DIR, name), encoding='utf-8') as f:
+        data = json.load(f)
+    return data["places"], data["day_info"], data["user"]
+
+def codes(result):
+    return [e["code"] for e in result["errors"]]
+
+def test_base_scenario_is_feasible():
+    result = check_day(*load('base/tc10_too_many_places.json'))
+    assert result["feasible"] and result["errors"] == []
+
+def test_no_meal_window_is_reported_without_raising():
+    result = check_day(*load('error/tc9_no_match_meal_time.json'))
+    assert not result["feasible"]
+    assert "no_meal_window" in codes(result)
+
+def test_mandatory_place_outside_activity_span():
+    places, day_info, user = load('base/tc6_no_restaurant.json')
+    places[1] = {**places[1], "open_time": "21:00", "close_time": "23:00", "is_mandatory": True}
+    result = check_day(places, day_info, user)
+    assert codes(result) == ["empty_window"]
+    assert result["errors"][0]["place"] == places[1]["name"]
+
+def test_unreachable_and_cannot_return():
+    gs, ge = time_to_minutes("08:00"), time_to_minutes("20:00")
+    places = [
+        {"name": "숙소", "service_time": 0},
+        {"name": "먼 곳", "service_time": 60},
+        {"name": "늦은 곳", "service_time": 60},
+        {"name": "공항", "service_time": 0},
+    ]
+    wins = [(gs, ge, None), (gs, gs + 30, None), (ge - 20, ge, None), (gs, ge, None)]
+    dist = [[0, 100, 10, 10], [100, 0, 10, 10], [10, 10, 0, 50], [10, 10, 50, 0]]
+    result = check_feasibility(places, wins, 0, 3, gs, ge, dist)
+    assert codes(result) == ["unreachable", "cannot_return"]
+
+def test_total_service_exceeds_span():
+    gs, ge = time_to_minutes("08:00"), time_to_minutes("12:00")
+    places = [{"name": "숙소"}] + [{"name": f"장소{i}", "service_time": 100} for i in range(3)] + [{"name": "숙소"}]
+    wins = [(gs, ge, None)] * 5
+    dist = [[0] * 5 for _ in range(5)]
+    result = check_feasibility(places, wins, 0, 4, gs, ge, dist)
+    assert codes(result) == ["total_service_exceeds_span"]
+
+def test_optional_place_with_empty_window_is_dropped():
+    # 선택 장소의 윈도우가 비어도 run_model 은 그 장소를 빼고 풀고, 검사는 경고만 남김
+    places, day_info, user = load('base/tc6_no_restaurant.json')
+    places[1] = {**places[1], "open_time": "21:00", "close_time": "23:00", "is_mandatory": False}
+    result = check_day(places, day_info, user)
+    assert result["feasible"]
+    assert [w["code"] for w in result["warnings"]] == ["empty_window"]
+
+    eff_windows = calculate_effective_time_windows(places, user)
+    wins = [eff_windows[p["id"]][0] for p in places]
+    route, obj = run_model(list(places), list(wins), day_info, user, config=SolverConfig(time_limit=1))
+    assert route is not None
+    assert places[1]["name"] not in [r["place"] for r in route]
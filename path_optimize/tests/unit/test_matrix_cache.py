@@ -0,0 +1,99 @@
+import random
+import numpy as np
+from solver.utils.distance import create_distance_array
+from solver.utils.matrix_cache import TravelMatrixCache, place_key
+
+def make_places(n, seed=0):
+    rnd = random.Random(seed)
+    return [{"id": i, "x_cord": 126.5 + rnd.uniform(-0.5, 0.5), "y_cord": 33.4 + rnd.uniform(-0.3, 0.3)} for i in range(n)]
+
+def counting_block(calls):
+    from solver.utils.distance import haversine_block
+    def compute(lat1, lon1, lat2, lon2):
+        calls.append(len(lat1))
+        return haversine_block(lat1, lon1, lat2, lon2)
+    return compute
+
+def test_matrix_matches_distance_array():
+    places = make_places(20)
+    # 같은 좌표의 분할 노드 + 더미 노드
+    places.append({**places[3], "id": "3_lunch"})
+    places.append({"name": "dummy_end", "x_cord": 0.0, "y_cord": 0.0})
+    cache = TravelMatrixCache()
+    assert np.array_equal(cache.matrix(places), create_distance_array(places))
+
+def test_subset_is_gather_without_recompute():
+    calls = []
+    places = make_places(30)
+    cache = TravelMatrixCache(compute_block=counting_block(calls))
+    cache.matrix(places)
+    assert calls == [30]
+    assert cache.stats == {"hits": 0, "fetched": 30 * 29}
+
+    subset = [places[i] for i in (25, 2, 17, 9)]
+    assert np.array_equal(cache.matrix(subset), create_distance_array(subset))
+    assert calls == [30]
+
+    # 새 장소는 그 장소의 행/열만 계산
+    extra = make_places(2, seed=7)
+    cache.matrix(subset + extra)
+    assert calls == [30, 2]
+
+def test_persisted_cache_is_reloaded(tmp_path):
+    places = make_places(10)
+    cache = TravelMatrixCache(str(tmp_path))
+    cache.matrix(places)
+    cache.save()
+
+    calls = []
+    reloaded = TravelMatrixCache(str(tmp_path), compute_block=counting_block(calls))
+    assert len(reloaded) == 10
+    assert np.array_equal(reloaded.matrix(places[::-1]), create_distance_array(places[::-1]))
+    assert calls == []
+
+def test_returned_matrix_is_a_copy():
+    places = make_places(5)
+    cache = TravelMatrixCache()
+    cache.matrix(places)[0, 1] = -1
+    hit = cache.matrix(places)
+    hit[1, 0] = -1
+    assert np.array_equal(cache.matrix(places), create_distance_array(places))
+
+def test_lru_is_bounded():
+    places = make_places(6)
+    cache = TravelMatrixCache(maxsize=2)
+    for i in range(4):
+        cache.matrix(places[i:i + 3])
+    assert len(cache._lru) == 2
+    assert place_key(places[0]) == place_key({**places[0], "id": "other"})
+
+def test_saves_are_batched(tmp_path):
+    places = make_places(5)
+    cache = TravelMatrixCache(str(tmp_path), save_every=3)
+    cache.matrix(places[:2])
+    assert not (tmp_path / "cache.npz").exists()
+    cache.matrix(places[:4])
+    assert len(TravelMatrixCache(str(tmp_path))) == 4
+
+def test_growth_keeps_values():
+    places = make_places(40)
+    cache = TravelMatrixCache()
+    for i in range(1, len(places) + 1):
+        cache.matrix(places[:i])
+    assert len(cache._buf) < 2 * len(places)
+    assert np.array_equal(cache.matrix(places), create_distance_array(places))
+
+def test_save_merges_places_from_other_processes(tmp_path):
+    # 서로 다른 순서로 장소를 추가한 두 캐시가 같은 파일에 저장해도 키와 행렬이 맞아야 함
+    places = make_places(12)
+    first, second = TravelMatrixCache(str(tmp_path)), TravelMatrixCache(str(tmp_path))
+    first.matrix(places[:8])
+    second.matrix(places[4:][::-1])
+    first.save()
+    second.save()
+
+    calls = []
+    merged = TravelMatrixCache(str(tmp_path), compute_block=counting_block(calls))
+    assert len(merged) == 12
+    assert np.array_equal(merged.matrix(places), create_distance_array(places))
+    assert calls == []
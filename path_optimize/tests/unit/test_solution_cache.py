@@ -0,0 +1,78 @@
+import json
+import time
+import pytest
+from solver.routing_solver import run_model
+from solver.solver_config import SolverConfig
+from solver.utils.solution_cache import SolutionCache, problem_fingerprint
+from solver.utils.travel_time import HaversineProvider, MatrixFileProvider, HttpTableProvider
+
+def test_fingerprint_ignores_place_order(load_first_selection):
+    places, wins, day_info, user = load_first_selection('tc10_too_many_places.json')
+    n = len(places)
+    key = problem_fingerprint(places, wins, 0, n - 1, day_info, user, SolverConfig())
+
+    middle = list(range(1, n - 1))[::-1]
+    order = [0] + middle + [n - 1]
+    shuffled = problem_fingerprint([places[i] for i in order], [wins[i] for i in order], 0, n - 1, day_info, user, SolverConfig())
+    assert key == shuffled
+    assert key != problem_fingerprint(places, wins, 0, n - 1, day_info, user, SolverConfig(time_limit=5))
+
+def test_fingerprint_includes_provider_data(tmp_path, load_first_selection):
+    places, wins, day_info, user = load_first_selection('tc10_too_many_places.json')
+    n = len(places)
+
+    def key(provider):
+        return problem_fingerprint(places, wins, 0, n - 1, day_info, user, SolverConfig(), provider=provider)
+
+    path = tmp_path / "matrix.json"
+    path.write_text(json.dumps({"ids": [1], "matrix": [[0]]}))
+    before = key(MatrixFileProvider(str(path)))
+    assert before == key(MatrixFileProvider(str(path)))
+    path.write_text(json.dumps({"ids": [1, 2], "matrix": [[0, 5], [5, 0]]}))
+    assert before != key(MatrixFileProvider(str(path)))
+
+    osrm = key(HttpTableProvider("http://osrm-a"))
+    assert osrm == key(HttpTableProvider("http://osrm-a/"))
+    assert osrm != key(HttpTableProvider("http://osrm-b"))
+    assert osrm != key(HttpTableProvider("http://osrm-a", profile="foot"))
+    assert key(HaversineProvider()) == key(HaversineProvider())
+
+def test_routes_are_copied_on_put_and_get():
+    cache = SolutionCache()
+    route = [{"place": "A"}]
+    cache.put("k", route, 1, 0.1)
+    route[0]["place"] = "B"
+    hit, _ = cache.get("k")
+    assert hit == [{"place": "A"}]
+    hit.append({"place": "C"})
+    assert cache.get("k") == ([{"place": "A"}], 1)
+
+def test_memory_tier_ttl_and_lru():
+    cache = SolutionCache(maxsize=2, ttl=0.05)
+    cache.put("a", [], 1, 0.5)
+    cache.put("b", [], 2, 0.5)
+    cache.put("c", [], 3, 0.5)
+    assert cache.get("a") is None
+    assert cache.get("c") == ([], 3)
+    time.sleep(0.06)
+    assert cache.get("c") is None
+    assert cache.metrics()["hit_rate"] == pytest.approx(1 / 3)
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    cache = SolutionCache(path)
+    cache.put("k", [{"place": "A"}], 10, 2.0)
+    cache.close()
+
+    reopened = SolutionCache(path)
+    assert reopened.get("k") == ([{"place": "A"}], 10)
+    assert reopened.stats["saved_seconds"] == 2.0
+
+def test_run_model_uses_solution_cache(load_first_selection):
+    cache = SolutionCache()
+    places, wins, day_info, user = load_first_selection('tc10_too_many_places.json')
+    first = run_model(list(places), list(wins), day_info, user, solution_cache=cache)
+    second = run_model(list(places), list(wins), day_info, user, solution_cache=cache)
+    assert first == second
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+    assert cache.stats["saved_seconds"] > 0
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from solver.utils.distance import haversine_block
+from solver.utils.spatial import BallTree, SpatialPruner, prune_places
+
+def make_coords(n, seed=0):
+    rnd = np.random.default_rng(seed)
+    return 33.4 + rnd.uniform(-0.4, 0.4, n), 126.5 + rnd.uniform(-0.6, 0.6, n)
+
+def brute_force_km(lat, lon, q_lat, q_lon):
+    phi1, phi2 = np.radians(q_lat), np.radians(lat)
+    a = np.sin(np.radians(lat - q_lat) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(np.radians(lon - q_lon) / 2) ** 2
+    return 6371 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+def test_ball_tree_matches_brute_force():
+    lat, lon = make_coords(2000)
+    tree = BallTree(lat, lon, leaf_size=8)
+    for q in range(10):
+        d = brute_force_km(lat, lon, lat[q] + 0.003, lon[q])
+        dist, idx = tree.query(lat[q] + 0.003, lon[q], 5)
+        assert idx.tolist() == np.argsort(d, kind="stable")[:5].tolist()
+        assert np.allclose(dist, np.sort(d)[:5])
+        assert tree.query_radius(lat[q], lon[q], 4.0).tolist() == np.flatnonzero(brute_force_km(lat, lon, lat[q], lon[q]) <= 4.0).tolist()
+
+def test_empty_tree():
+    tree = BallTree([], [])
+    assert len(tree.query(33.0, 126.0, 3)[1]) == 0
+    assert len(tree.query_radius(33.0, 126.0, 10)) == 0
+
+def make_places(n):
+    lat, lon = make_coords(n, seed=1)
+    places = [{"id": i, "name": f"장소{i}", "x_cord": float(lon[i]), "y_cord": float(lat[i]), "is_mandatory": False}
+              for i in range(n)]
+    places[0].update(name="숙소", category="accommodation", is_mandatory=True)
+    places[5].update(is_mandatory=True)
+    places[7].update(category="restaurant")
+    return places
+
+def test_pruner_keeps_fixed_nodes_and_nearest():
+    places = make_places(200)
+    kept = SpatialPruner(k=10).keep(places, 0, 0)
+    assert {0, 5, 7} <= set(kept)
+    assert len(kept) == 13
+
+    lat, lon = np.array([p["y_cord"] for p in places]), np.array([p["x_cord"] for p in places])
+    travel = haversine_block(lat[:1], lon[:1], lat, lon)[0]
+    within = SpatialPruner(radius=20).keep(places, 0, 0)
+    optional = [i for i in range(200) if i not in (0, 5, 7)]
+    assert [i for i in within if i in optional] == [i for i in optional if travel[i] <= 20]
+
+def test_pruner_radius_uses_rounded_travel_time():
+    # 10.4km 는 반올림하면 10 → 이동시간 20분이라 radius=20 에 포함, 10.6km 는 21분이라 제외
+    anchor = {"id": 0, "name": "숙소", "x_cord": 126.5, "y_cord": 33.4, "is_mandatory": True}
+    places = [anchor] + [{"id": i + 1, "name": f"장소{i + 1}", "x_cord": 126.5,
+                          "y_cord": 33.4 + np.degrees(km / 6371), "is_mandatory": False} for i, km in enumerate([10.4, 10.6])]
+    lat, lon = np.array([p["y_cord"] for p in places]), np.array([p["x_cord"] for p in places])
+    assert haversine_block(lat[:1], lon[:1], lat, lon)[0].tolist() == [10, 20, 21]
+    assert SpatialPruner(radius=20).keep(places, 0, 0) == [0, 1]
+
+def test_pruner_reads_x_cord_as_longitude():
+    # 실제 제주 좌표 (x_cord 경도, y_cord 위도), 공항에서 한라산 17km, 협재 27km, 서귀포 30km, 산방산 34km, 성산 42km
+    # (위도/경도를 바꿔 읽으면 서귀포 19km, 산방산 27km 로 순서가 달라짐)
+    places = [
+        {"id": 0, "name": "제주공항", "x_cord": 126.4930, "y_cord": 33.5070, "is_mandatory": True},
+        {"id": 1, "name": "성산일출봉", "x_cord": 126.9424, "y_cord": 33.4581, "is_mandatory": False},
+        {"id": 2, "name": "한라산", "x_cord": 126.5332, "y_cord": 33.3617, "is_mandatory": False},
+        {"id": 3, "name": "협재해수욕장", "x_cord": 126.2397, "y_cord": 33.3943, "is_mandatory": False},
+        {"id": 4, "name": "산방산", "x_cord": 126.3086, "y_cord": 33.2390, "is_mandatory": False},
+        {"id": 5, "name": "서귀포", "x_cord": 126.5601, "y_cord": 33.2465, "is_mandatory": False},
+    ]
+    assert SpatialPruner(k=2).keep(places, 0, 0) == [0, 2, 3]
+    assert SpatialPruner(radius=38).keep(places, 0, 0) == [0, 2, 3]
+    assert SpatialPruner(radius=45).keep(places, 0, 0) == [0, 2, 3, 4, 5]
+
+def test_prune_places_remaps_indices():
+    places = make_places(50)
+    wins = [(i, i + 1, None) for i in range(50)]
+    new_places, new_wins, start, end, groups = prune_places(places, wins, 0, None, {"lunch": [7]}, SpatialPruner(k=3))
+    assert new_places[start]["name"] == "숙소" and end is None
+    assert new_places[groups["lunch"][0]]["id"] == 7
+    assert [w[0] for w in new_wins] == [p["id"] for p in new_places]
+
+def test_pruner_requires_a_limit():
+    with pytest.raises(ValueError):
+        SpatialPruner()
@@ -0,0 +1,58 @@
+import io
+import json
+from solver.routing_solver import run_model
+from solver.solver_config import SolverConfig
+from solver.utils.telemetry import SolveTrace, JsonLinesExporter, PrometheusExporter
+
+def test_phase_sums_repeated_names():
+    trace = SolveTrace(request="a")
+    for _ in range(2):
+        with trace.phase("4_matrix"):
+            pass
+    trace.event("메시지")
+    trace.finish("ok", 10)
+    record = trace.record()
+    assert record["request"] == "a" and record["status"] == "ok" and record["objective"] == 10
+    assert list(record["phases"]) == ["4_matrix"] and record["events"] == ["메시지"]
+    assert record["total_seconds"] == record["phases"]["4_matrix"]
+
+def test_run_model_records_search_without_printing(capsys, load_split_scenario):
+    places, wins, day_info, user = load_split_scenario('tc6_no_restaurant.json')
+    trace = SolveTrace()
+    route, obj = run_model(places, wins, day_info, user, config=SolverConfig(time_limit=1), trace=trace)
+    assert capsys.readouterr().out == ""
+
+    record = trace.record()
+    assert record["status"] == "ok" and record["objective"] == obj
+    assert {"4_matrix", "12_search", "extract"} <= set(record["phases"])
+    assert record["solutions"] >= 1
+    assert 0 <= record["search_seconds"] <= record["phases"]["12_search"]
+    # 해마다 콜백을 부르지 않으므로 첫 해 시간/목적함수 변화는 비어 있음
+    assert record["first_solution_seconds"] is None and record["trajectory"] == []
+
+def test_search_events_record_trajectory(load_split_scenario):
+    places, wins, day_info, user = load_split_scenario('tc6_no_restaurant.json')
+    trace = SolveTrace(search_events=True)
+    route, obj = run_model(places, wins, day_info, user, config=SolverConfig(time_limit=1), trace=trace)
+
+    record = trace.record()
+    assert record["solutions"] >= 1 and record["solutions"] == len(record["trajectory"])
+    assert 0 <= record["first_solution_seconds"] <= record["phases"]["12_search"]
+    assert record["trajectory"][-1][1] == obj
+
+def test_exporters():
+    trace = SolveTrace()
+    with trace.phase("12_search"):
+        pass
+    trace.finish("infeasible")
+    stream = io.StringIO()
+    JsonLinesExporter(stream=stream).export(trace.record())
+    assert json.loads(stream.getvalue())["status"] == "infeasible"
+
+    metrics = PrometheusExporter()
+    trace.export(metrics)
+    trace.export(metrics)
+    text = metrics.render()
+    assert 'solver_solves_total{status="infeasible"} 2' in text
+    assert 'solver_phase_seconds_count{phase="12_search"} 2' in text
+    assert "solver_first_solution_seconds_count 0" in text
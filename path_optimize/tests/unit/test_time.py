@@ -0,0 +1,46 @@
+import random
+import pytest
+from solver.utils import time_windows
+from solver.utils.time import time_to_minutes, parse_time_to_minutes, minutes_to_time_str, MINUTES_BY_STR
+from solver.utils.time_windows import calculate_effective_time_windows
+
+INVALID = [1230, None, 9.5, ["09:00"], "", "abc", "9", "09:0", "009:00", "24:00", "12:60", "09:00\n", " 09:00", "٠٩:٠٠"]
+
+def error_of(fn, value):
+    try:
+        fn(value)
+    except Exception as e:
+        return type(e), str(e)
+    return None
+
+def test_table_matches_parser():
+    for s, minutes in MINUTES_BY_STR.items():
+        assert parse_time_to_minutes(s) == minutes
+    assert len(MINUTES_BY_STR) == 1440 + 600
+
+@pytest.mark.parametrize("value", INVALID)
+def test_invalid_inputs_raise_identical_errors(value):
+    assert error_of(time_to_minutes, value) is not None
+    assert error_of(time_to_minutes, value) == error_of(parse_time_to_minutes, value)
+
+def test_minutes_to_time_str_matches_format():
+    for m in list(range(0, 3000)) + [-30, 10000]:
+        assert minutes_to_time_str(m) == f"{m // 60:02d}:{m % 60:02d}"
+
+def make_places(n, seed=0):
+    rnd = random.Random(seed)
+    return [{"id": i, "name": f"장소{i}", "category": "landmark",
+             "open_time": f"{rnd.randrange(6, 11)}:{rnd.choice(['00', '30'])}", "close_time": f"{rnd.randrange(17, 23)}:00",
+             "break_time": ["14:00", "15:00"] if i % 3 == 0 else []} for i in range(n)]
+
+def test_time_to_minutes_matches_parser_on_all_times():
+    strings = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)]
+    assert [time_to_minutes(s) for s in strings] == [parse_time_to_minutes(s) for s in strings]
+
+def test_effective_time_windows_match_parser(monkeypatch):
+    places = make_places(500)
+    user = {"start_time": "08:00", "end_time": "22:00", "meal_time_preferences": {"lunch": ["12:00", "13:00"]}}
+    expected = calculate_effective_time_windows(places, user)
+
+    monkeypatch.setattr(time_windows, "time_to_minutes", parse_time_to_minutes)
+    assert calculate_effective_time_windows(places, user) == expected
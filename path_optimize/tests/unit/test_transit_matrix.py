@@ -0,0 +1,42 @@
+import json
+from solver.routing_solver import build_transit_matrix
+from solver.utils.travel_time import HaversineProvider, MatrixFileProvider
+
+def test_build_transit_matrix_adds_service_and_zeroes_dummy():
+    places = [{"name": "A"}, {"name": "B"}, {"name": "dummy_end"}]
+    matrix = [[0, 12, 20], [12, 0, 15], [20, 15, 0]]
+    transit = build_transit_matrix(matrix, [30, 60, 0], places)
+    assert transit.tolist() == [[30, 42, 0], [72, 60, 0], [0, 0, 0]]
+
+def test_service_time_is_added_to_each_departure(load_split_scenario):
+    # register_transit_callback 과 같은 값: 출발 노드의 서비스 시간 + 이동시간, 더미 노드가 끼면 0
+    places, wins, day_info, user = load_split_scenario('tc5_too_many_restaurants.json')
+    places = [{"name": "dummy_start"}] + places + [{"name": "dummy_end"}]
+    svc_times = [p.get('service_time', 0) for p in places]
+    matrix = HaversineProvider().matrix(places[1:-1])
+    full = [[0] * len(places) for _ in places]
+    for i, row in enumerate(matrix.tolist()):
+        full[i + 1][1:-1] = row
+
+    transit = build_transit_matrix(full, svc_times, places)
+    n = len(places)
+    expected = [[0 if u in (0, n - 1) or v in (0, n - 1) else full[u][v] + svc_times[u] for v in range(n)] for u in range(n)]
+    assert transit.tolist() == expected
+    assert transit.dtype.kind == "i" and transit.shape == (n, n)
+
+def test_matrix_file_provider_rows_and_dummy(tmp_path):
+    # 분할된 식당 노드는 원래 place_id 의 행을 공유, 서비스 시간은 출발 노드 기준
+    path = tmp_path / "matrix.json"
+    path.write_text(json.dumps({"ids": [1, 2, 3], "matrix": [[0, 5, 9], [6, 0, 4], [8, 3, 0]]}))
+    places = [{"id": 1, "name": "숙소", "service_time": 0},
+              {"id": "2_lunch", "place_id": 2, "name": "식당 (lunch)", "service_time": 60},
+              {"id": "2_dinner", "place_id": 2, "name": "식당 (dinner)", "service_time": 60},
+              {"id": 3, "name": "관광지", "service_time": 30},
+              {"name": "dummy_end"}]
+    matrix = MatrixFileProvider(str(path)).matrix(places)
+    transit = build_transit_matrix(matrix, [p.get("service_time", 0) for p in places], places)
+    assert transit.tolist() == [[0, 5, 5, 9, 0],
+                                [66, 60, 60, 64, 0],
+                                [66, 60, 60, 64, 0],
+                                [38, 33, 33, 30, 0],
+                                [0, 0, 0, 0, 0]]
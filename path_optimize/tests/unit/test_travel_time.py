@@ -0,0 +1,90 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import pytest
+from solver.utils.distance import create_distance_array, haversine_distance
+from solver.utils.travel_time import HaversineProvider, MatrixFileProvider, HttpTableProvider
+
+PLACES = [
+    {"id": 1, "name": "제주공항", "x_cord": 126.492153, "y_cord": 33.505413},
+    {"id": 2, "name": "한라산", "x_cord": 126.500000, "y_cord": 33.400000},
+    {"id": "3_lunch", "place_id": 3, "name": "맛집 (lunch)", "x_cord": 126.510000, "y_cord": 33.470000},
+]
+DUMMY = {"name": "dummy_end", "category": "dummy_end", "x_cord": 0.0, "y_cord": 0.0}
+
+class FakeTableHandler(BaseHTTPRequestHandler):
+    # OSRM /table/v1/{profile}/{lon,lat;...} 응답 흉내 (하버사인 km 를 분으로 보고 초 단위로 반환)
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.path)
+        if server.fail_next > 0:
+            server.fail_next -= 1
+            self._send(503, b"{}")
+            return
+        locs = self.path.split("/")[-1].split("?")[0].split(";")
+        coords = [tuple(map(float, loc.split(","))) for loc in locs]
+        durations = [[0 if a == b else haversine_distance(a[0], a[1], b[0], b[1]) * 60 for b in coords] for a in coords]
+        self._send(200, json.dumps({"code": "Ok", "durations": durations}).encode())
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def table_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTableHandler)
+    server.requests = []
+    server.fail_next = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_haversine_provider_matches_distance_array():
+    provider = HaversineProvider()
+    assert np.array_equal(provider.matrix(PLACES), create_distance_array(PLACES))
+    assert provider.stats["fetched"] == 6
+
+def test_matrix_file_provider(tmp_path):
+    path = tmp_path / "matrix.json"
+    path.write_text(json.dumps({"ids": [3, 2, 1], "matrix": [[0, 5, 7], [5, 0, 9], [7, 9, 0]]}))
+    provider = MatrixFileProvider(str(path))
+    matrix = provider.matrix(PLACES + [DUMMY])
+    assert matrix.tolist() == [[0, 9, 7, 0], [9, 0, 5, 0], [7, 5, 0, 0], [0, 0, 0, 0]]
+
+    with pytest.raises(ValueError):
+        provider.matrix([{"id": 99, "name": "없는 장소"}])
+
+def test_http_provider_batches_and_caches(table_server):
+    provider = HttpTableProvider(f"http://127.0.0.1:{table_server.server_port}")
+    matrix = provider.matrix(PLACES + [DUMMY])
+    assert len(table_server.requests) == 1
+    assert np.array_equal(matrix[:3, :3], create_distance_array(PLACES))
+    assert not matrix[3].any() and not matrix[:, 3].any()
+    assert provider.stats == {"hits": 0, "fetched": 6}
+
+    # 같은 장소 부분집합은 요청 없이 캐시에서
+    provider.matrix(PLACES[:2])
+    assert len(table_server.requests) == 1
+    assert provider.stats == {"hits": 2, "fetched": 6}
+    provider.close()
+
+def test_http_provider_retries_server_errors(table_server):
+    table_server.fail_next = 2
+    provider = HttpTableProvider(f"http://127.0.0.1:{table_server.server_port}", backoff=0)
+    provider.matrix(PLACES)
+    assert len(table_server.requests) == 3
+
+    table_server.fail_next = 5
+    with pytest.raises(ConnectionError):
+        HttpTableProvider(f"http://127.0.0.1:{table_server.server_port}", retries=1, backoff=0).matrix(PLACES)
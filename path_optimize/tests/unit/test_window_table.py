@@ -0,0 +1,70 @@
+import os
+import json
+import random
+import pytest
+from solver.utils.time import minutes_to_time_str
+from solver.utils.time_windows import calculate_effective_time_windows
+from solver.utils.window_table import PlaceTimeTable
+
+SCENARIO_DIR = os.path.join(os.path.dirname(__file__), '..', 'scenarios', 'base')
+
+def hhmm(rnd):
+    return minutes_to_time_str(rnd.randrange(0, 1440))
+
+def make_catalog(n, seed=0):
+    # 자정 넘김 영업, 겹치는 휴식 시간, 홀수 개 휴식 시간 등을 섞은 카탈로그
+    rnd = random.Random(seed)
+    places = []
+    for i in range(n):
+        breaks = []
+        for _ in range(rnd.choice([0, 0, 1, 2, 3])):
+            breaks += [hhmm(rnd), hhmm(rnd)]
+        if rnd.random() < 0.05:
+            breaks.append(hhmm(rnd))
+        places.append({"id": i, "name": f"장소{i}", "category": rnd.choice(["restaurant", "tourist_spot", "cafe"]),
+                       "open_time": hhmm(rnd), "close_time": hhmm(rnd), "break_time": breaks})
+    return places
+
+def make_user(rnd):
+    meals = {m: [hhmm(rnd), hhmm(rnd)] for m in ("breakfast", "lunch", "dinner") if rnd.random() < 0.8}
+    return {"start_time": hhmm(rnd), "end_time": hhmm(rnd), "meal_time_preferences": meals}
+
+def windows_or_error(fn, *args):
+    try:
+        return fn(*args)
+    except ValueError as e:
+        return str(e)
+
+def test_matches_scalar_on_scenarios():
+    for name in sorted(os.listdir(SCENARIO_DIR)):
+        if not name.endswith('.json'):
+            continue
+        with open(os.path.join(SCENARIO_DIR, name), encoding='utf-8') as f:
+            data = json.load(f)
+        table = PlaceTimeTable(data["places"])
+        assert table.effective_windows(data["user"]) == calculate_effective_time_windows(data["places"], data["user"])
+
+def test_matches_scalar_on_random_catalog():
+    rnd = random.Random(1)
+    places = make_catalog(300)
+    non_restaurants = [p for p in places if p["category"] != "restaurant"]
+    table, table_nr = PlaceTimeTable(places), PlaceTimeTable(non_restaurants)
+    for _ in range(20):
+        user = make_user(rnd)
+        assert windows_or_error(table.effective_windows, user) == windows_or_error(calculate_effective_time_windows, places, user)
+        assert table_nr.effective_windows(user) == calculate_effective_time_windows(non_restaurants, user)
+        # 식사 윈도우가 있는 식당만 모아 성공 경로도 비교
+        valid = [p for p in places if not isinstance(windows_or_error(calculate_effective_time_windows, [p], user), str)]
+        assert PlaceTimeTable(valid).effective_windows(user) == calculate_effective_time_windows(valid, user)
+
+def test_restaurant_without_meal_window_raises_same_error():
+    places = [{"id": 1, "name": "심야식당", "category": "restaurant", "open_time": "22:00", "close_time": "23:00"}]
+    user = {"start_time": "09:00", "end_time": "21:00", "meal_time_preferences": {"lunch": ["12:00", "13:00"]}}
+    with pytest.raises(ValueError, match="심야식당"):
+        PlaceTimeTable(places).effective_windows(user)
+
+def test_arrays_are_int16():
+    table = PlaceTimeTable(make_catalog(10))
+    assert table.open.dtype == table.close.dtype == table.breaks.dtype
+    assert str(table.open.dtype) == "int16"
+    assert PlaceTimeTable([]).effective_windows(make_user(random.Random(0))) == {}